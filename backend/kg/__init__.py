@@ -1,14 +1,25 @@
 """Red Hat Knowledge Graph - Modern Python infrastructure for knowledge management."""
 
+import importlib
+from types import ModuleType
+
 __version__ = "0.1.0"
 __author__ = "John Sell"
 __email__ = "jsell@redhat.com"
 
-# Re-export main components for easy access
-# Note: CLI components imported on-demand to avoid dependency issues
+# Subpackages are imported on first attribute access (PEP 562) so that
+# `import kg` stays cheap for API workers that never touch the CLI
+_SUBMODULES = frozenset({"api", "cli", "core", "storage", "validation"})
 
 __all__ = [
     "__author__",
     "__email__",
     "__version__",
 ]
+
+
+def __getattr__(name: str) -> ModuleType:
+    """Lazily import subpackages on first access."""
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,16 @@
 """API layer for the knowledge graph."""
 
-from .main import app
+import importlib
+from typing import Any
 
 __all__ = ["app"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the application on first access (PEP 562).
+
+    Keeps ``kg.api.config`` importable by the CLI without loading FastAPI.
+    """
+    if name == "app":
+        return importlib.import_module(".main", __name__).app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,27 @@
+"""Run the Knowledge Graph API with ``python -m kg.api``.
+
+Pins Uvicorn to the uvloop event loop and the httptools HTTP parser (both
+shipped with ``uvicorn[standard]``) so a missing extension fails at startup
+instead of silently falling back to the pure-Python implementations.
+"""
+
+import uvicorn
+
+from .config import config
+
+
+def main() -> None:
+    """Start Uvicorn serving ``kg.api.main:app``."""
+    uvicorn.run(
+        "kg.api.main:app",
+        host=config.host,
+        port=config.port,
+        reload=config.reload,
+        loop="uvloop",
+        http="httptools",
+        interface="asgi3",
+    )
+
+
+if __name__ == "__main__":
+    main()
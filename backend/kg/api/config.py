@@ -4,12 +4,18 @@ This module handles environment-based configuration using Pydantic Settings,
 supporting both config files and environment variables.
 """
 
-from typing import Literal
+from functools import cached_property
+from pathlib import Path
+from typing import Literal, Self
 
-from pydantic import Field, computed_field
+from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings
 
-from ..storage import StorageConfig
+from ..storage import (
+    StorageConfig,
+    StorageConfigurationError,
+    validate_storage_config,
+)
 
 
 class APIConfig(BaseSettings):
@@ -26,6 +32,11 @@ class APIConfig(BaseSettings):
     reload: bool = Field(
         default=False, description="Enable auto-reload for development"
     )
+    threadpool_tokens: int = Field(
+        default=100,
+        ge=1,
+        description="Worker threads available to sync endpoints and dependencies",
+    )
 
     # Logging
     log_level: str = Field(default="INFO", description="Log level")
@@ -33,6 +44,12 @@ class APIConfig(BaseSettings):
     log_requests: bool = Field(
         default=True, description="Enable request logging middleware"
     )
+    probe_log_sample_rate: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of health-probe requests that get request logs",
+    )
 
     # Schema configuration
     schema_dir: str = Field(
@@ -40,9 +57,9 @@ class APIConfig(BaseSettings):
         description="Directory containing entity schema YAML files",
     )
 
-    # CORS settings
-    cors_origins: list[str] = Field(
-        default=["http://localhost:3000", "http://localhost:8080"],
+    # CORS settings (a frozenset so per-request origin checks are hashed lookups)
+    cors_origins: frozenset[str] = Field(
+        default=frozenset({"http://localhost:3000", "http://localhost:8080"}),
         description="Allowed CORS origins",
     )
 
@@ -52,6 +69,7 @@ class APIConfig(BaseSettings):
     storage_timeout_seconds: int = Field(default=30, alias="STORAGE_TIMEOUT_SECONDS")
     storage_max_retries: int = Field(default=3, alias="STORAGE_MAX_RETRIES")
     storage_use_tls: bool = Field(default=False, alias="STORAGE_USE_TLS")
+    storage_pool_size: int = Field(default=4, ge=1, le=32, alias="STORAGE_POOL_SIZE")
 
     class Config:
         """Pydantic configuration."""
@@ -59,19 +77,42 @@ class APIConfig(BaseSettings):
         env_prefix = ""
         case_sensitive = False
 
-    @computed_field  # type: ignore
-    @property
+    @model_validator(mode="after")
+    def _check_storage_config(self) -> Self:
+        """Validate the storage settings once, when the configuration is loaded.
+
+        Misconfiguration then fails at import, before the server binds a port,
+        instead of during application startup. The storage error is re-raised
+        as ValueError so pydantic reports it as a regular ValidationError.
+        """
+        try:
+            validate_storage_config(self.storage)
+        except StorageConfigurationError as e:
+            raise ValueError(str(e)) from e
+        return self
+
+    @cached_property
     def storage(self) -> StorageConfig:
-        """Create storage configuration from individual fields."""
+        """Create storage configuration from individual fields.
+
+        Built once on first access; the flattened storage fields are read from
+        the environment at startup and not changed afterwards.
+        """
         return StorageConfig(
             backend_type=self.storage_backend_type,
             endpoint=self.storage_endpoint,
             timeout_seconds=self.storage_timeout_seconds,
             max_retries=self.storage_max_retries,
             use_tls=self.storage_use_tls,
+            pool_size=self.storage_pool_size,
             retry_delay_seconds=1.0,
         )
 
+    @cached_property
+    def schema_dir_path(self) -> Path:
+        """Absolute schema directory path, resolved once on first access."""
+        return Path(self.schema_dir).resolve()
+
     @property
     def is_development(self) -> bool:
         """Check if running in development mode."""
@@ -0,0 +1,155 @@
+"""Lightweight CORS middleware for the Knowledge Graph API.
+
+The API allows credentials, every method and every header for a fixed set of
+origins (or for any origin, given ``"*"``), so CORS handling reduces to a
+single membership check. This raw ASGI
+middleware precomputes all response headers at startup and skips the general
+purpose machinery of Starlette's ``CORSMiddleware``.
+"""
+
+from collections.abc import Iterable
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Methods advertised in preflight responses (everything Starlette's "*" allows)
+_ALLOWED_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+_PREFLIGHT_MAX_AGE = b"600"
+
+
+class CORSOriginMiddleware:
+    """ASGI middleware that answers CORS requests for a fixed origin set.
+
+    Requests without an ``Origin`` header, and non-HTTP scopes, are passed
+    through untouched. Preflight requests from allowed origins are answered
+    directly with ``204 No Content``; other requests from allowed origins get
+    the credentialed CORS headers added to their response. As with
+    Starlette's ``CORSMiddleware``, ``"*"`` allows every origin and the
+    request's origin is echoed back, since credentialed responses cannot use
+    a wildcard.
+    """
+
+    def __init__(self, app: ASGIApp, allow_origins: Iterable[str]):
+        """Initialize the middleware.
+
+        Args:
+            app: Downstream ASGI application
+            allow_origins: Origins permitted to make cross-origin requests
+        """
+        self.app = app
+        self._origins = frozenset(origin.encode("latin-1") for origin in allow_origins)
+        self._allow_all = b"*" in self._origins
+        self._preflight_headers: list[tuple[bytes, bytes]] = [
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+            (b"access-control-allow-methods", _ALLOWED_METHODS),
+            (b"access-control-max-age", _PREFLIGHT_MAX_AGE),
+            (b"content-length", b"0"),
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Apply CORS handling to an ASGI request."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin: bytes | None = None
+        request_method: bytes | None = None
+        request_headers: bytes | None = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        allowed = self._allow_all or origin in self._origins
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self._preflight_response(send, origin, allowed, request_headers)
+            return
+
+        if not allowed:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = _with_cors_headers(
+                    message.get("headers", ()), origin
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    async def _preflight_response(
+        self,
+        send: Send,
+        origin: bytes,
+        allowed: bool,
+        request_headers: bytes | None,
+    ) -> None:
+        """Answer a CORS preflight request without invoking the application.
+
+        Args:
+            send: ASGI send callable
+            origin: Value of the request's ``Origin`` header
+            allowed: Whether the origin is in the allowed set
+            request_headers: Requested headers to echo back, if any
+        """
+        if not allowed:
+            body = b"Disallowed CORS origin"
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 400,
+                    "headers": [
+                        (b"content-type", b"text/plain; charset=utf-8"),
+                        (b"content-length", str(len(body)).encode("latin-1")),
+                    ],
+                }
+            )
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        headers = [(b"access-control-allow-origin", origin), *self._preflight_headers]
+        if request_headers:
+            headers.append((b"access-control-allow-headers", request_headers))
+
+        await send({"type": "http.response.start", "status": 204, "headers": headers})
+        await send({"type": "http.response.body", "body": b""})
+
+
+def _with_cors_headers(
+    headers: Iterable[tuple[bytes, bytes]], origin: bytes
+) -> list[tuple[bytes, bytes]]:
+    """Add the credentialed CORS headers to a response's header list.
+
+    ``Origin`` is merged into an existing ``Vary`` header rather than sent as
+    a second one.
+
+    Args:
+        headers: Raw response headers from the application
+        origin: Allowed request origin to echo back
+
+    Returns:
+        New header list including the CORS headers
+    """
+    merged: list[tuple[bytes, bytes]] = []
+    has_vary = False
+    for name, value in headers:
+        if name.lower() == b"vary":
+            has_vary = True
+            if b"origin" not in value.lower():
+                merged.append((name, value + b", Origin"))
+                continue
+        merged.append((name, value))
+    if not has_vary:
+        merged.append((b"vary", b"Origin"))
+    merged.append((b"access-control-allow-origin", origin))
+    merged.append((b"access-control-allow-credentials", b"true"))
+    return merged
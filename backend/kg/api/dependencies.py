@@ -23,9 +23,12 @@ def set_storage(storage: StorageInterface) -> None:
     _storage = storage
 
 
-def get_storage() -> StorageInterface:
+async def get_storage() -> StorageInterface:
     """FastAPI dependency to get the current storage backend.
 
+    Declared ``async`` so FastAPI resolves it inline on the event loop;
+    plain ``def`` dependencies are dispatched to the threadpool per request.
+
     Returns:
         StorageInterface: The configured storage backend
 
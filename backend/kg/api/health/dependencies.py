@@ -7,17 +7,27 @@ from fastapi import Depends
 from ..dependencies import StorageDep
 from .service import HealthService
 
+# Shared health service instance, rebuilt only when the storage backend changes
+_health_service: HealthService | None = None
 
-def get_health_service(storage: StorageDep) -> HealthService:
+
+async def get_health_service(storage: StorageDep) -> HealthService:
     """FastAPI dependency to get the health service.
 
+    The service only wraps the storage backend, so a single instance is reused
+    across requests instead of being created for every health probe. Declared
+    ``async`` so resolving it never leaves the event loop.
+
     Args:
         storage: Injected storage dependency
 
     Returns:
         HealthService: Configured health service instance
     """
-    return HealthService(storage)
+    global _health_service  # noqa: PLW0603
+    if _health_service is None or _health_service.storage is not storage:
+        _health_service = HealthService(storage)
+    return _health_service
 
 
 # Type alias for health service dependency injection
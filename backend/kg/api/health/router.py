@@ -4,18 +4,20 @@ This module provides HTTP endpoints for health checking, monitoring,
 and system status reporting.
 """
 
-from typing import Any
-
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 
 from ...storage import HealthCheckResult, HealthStatus, SystemMetrics
 from .dependencies import HealthServiceDep
 
-router = APIRouter()
+# orjson serializes the nested status payloads (including datetimes) natively.
+# Endpoints return ORJSONResponse directly so FastAPI skips response-model
+# validation and jsonable_encoder; response_model only documents the shape.
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 @router.get("/health", response_model=HealthCheckResult)
-async def health_check(health_service: HealthServiceDep) -> HealthCheckResult:
+async def health_check(health_service: HealthServiceDep) -> ORJSONResponse:
     """Health check endpoint for monitoring and Docker health checks.
 
     Returns detailed health information including:
@@ -27,11 +29,10 @@ async def health_check(health_service: HealthServiceDep) -> HealthCheckResult:
     try:
         # Get storage health through service layer
         health = await health_service.get_health()
-        return health
 
     except Exception as e:
         # Return unhealthy status with error details
-        return HealthCheckResult(
+        health = HealthCheckResult(
             status=HealthStatus.ERROR,
             response_time_ms=0.0,
             backend_version=None,
@@ -42,9 +43,11 @@ async def health_check(health_service: HealthServiceDep) -> HealthCheckResult:
             },
         )
 
+    return ORJSONResponse(health.model_dump())
+
 
 @router.get("/metrics", response_model=SystemMetrics)
-async def system_metrics(health_service: HealthServiceDep) -> SystemMetrics:
+async def system_metrics(health_service: HealthServiceDep) -> ORJSONResponse:
     """Get system-wide metrics for monitoring and analytics.
 
     Returns:
@@ -53,15 +56,16 @@ async def system_metrics(health_service: HealthServiceDep) -> SystemMetrics:
     """
     try:
         metrics = await health_service.get_metrics()
-        return metrics
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Failed to retrieve system metrics: {e!s}"
         ) from e
 
+    return ORJSONResponse(metrics.model_dump())
+
 
 @router.get("/status")
-async def detailed_status(health_service: HealthServiceDep) -> dict[str, Any]:
+async def detailed_status(health_service: HealthServiceDep) -> ORJSONResponse:
     """Detailed status endpoint for debugging and development.
 
     Provides comprehensive information about:
@@ -72,8 +76,9 @@ async def detailed_status(health_service: HealthServiceDep) -> dict[str, Any]:
     """
     try:
         status = await health_service.get_detailed_status()
-        return status
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Failed to retrieve detailed status: {e!r}"
         ) from e
+
+    return ORJSONResponse(status)
@@ -4,92 +4,147 @@ This module creates and configures the FastAPI application with proper
 dependency injection, middleware, and router registration using structured logging.
 """
 
-from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
-
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-
-from ..core import StructlogMiddleware, configure_logging, get_logger
-from ..storage import StorageInterface, create_storage, validate_storage_config
+import anyio.to_thread
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import ORJSONResponse
+import orjson
+
+from ..core import (
+    StructlogMiddleware,
+    configure_logging,
+    get_logger,
+    get_model_factory,
+    shutdown_logging,
+)
+from ..storage import StorageInterface, create_storage
 from .config import config
+from .cors import CORSOriginMiddleware
 from .dependencies import set_storage
 from .health.router import router as health_router
 
-# Configure structured logging
-configure_logging(
-    environment=config.environment,
-    log_level=config.log_level,
-    json_logs=config.json_logs or config.is_production,
-)
-
 logger = get_logger(__name__)
 
+# The root payload never changes, so it is encoded once at import time
+_ROOT_BYTES = orjson.dumps(
+    {
+        "name": "Red Hat Knowledge Graph API",
+        "version": "0.1.0",
+        "status": "running",
+        **({} if config.is_production else {"docs": "/docs", "redoc": "/redoc"}),
+        "health": "/health",
+    }
+)
 
-@asynccontextmanager
-async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
-    """Manage application lifespan - startup and shutdown."""
-    # Startup: Initialize storage
-    try:
-        logger.info(
-            "Starting Knowledge Graph API...",
-            environment=config.environment,
-            log_level=config.log_level,
-        )
 
-        # Validate storage configuration
-        validate_storage_config(config.storage)
-        logger.info(
-            "Storage configuration validated",
-            backend_type=config.storage.backend_type,
-            endpoint=config.storage.endpoint,
-        )
+def _openapi_bytes(app: FastAPI) -> bytes:
+    """Return the app's OpenAPI schema as JSON, encoding it only once.
 
-        # Create and initialize storage backend
-        storage: StorageInterface | None = create_storage(config.storage)
+    Args:
+        app: Application whose schema to serialize
 
-        if storage is None:
-            logger.critical("Failed to create storage.")
-            raise RuntimeError("Failed to create storage.")
+    Returns:
+        The encoded schema, cached on ``app.state``
+    """
+    schema_bytes: bytes | None = getattr(app.state, "openapi_bytes", None)
+    if schema_bytes is None:
+        schema_bytes = orjson.dumps(app.openapi())
+        app.state.openapi_bytes = schema_bytes
+    return schema_bytes
 
-        await storage.connect()
 
-        # Set storage for dependency injection
-        set_storage(storage)
+class Lifespan:
+    """Manage application lifespan - startup and shutdown.
 
-        # Load schemas if available
-        try:
-            await storage.load_schemas(config.schema_dir)
-            logger.info("Schemas loaded successfully", schema_dir=config.schema_dir)
-        except Exception as e:
-            logger.warning(
-                "Could not load schemas", schema_dir=config.schema_dir, error=str(e)
-            )
+    Used as FastAPI's ``lifespan`` factory: the app is passed to the
+    constructor and the instance is entered as an async context manager. The
+    storage backend is held as an explicit attribute and dropped on exit.
+    """
+
+    def __init__(self, app: FastAPI):
+        """Create the lifespan context for an application instance."""
+        self.app = app
+        self.storage: StorageInterface | None = None
 
-        logger.info(
-            "Knowledge Graph API started successfully",
-            storage_backend=config.storage.backend_type,
+    async def __aenter__(self) -> None:
+        """Configure logging, connect storage and load schemas."""
+        # Configure structured logging once per worker process, after any fork
+        configure_logging(
             environment=config.environment,
+            log_level=config.log_level,
+            json_logs=config.json_logs or config.is_production,
         )
 
-    except Exception as e:
-        logger.error("Failed to initialize storage", error=str(e))
-        raise
+        # Size the threadpool used for sync endpoints/dependencies (anyio default: 40)
+        anyio.to_thread.current_default_thread_limiter().total_tokens = (
+            config.threadpool_tokens
+        )
 
-    yield
+        # Startup: Initialize storage
+        try:
+            logger.info(
+                "Starting Knowledge Graph API...",
+                environment=config.environment,
+                log_level=config.log_level,
+            )
 
-    # Shutdown: Clean up storage
-    try:
-        logger.info("Shutting down Knowledge Graph API...")
-        # Get storage from dependency injection
-        from .dependencies import get_storage_unsafe
+            # Create and initialize storage backend
+            storage: StorageInterface | None = create_storage(config.storage)
+
+            if storage is None:
+                logger.critical("Failed to create storage.")
+                raise RuntimeError("Failed to create storage.")
+
+            await storage.connect()
+            self.storage = storage
+
+            # Set storage for dependency injection
+            set_storage(storage)
+
+            # Load schemas if available
+            schema_dir = str(config.schema_dir_path)
+            try:
+                schemas = await storage.load_schemas(schema_dir)
+                logger.info("Schemas loaded successfully", schema_dir=schema_dir)
+
+                # Build the validation models now so requests never pay that cost
+                get_model_factory().create_root_model(schemas)
+                logger.info("Validation models built", entity_count=len(schemas))
+            except Exception as e:
+                logger.warning(
+                    "Could not load schemas", schema_dir=schema_dir, error=str(e)
+                )
+
+            # Encode the OpenAPI schema before the first docs request
+            if self.app.openapi_url:
+                _openapi_bytes(self.app)
+
+            logger.info(
+                "Knowledge Graph API started successfully",
+                storage_backend=config.storage.backend_type,
+                environment=config.environment,
+            )
+
+        except Exception as e:
+            logger.error("Failed to initialize storage", error=str(e))
+            # __aexit__ does not run when startup fails; flush logs here
+            shutdown_logging()
+            raise
+
+    async def __aexit__(self, *_exc_info: object) -> None:
+        """Disconnect storage and flush logs."""
+        # Shutdown: Clean up storage
+        try:
+            logger.info("Shutting down Knowledge Graph API...")
+            if self.storage:
+                await self.storage.disconnect()
+                logger.info("Storage disconnected cleanly")
+        except Exception as e:
+            logger.warning("Error during storage cleanup", error=str(e))
+        finally:
+            self.storage = None
 
-        storage = get_storage_unsafe()
-        if storage:
-            await storage.disconnect()
-            logger.info("Storage disconnected cleanly")
-    except Exception as e:
-        logger.warning("Error during storage cleanup", error=str(e))
+        # Flush any queued log records before the worker exits
+        shutdown_logging()
 
 
 def create_app() -> FastAPI:
@@ -110,28 +165,42 @@ def create_app() -> FastAPI:
         - Production: Optimized performance, clustering
         """,
         version="0.1.0",
-        lifespan=lifespan,
-        docs_url="/docs",
-        redoc_url="/redoc",
+        lifespan=Lifespan,
+        default_response_class=ORJSONResponse,
+        # Interactive docs (and the OpenAPI schema behind them) are dev-only
+        docs_url=None if config.is_production else "/docs",
+        redoc_url=None if config.is_production else "/redoc",
+        openapi_url=None if config.is_production else "/openapi.json",
     )
 
     # Add structured logging middleware for request tracing
     if config.log_requests:
-        app.add_middleware(StructlogMiddleware)
+        app.add_middleware(
+            StructlogMiddleware,
+            probe_sample_rate=config.probe_log_sample_rate,
+        )
 
     # Add CORS middleware for development
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=config.cors_origins,
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
+    app.add_middleware(CORSOriginMiddleware, allow_origins=config.cors_origins)
 
     # Register routers
     app.include_router(health_router, tags=["health"])
     # Future routers will be added here as they are implemented
 
+    # Replace FastAPI's OpenAPI route, which re-encodes the schema dict on
+    # every request, with one serving the pre-encoded bytes
+    if app.openapi_url:
+        openapi_url = app.openapi_url
+        app.router.routes[:] = [
+            route
+            for route in app.router.routes
+            if getattr(route, "path", None) != openapi_url
+        ]
+
+        @app.get(openapi_url, include_in_schema=False)
+        async def openapi_json(request: Request) -> Response:
+            return Response(_openapi_bytes(request.app), media_type="application/json")
+
     return app
 
 
@@ -139,14 +208,7 @@ def create_app() -> FastAPI:
 app = create_app()
 
 
-@app.get("/")
-async def root() -> dict[str, str]:
+@app.get("/", response_class=Response)
+async def root() -> Response:
     """Root endpoint with API information."""
-    return {
-        "name": "Red Hat Knowledge Graph API",
-        "version": "0.1.0",
-        "status": "running",
-        "docs": "/docs",
-        "redoc": "/redoc",
-        "health": "/health",
-    }
+    return Response(_ROOT_BYTES, media_type="application/json")
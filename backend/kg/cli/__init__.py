@@ -1,23 +1,63 @@
 """Command-line interface for the knowledge graph."""
 
+import importlib
+
 import rich_click as click
 
-from .apply import apply_command
-from .schema import schema_command
-from .validate import validate_command
+# Subcommand name -> (submodule, attribute); modules are imported on dispatch
+_LAZY_COMMANDS: dict[str, tuple[str, str]] = {
+    "apply": ("apply", "apply_command"),
+    "schema": ("schema", "schema_command"),
+    "validate": ("validate", "validate_command"),
+}
+
+# Rich-click styling, built once and attached to the root group (subcommands
+# inherit it through the click context) instead of patching module globals
+_HELP_CONFIG = click.RichHelpConfiguration(
+    text_markup="rich",
+    show_arguments=True,
+    group_arguments_options=True,
+    style_errors_suggestion="magenta italic",
+    style_option="bold cyan",
+    style_argument="bold yellow",
+    style_command="bold green",
+    style_switch="bold blue",
+)
+
+
+class LazyGroup(click.RichGroup):
+    """Command group that imports each subcommand's module only when used.
+
+    A single ``kg <command>`` invocation then skips importing the validation,
+    storage and schema stacks of the other commands.
+    """
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """Return the subcommand names without importing them."""
+        return sorted({*super().list_commands(ctx), *_LAZY_COMMANDS})
+
+    def get_command(  # type: ignore[override]
+        self, ctx: click.RichContext, cmd_name: str
+    ) -> click.Command | None:
+        """Import and register the named subcommand on first use."""
+        if cmd_name not in self.commands and cmd_name in _LAZY_COMMANDS:
+            module_name, attr_name = _LAZY_COMMANDS[cmd_name]
+            module = importlib.import_module(f"{__name__}.{module_name}")
+            self.add_command(getattr(module, attr_name), cmd_name)
+        return super().get_command(ctx, cmd_name)
 
-# Configure rich-click styling
-click.rich_click.TEXT_MARKUP = "rich"
-click.rich_click.SHOW_ARGUMENTS = True
-click.rich_click.GROUP_ARGUMENTS_OPTIONS = True
-click.rich_click.STYLE_ERRORS_SUGGESTION = "magenta italic"
-click.rich_click.STYLE_OPTION = "bold cyan"
-click.rich_click.STYLE_ARGUMENT = "bold yellow"
-click.rich_click.STYLE_COMMAND = "bold green"
-click.rich_click.STYLE_SWITCH = "bold blue"
+    def format_help(  # type: ignore[override]
+        self, ctx: click.RichContext, formatter: click.RichHelpFormatter
+    ) -> None:
+        """Render help, loading every subcommand for the commands panel."""
+        # rich-click builds the commands panel from self.commands directly
+        for cmd_name in _LAZY_COMMANDS:
+            self.get_command(ctx, cmd_name)
+        super().format_help(ctx, formatter)
 
 
-@click.group(name="kg")
+@click.group(name="kg", cls=LazyGroup)
+@click.rich_config(help_config=_HELP_CONFIG)
 @click.version_option(version="0.1.0", prog_name="kg")
 def main() -> None:
     """🧠 **Red Hat Knowledge Graph** - Modern infrastructure for knowledge management.
@@ -28,12 +68,6 @@ def main() -> None:
     pass
 
 
-# Add commands to the group
-main.add_command(apply_command)
-main.add_command(schema_command)
-main.add_command(validate_command)
-
-
 if __name__ == "__main__":
     main()
 
@@ -7,47 +7,62 @@ storage operations, dry-run functionality, and comprehensive error handling.
 
 import asyncio
 import contextlib
-import json
+from functools import lru_cache
 from pathlib import Path
 import sys
 import time
-import traceback
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from rich.console import Console
-from rich.table import Table
+import orjson
 import rich_click as click
-import yaml
 
-from ..api.config import config
-from ..core import FileSchemaLoader
-from ..storage import (
-    DryRunResult,
-    create_storage,
-)
-from ..validation import KnowledgeGraphValidator
+# Rich rendering, YAML parsing, storage and validation are imported where they
+# are used so that `kg apply --help`, machine-readable output formats and early
+# error exits do not pay for them
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from ..storage import DryRunResult, StorageInterface
+
+# Unit conversions for _format_time_duration
+_MS_PER_SECOND = 1000
+_SECONDS_PER_MINUTE = 60
+
+# Fields of DryRunResult reported by --format json; dumped in one
+# pydantic-core pass rather than rebuilt per operation in Python
+_DRY_RUN_JSON_FIELDS: dict[str, Any] = {
+    "would_create": {"__all__": {"entity_type", "entity_id", "changes"}},
+    "would_update": {"__all__": {"entity_type", "entity_id", "changes"}},
+    "would_delete": {"__all__": {"entity_type", "entity_id"}},
+    "validation_issues": True,
+    "summary": True,
+}
 
-# Create console for rich formatting
-console = Console()
+
+@lru_cache(maxsize=1)
+def _get_console() -> "Console":
+    """Create the console used for rich formatting on first use."""
+    from rich.console import Console  # noqa: PLC0415
+
+    return Console()
 
 
 def _should_use_rich_formatting(force_colors: bool = False) -> bool:
     """Determine if we should use rich formatting based on environment."""
-    return force_colors or console.is_terminal
+    return force_colors or _get_console().is_terminal
 
 
-def _format_time_duration(seconds: float) -> str:
-    """Format duration in human-readable format."""
-    SECONDS_PER_MINUTE = 60
+def _format_time_duration(milliseconds: float) -> str:
+    """Format a duration given in milliseconds in human-readable format."""
+    if milliseconds < _MS_PER_SECOND:
+        return f"{milliseconds:.0f}ms"
 
-    if seconds < 1:
-        return f"{seconds * 1000:.0f}ms"
-    elif seconds < SECONDS_PER_MINUTE:
+    seconds = milliseconds / _MS_PER_SECOND
+    if seconds < _SECONDS_PER_MINUTE:
         return f"{seconds:.1f}s"
-    else:
-        minutes = int(seconds // SECONDS_PER_MINUTE)
-        remaining_seconds = seconds % SECONDS_PER_MINUTE
-        return f"{minutes}m {remaining_seconds:.1f}s"
+
+    minutes, remaining_seconds = divmod(seconds, _SECONDS_PER_MINUTE)
+    return f"{minutes:.0f}m {remaining_seconds:.1f}s"
 
 
 def _extract_entities_from_yaml(parsed_data: dict[str, Any]) -> list[dict[str, Any]]:
@@ -73,23 +88,23 @@ def _extract_entities_from_yaml(parsed_data: dict[str, Any]) -> list[dict[str, A
                                 else entity_name
                             )
 
-                            # Separate metadata from relationships
-                            metadata = {}
-                            relationships = {}
-
-                            for key, value in entity_data.items():
-                                if key == "relationships":
-                                    # Handle nested relationships structure
-                                    if isinstance(value, dict):
-                                        relationships.update(value)
-                                else:
-                                    # Regular metadata field
-                                    metadata[key] = value
-
-                            # For backward compatibility, also flatten relationship data
+                            # Separate metadata from relationships. For backward
+                            # compatibility relationship data is also flattened
                             # into metadata so existing dependency processing works
-                            if relationships:
-                                metadata.update(relationships)
+                            relationships = entity_data.get("relationships")
+                            if not isinstance(relationships, dict):
+                                relationships = {}
+
+                            if "relationships" in entity_data:
+                                metadata = {
+                                    key: value
+                                    for key, value in entity_data.items()
+                                    if key != "relationships"
+                                }
+                                if relationships:
+                                    metadata = {**metadata, **relationships}
+                            else:
+                                metadata = dict(entity_data)
 
                             entities.append(
                                 {
@@ -108,7 +123,7 @@ def _extract_entities_from_yaml(parsed_data: dict[str, Any]) -> list[dict[str, A
 
 
 def _output_dry_run_table_format(  # noqa: PLR0912, PLR0915
-    dry_run_result: DryRunResult,
+    dry_run_result: "DryRunResult",
     file_path: str,
     verbose: bool,
     validation_time_ms: float,
@@ -116,6 +131,9 @@ def _output_dry_run_table_format(  # noqa: PLR0912, PLR0915
 ) -> None:
     """Output dry-run results in table format."""
     if _should_use_rich_formatting(force_colors):
+        from rich.table import Table  # noqa: PLC0415
+
+        console = _get_console()
         console.print("🔍 [bold blue]Dry-run results[/bold blue]")
         console.print()
 
@@ -135,65 +153,57 @@ def _output_dry_run_table_format(  # noqa: PLR0912, PLR0915
         console.print(info_table)
         console.print()
 
+        # Render the per-operation listing as one block; printing each line
+        # separately makes Rich re-measure and re-render for every operation
+        lines: list[str] = []
+
         # Operations summary
         if dry_run_result.would_create:
-            console.print("[bold green]Would create:[/bold green]")
-            for op in dry_run_result.would_create:
-                console.print(
-                    f"  📁 [green]{op.entity_type}[/green]: [cyan]{op.entity_id}[/cyan]"
-                )
-            console.print()
+            lines.append("[bold green]Would create:[/bold green]")
+            lines.extend(
+                f"  📁 [green]{op.entity_type}[/green]: [cyan]{op.entity_id}[/cyan]"
+                for op in dry_run_result.would_create
+            )
+            lines.append("")
 
         if dry_run_result.would_update:
-            console.print("[bold yellow]Would update:[/bold yellow]")
+            lines.append("[bold yellow]Would update:[/bold yellow]")
             for op in dry_run_result.would_update:
-                console.print(
+                lines.append(
                     f"  📝 [yellow]{op.entity_type}[/yellow]: "
                     f"[cyan]{op.entity_id}[/cyan]"
                 )
                 if verbose and op.changes:
-                    for field, value in op.changes.items():
-                        console.print(
-                            f"     - [dim]{field}[/dim]: [green]{value}[/green]"
-                        )
-            console.print()
+                    lines.extend(
+                        f"     - [dim]{field}[/dim]: [green]{value}[/green]"
+                        for field, value in op.changes.items()
+                    )
+            lines.append("")
 
         if dry_run_result.would_delete:
-            console.print("[bold red]Would delete:[/bold red]")
-            for op in dry_run_result.would_delete:
-                console.print(
-                    f"  🗑️ [red]{op.entity_type}[/red]: [cyan]{op.entity_id}[/cyan]"
-                )
-            console.print()
+            lines.append("[bold red]Would delete:[/bold red]")
+            lines.extend(
+                f"  🗑️ [red]{op.entity_type}[/red]: [cyan]{op.entity_id}[/cyan]"
+                for op in dry_run_result.would_delete
+            )
+            lines.append("")
 
         # Validation issues
-        if dry_run_result.validation_issues:
-            errors = [
-                issue
-                for issue in dry_run_result.validation_issues
-                if issue.severity == "error"
-            ]
-            warnings = [
-                issue
-                for issue in dry_run_result.validation_issues
-                if issue.severity == "warning"
-            ]
-
-            if errors:
-                console.print("[bold red]Errors found:[/bold red]")
-                for issue in errors:
-                    console.print(f"  ❌ [red]{issue.message}[/red]")
-                    if issue.suggestion:
-                        console.print(f"     💡 [italic]{issue.suggestion}[/italic]")
-                console.print()
-
-            if warnings:
-                console.print("[bold yellow]Warnings:[/bold yellow]")
-                for issue in warnings:
-                    console.print(f"  ⚠️ [yellow]{issue.message}[/yellow]")
-                    if issue.suggestion:
-                        console.print(f"     💡 [italic]{issue.suggestion}[/italic]")
-                console.print()
+        if dry_run_result.errors:
+            lines.append("[bold red]Errors found:[/bold red]")
+            for issue in dry_run_result.errors:
+                lines.append(f"  ❌ [red]{issue.message}[/red]")
+                if issue.suggestion:
+                    lines.append(f"     💡 [italic]{issue.suggestion}[/italic]")
+            lines.append("")
+
+        if dry_run_result.warnings:
+            lines.append("[bold yellow]Warnings:[/bold yellow]")
+            for issue in dry_run_result.warnings:
+                lines.append(f"  ⚠️ [yellow]{issue.message}[/yellow]")
+                if issue.suggestion:
+                    lines.append(f"     💡 [italic]{issue.suggestion}[/italic]")
+            lines.append("")
 
         # Summary
         summary = dry_run_result.summary
@@ -201,47 +211,59 @@ def _output_dry_run_table_format(  # noqa: PLR0912, PLR0915
         update_count = summary.get("update_count", 0)
         delete_count = summary.get("delete_count", 0)
 
-        console.print(
+        lines.append(
             f"[bold]Summary:[/bold] {create_count} create, "
             f"{update_count} update, {delete_count} delete"
         )
+        console.print("\n".join(lines))
 
     else:
         # Plain text output for CI/non-interactive
-        click.echo("🔍 Dry-run results")
-        click.echo()
-        click.echo(f"File: {file_path}")
-        click.echo("Mode: Dry-run (no changes made)")
-        click.echo()
+        lines = [
+            "🔍 Dry-run results",
+            "",
+            f"File: {file_path}",
+            "Mode: Dry-run (no changes made)",
+            "",
+        ]
 
         if dry_run_result.would_create:
-            click.echo("Would create:")
-            for op in dry_run_result.would_create:
-                click.echo(f"  📁 {op.entity_type}: {op.entity_id}")
+            lines.append("Would create:")
+            lines.extend(
+                f"  📁 {op.entity_type}: {op.entity_id}"
+                for op in dry_run_result.would_create
+            )
 
         if dry_run_result.would_update:
-            click.echo("Would update:")
-            for op in dry_run_result.would_update:
-                click.echo(f"  📝 {op.entity_type}: {op.entity_id}")
+            lines.append("Would update:")
+            lines.extend(
+                f"  📝 {op.entity_type}: {op.entity_id}"
+                for op in dry_run_result.would_update
+            )
 
         if dry_run_result.would_delete:
-            click.echo("Would delete:")
-            for op in dry_run_result.would_delete:
-                click.echo(f"  🗑️ {op.entity_type}: {op.entity_id}")
+            lines.append("Would delete:")
+            lines.extend(
+                f"  🗑️ {op.entity_type}: {op.entity_id}"
+                for op in dry_run_result.would_delete
+            )
 
         if dry_run_result.validation_issues:
-            click.echo("Issues:")
-            for issue in dry_run_result.validation_issues:
-                click.echo(f"  {issue.severity.upper()}: {issue.message}")
+            lines.append("Issues:")
+            lines.extend(
+                f"  {issue.severity.upper()}: {issue.message}"
+                for issue in dry_run_result.validation_issues
+            )
 
         summary = dry_run_result.summary
         create_count = summary.get("create_count", 0)
         update_count = summary.get("update_count", 0)
         delete_count = summary.get("delete_count", 0)
-        click.echo(
+        lines.append(
             f"Summary: {create_count} create, {update_count} update, "
             f"{delete_count} delete"
         )
+        click.echo("\n".join(lines))
 
 
 def _output_apply_success_table_format(
@@ -258,6 +280,9 @@ def _output_apply_success_table_format(
     total_time_ms = validation_time_ms + storage_time_ms
 
     if _should_use_rich_formatting(force_colors):
+        from rich.table import Table  # noqa: PLC0415
+
+        console = _get_console()
         console.print("✅ [bold green]Apply successful[/bold green]")
         console.print()
 
@@ -281,7 +306,7 @@ def _output_apply_success_table_format(
             )
             info_table.add_row(
                 "[bold]Total time:[/bold]",
-                f"[dim]{_format_time_duration(total_time_ms / 1000)}[/dim]",
+                f"[dim]{_format_time_duration(total_time_ms)}[/dim]",
             )
 
         console.print(info_table)
@@ -308,12 +333,12 @@ def _output_apply_success_table_format(
         )
 
         if verbose:
-            click.echo(f"Time: {_format_time_duration(total_time_ms / 1000)}")
+            click.echo(f"Time: {_format_time_duration(total_time_ms)}")
 
 
 def _output_json_format(result_data: dict[str, Any]) -> None:
     """Output results in JSON format."""
-    click.echo(json.dumps(result_data, indent=2))
+    click.echo(orjson.dumps(result_data, option=orjson.OPT_INDENT_2).decode())
 
 
 def _output_compact_format(status: str, file_path: str, **kwargs: Any) -> None:
@@ -327,7 +352,7 @@ def _output_compact_format(status: str, file_path: str, **kwargs: Any) -> None:
         click.echo(
             f"✅ {file_path}: APPLIED (entities={entities_applied}, "
             f"created={entities_created}, updated={entities_updated}, "
-            f"time={_format_time_duration(total_time_ms / 1000)})"
+            f"time={_format_time_duration(total_time_ms)})"
         )
 
     elif status == "dry_run":
@@ -358,6 +383,7 @@ async def _apply_implementation(  # noqa: PLR0912, PLR0915
     """Implementation of the apply command."""
     file_path = Path(file)
     start_time = time.time()
+    storage: StorageInterface | None = None
 
     try:
         # Check if file exists
@@ -377,38 +403,47 @@ async def _apply_implementation(  # noqa: PLR0912, PLR0915
                     click.echo(f"Checked path: {file_path.absolute()}")
             sys.exit(2)
 
-        # Read file content
+        import yaml  # noqa: PLC0415
+
+        from ..core import FileSchemaLoader  # noqa: PLC0415
+        from ..storage import create_storage  # noqa: PLC0415
+        from ..validation import KnowledgeGraphValidator  # noqa: PLC0415
+
+        # Prefer the libyaml-backed loader; fall back to pure Python
+        yaml_loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+        # Read and parse the file in one pass, letting libyaml consume the
+        # raw bytes without an intermediate decoded string
         try:
-            content = file_path.read_text(encoding="utf-8")
-        except Exception as e:
+            with file_path.open("rb") as fh:
+                parsed_data = yaml.load(fh, Loader=yaml_loader)
+        except OSError as e:
+            message = f"Cannot read file: {e}"
             error_data = {
                 "status": "error",
                 "error_type": "file_read_error",
-                "message": f"Cannot read file: {e}",
+                "message": message,
                 "file": str(file_path),
             }
 
             if format == "json":
                 _output_json_format(error_data)
             else:
-                click.echo(f"❌ Cannot read file: {e}")
+                click.echo(f"❌ {message}")
             sys.exit(2)
-
-        # Parse YAML for entity extraction
-        try:
-            parsed_data = yaml.safe_load(content)
         except yaml.YAMLError as e:
+            message = f"Invalid YAML: {e}"
             error_data = {
                 "status": "error",
                 "error_type": "yaml_parse_error",
-                "message": f"Invalid YAML: {e}",
+                "message": message,
                 "file": str(file_path),
             }
 
             if format == "json":
                 _output_json_format(error_data)
             else:
-                click.echo(f"❌ Invalid YAML: {e}")
+                click.echo(f"❌ {message}")
             sys.exit(1)
 
         # Load schemas
@@ -420,19 +455,20 @@ async def _apply_implementation(  # noqa: PLR0912, PLR0915
                 raise FileNotFoundError(f"Schema directory not found: {schema_dir}")
 
             schema_loader = FileSchemaLoader(str(schema_dir))
-            schemas = await schema_loader.load_schemas()
+            schemas = await schema_loader.load_schemas_cached()
         except Exception as e:
+            message = f"Cannot load schemas: {e}"
             error_data = {
                 "status": "error",
                 "error_type": "schema_load_error",
-                "message": f"Cannot load schemas: {e}",
+                "message": message,
                 "file": str(file_path),
             }
 
             if format == "json":
                 _output_json_format(error_data)
             else:
-                click.echo(f"❌ Cannot load schemas: {e}")
+                click.echo(f"❌ {message}")
             sys.exit(4)
 
         # Create and connect to storage (local or remote)
@@ -441,7 +477,10 @@ async def _apply_implementation(  # noqa: PLR0912, PLR0915
                 # TODO: Implement remote server mode
                 raise NotImplementedError("Remote server mode not yet implemented")
             else:
-                # Local storage mode
+                # Local storage mode. The settings are validated when loaded,
+                # so a storage misconfiguration surfaces here as well.
+                from ..api.config import config  # noqa: PLC0415
+
                 storage = create_storage(config.storage)
                 if storage is None:
                     raise RuntimeError("Failed to create storage backend")
@@ -453,17 +492,18 @@ async def _apply_implementation(  # noqa: PLR0912, PLR0915
                     await storage.load_schemas(str(schema_dir))
 
         except Exception as e:
+            message = f"Storage connection failed: {e}"
             error_data = {
                 "status": "error",
                 "error_type": "storage_connection_error",
-                "message": f"Storage connection failed: {e}",
+                "message": message,
                 "file": str(file_path),
             }
 
             if format == "json":
                 _output_json_format(error_data)
             else:
-                click.echo(f"❌ Storage connection failed: {e}")
+                click.echo(f"❌ {message}")
                 if verbose:
                     click.echo("Suggestions:")
                     click.echo("  • Check if storage backend is running")
@@ -475,7 +515,7 @@ async def _apply_implementation(  # noqa: PLR0912, PLR0915
         try:
             # Create validator with storage for reference validation (Layer 5)
             validator = KnowledgeGraphValidator(schemas, storage=storage)
-            validation_result = await validator.validate(content)
+            validation_result = await validator.validate_parsed(parsed_data)
 
             if not validation_result.is_valid:
                 validation_time_ms = (time.time() - validation_start) * 1000
@@ -537,17 +577,18 @@ async def _apply_implementation(  # noqa: PLR0912, PLR0915
                 sys.exit(1)
 
         except Exception as e:
+            message = f"Validation failed: {e}"
             error_data = {
                 "status": "error",
                 "error_type": "validation_error",
-                "message": f"Validation failed: {e}",
+                "message": message,
                 "file": str(file_path),
             }
 
             if format == "json":
                 _output_json_format(error_data)
             else:
-                click.echo(f"❌ Validation failed: {e}")
+                click.echo(f"❌ {message}")
             sys.exit(4)
 
         validation_time_ms = (time.time() - validation_start) * 1000
@@ -564,40 +605,7 @@ async def _apply_implementation(  # noqa: PLR0912, PLR0915
                     result_data = {
                         "status": "dry_run",
                         "file": str(file_path),
-                        "would_create": [
-                            {
-                                "entity_type": op.entity_type,
-                                "entity_id": op.entity_id,
-                                "changes": op.changes,
-                            }
-                            for op in dry_run_result.would_create
-                        ],
-                        "would_update": [
-                            {
-                                "entity_type": op.entity_type,
-                                "entity_id": op.entity_id,
-                                "changes": op.changes,
-                            }
-                            for op in dry_run_result.would_update
-                        ],
-                        "would_delete": [
-                            {
-                                "entity_type": op.entity_type,
-                                "entity_id": op.entity_id,
-                            }
-                            for op in dry_run_result.would_delete
-                        ],
-                        "validation_issues": [
-                            {
-                                "severity": issue.severity,
-                                "entity_type": issue.entity_type,
-                                "entity_id": issue.entity_id,
-                                "message": issue.message,
-                                "suggestion": issue.suggestion,
-                            }
-                            for issue in dry_run_result.validation_issues
-                        ],
-                        "summary": dry_run_result.summary,
+                        **dry_run_result.model_dump(include=_DRY_RUN_JSON_FIELDS),
                         "validation_time_ms": round(validation_time_ms, 1),
                     }
                     _output_json_format(result_data)
@@ -627,44 +635,28 @@ async def _apply_implementation(  # noqa: PLR0912, PLR0915
                     sys.exit(0)
 
             except Exception as e:
+                message = f"Dry-run simulation failed: {e}"
                 error_data = {
                     "status": "error",
                     "error_type": "dry_run_error",
-                    "message": f"Dry-run simulation failed: {e}",
+                    "message": message,
                     "file": str(file_path),
                 }
 
                 if format == "json":
                     _output_json_format(error_data)
                 else:
-                    click.echo(f"❌ Dry-run simulation failed: {e}")
+                    click.echo(f"❌ {message}")
                 sys.exit(3)
 
         else:
             # Actual apply mode: store entities
             storage_start = time.time()
-            entities_created = 0
-            entities_updated = 0
 
             try:
-                for entity in entities:
-                    entity_type = entity["entity_type"]
-                    entity_id = entity["entity_id"]
-                    metadata = entity["metadata"]
-                    system_metadata = entity["system_metadata"]
-
-                    # Check if entity exists to determine create vs update
-                    existing_entity = await storage.get_entity(entity_type, entity_id)
-
-                    # Store entity
-                    await storage.store_entity(
-                        entity_type, entity_id, metadata, system_metadata
-                    )
-
-                    if existing_entity:
-                        entities_updated += 1
-                    else:
-                        entities_created += 1
+                apply_result = await storage.bulk_apply(entities)
+                entities_created = apply_result.created_count
+                entities_updated = apply_result.updated_count
 
                 storage_time_ms = (time.time() - storage_start) * 1000
                 entities_applied = entities_created + entities_updated
@@ -685,13 +677,11 @@ async def _apply_implementation(  # noqa: PLR0912, PLR0915
                         },
                         "operations": [
                             {
-                                "entity_type": entity["entity_type"],
-                                "entity_id": entity["entity_id"],
-                                "operation": "created"
-                                if i < entities_created
-                                else "updated",
+                                "entity_type": op.entity_type,
+                                "entity_id": op.entity_id,
+                                "operation": f"{op.operation_type}d",
                             }
-                            for i, entity in enumerate(entities)
+                            for op in apply_result.operations
                         ],
                     }
                     _output_json_format(result_data)
@@ -721,17 +711,18 @@ async def _apply_implementation(  # noqa: PLR0912, PLR0915
                 sys.exit(0)
 
             except Exception as e:
+                message = f"Storage operation failed: {e}"
                 error_data = {
                     "status": "error",
                     "error_type": "storage_operation_error",
-                    "message": f"Storage operation failed: {e}",
+                    "message": message,
                     "file": str(file_path),
                 }
 
                 if format == "json":
                     _output_json_format(error_data)
                 else:
-                    click.echo(f"❌ Storage operation failed: {e}")
+                    click.echo(f"❌ {message}")
                 sys.exit(3)
 
     except KeyboardInterrupt:
@@ -749,22 +740,32 @@ async def _apply_implementation(  # noqa: PLR0912, PLR0915
         sys.exit(4)
 
     except Exception as e:
+        message = f"Internal error: {e}"
         error_data = {
             "status": "error",
             "error_type": "internal_error",
-            "message": f"Internal error: {e}",
+            "message": message,
             "file": str(file_path) if "file_path" in locals() else file,
         }
 
         if format == "json":
             _output_json_format(error_data)
         else:
-            click.echo(f"❌ Internal error: {e}")
+            click.echo(f"❌ {message}")
             if verbose:
+                import traceback  # noqa: PLC0415
+
                 click.echo("\nFull traceback:")
                 click.echo(traceback.format_exc())
         sys.exit(4)
 
+    finally:
+        # Validation (Layer 5) and the apply phase share this one connection;
+        # release it however the command exits
+        if storage is not None:
+            with contextlib.suppress(Exception):
+                await storage.disconnect()
+
 
 @click.command("apply")
 @click.argument(
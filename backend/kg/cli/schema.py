@@ -4,18 +4,35 @@ This module implements the `kg schema` command group for schema operations,
 including JSON Schema export for VSCode autocomplete integration.
 """
 
-import asyncio
-import json
+from collections.abc import Callable
+from functools import lru_cache
+import hashlib
 from pathlib import Path
 import sys
+from typing import TYPE_CHECKING
 
-from rich.console import Console
+import orjson
 import rich_click as click
 
-from ..core.json_schema_generator import JSONSchemaExporter
+# Rich rendering and the schema machinery (YAML, pydantic models) are imported
+# where they are used so that `kg schema --help` does not pay for them
+if TYPE_CHECKING:
+    from rich.console import Console
 
-# Create console for rich formatting
-console = Console()
+    from ..core.json_schema_generator import JSONSchemaExporter
+
+# Suffix of the sidecar file recording which inputs produced an export
+_CACHE_KEY_SUFFIX = ".key"
+
+# Byte sizes used when reporting the exported file size
+_KB = 1 << 10
+_MB = 1 << 20
+
+# Files the exported schema is associated with in VSCode's yaml.schemas
+_VSCODE_SCHEMA_GLOBS = [
+    "**/knowledge-graph.yaml",
+    "tmp/**/knowledge-graph.yaml",
+]
 
 
 @click.group(name="schema")
@@ -51,8 +68,8 @@ def schema_command() -> None:
 )
 @click.option(
     "--pretty/--no-pretty",
-    default=True,
-    help="Pretty-print JSON output with indentation",
+    default=False,
+    help="Pretty-print JSON output with indentation (default: compact)",
 )
 @click.option(
     "--vscode/--no-vscode",
@@ -89,20 +106,22 @@ def export_command(
         # Export without VSCode integration
         kg schema export --no-vscode
 
-        # Compact JSON for production
-        kg schema export --no-pretty --output dist/schema.json
+        # Indented JSON for reading or committing
+        kg schema export --pretty --output docs/kg-schema.json
     """
     try:
-        # Run async export
-        asyncio.run(_export_schema(output, schema_dir, pretty, vscode, quiet))
+        _export_schema(output, schema_dir, pretty, vscode, quiet)
 
     except KeyboardInterrupt:
         if not quiet:
-            console.print("\n⚠️  [yellow]Export cancelled by user[/yellow]")
+            _get_console().print("\n⚠️  [yellow]Export cancelled by user[/yellow]")
         sys.exit(130)
 
     except Exception as e:
-        console.print(f"\n❌ [bold red]Export failed:[/bold red] {e}")
+        from rich.markup import escape  # noqa: PLC0415
+
+        console = _get_console()
+        console.print(f"\n❌ [bold red]Export failed:[/bold red] {escape(str(e))}")
         if "--verbose" in sys.argv or "-v" in sys.argv:
             import traceback
 
@@ -111,14 +130,14 @@ def export_command(
         sys.exit(1)
 
 
-async def _export_schema(
+def _export_schema(
     output_path: str,
     schema_dir: str,
     pretty: bool,
     update_vscode: bool,
     quiet: bool,
 ) -> None:
-    """Export JSON Schema asynchronously.
+    """Export JSON Schema, reusing the previous export when inputs match.
 
     Args:
         output_path: Path to output JSON file
@@ -127,87 +146,191 @@ async def _export_schema(
         update_vscode: Whether to update VSCode settings
         quiet: Whether to suppress output
     """
-    if not quiet:
-        console.print("🔄 [cyan]Generating JSON Schema...[/cyan]")
+    import yaml  # noqa: PLC0415
+
+    from ..core.json_schema_generator import write_file_atomic  # noqa: PLC0415
+    from ..core.schema_loader import schema_signature  # noqa: PLC0415
 
-    # Create exporter
-    exporter = JSONSchemaExporter(schema_dir)
+    emit = _get_printer(quiet)
 
-    # Export schema
-    json_schema = await exporter.export(output_path, pretty=pretty)
+    if not quiet:
+        emit("🔄 [cyan]Generating JSON Schema...[/cyan]")
+
+    output_file = Path(output_path)
+    key_file = output_file.with_name(output_file.name + _CACHE_KEY_SUFFIX)
+    signature = schema_signature(Path(schema_dir))
+    cache_key = _export_cache_key(signature, pretty)
+
+    if (
+        output_file.exists()
+        and key_file.exists()
+        and key_file.read_text(encoding="utf-8") == cache_key
+    ):
+        # Schemas are unchanged since the last export; reuse the file on disk
+        cached = output_file.read_bytes()
+        json_schema, file_size = orjson.loads(cached), len(cached)
+        if not quiet:
+            emit("   ♻️  [dim]Schemas unchanged, reusing cached export[/dim]")
+    else:
+        if not quiet and not yaml.__with_libyaml__:
+            emit(
+                "   ⚠️  [yellow]PyYAML was built without libyaml; schema export "
+                "will be 5-10x slower. Install libyaml and reinstall PyYAML.[/yellow]"
+            )
+        exporter = _get_exporter(schema_dir, signature)
+        json_schema, file_size = exporter.export_sync(output_path, pretty=pretty)
+        write_file_atomic(key_file, cache_key.encode())
 
     # Get statistics
     entity_count = len(
-        list(json_schema.get("properties", {}).get("entity", {}).get("properties", {}))
+        json_schema.get("properties", {}).get("entity", {}).get("properties", {})
     )
-    output_file = Path(output_path)
 
     if not quiet:
-        console.print("✅ [green]Generated JSON Schema successfully[/green]")
-        console.print(f"   📁 Output: {output_path}")
-        console.print(f"   📊 Entity types: {entity_count}")
-        console.print(
-            f"   📦 File size: {_format_file_size(output_file.stat().st_size)}"
-        )
+        emit("✅ [green]Generated JSON Schema successfully[/green]")
+        # The path is user data: brackets in it are not markup
+        emit(f"   📁 Output: {output_path}", markup=False)
+        emit(f"   📊 Entity types: {entity_count}")
+        emit(f"   📦 File size: {_format_file_size(file_size)}")
 
     # Update VSCode settings if requested
     if update_vscode:
-        await _update_vscode_settings(output_path, quiet)
+        _update_vscode_settings(output_path, quiet)
 
     if not quiet:
-        console.print()
-        console.print("💡 [bold cyan]Next steps:[/bold cyan]")
-        console.print("   1. Reload VSCode to activate the schema")
-        console.print("   2. Open a knowledge-graph.yaml file")
-        console.print("   3. Enjoy autocomplete and validation! ✨")
+        emit()
+        emit("💡 [bold cyan]Next steps:[/bold cyan]")
+        emit("   1. Reload VSCode to activate the schema")
+        emit("   2. Open a knowledge-graph.yaml file")
+        emit("   3. Enjoy autocomplete and validation! ✨")
 
 
-async def _update_vscode_settings(schema_path: str, quiet: bool) -> None:
+def _update_vscode_settings(schema_path: str, quiet: bool) -> None:
     """Update VSCode settings.json with schema configuration.
 
     Args:
         schema_path: Path to the generated JSON schema
         quiet: Whether to suppress output
     """
-    vscode_settings_path = Path(".vscode/settings.json")
+    from ..core.json_schema_generator import write_file_atomic  # noqa: PLC0415
 
-    # Create .vscode directory if it doesn't exist
-    vscode_settings_path.parent.mkdir(parents=True, exist_ok=True)
+    emit = _get_printer(quiet)
+    vscode_settings_path = Path(".vscode/settings.json")
 
     # Read or create settings
     if vscode_settings_path.exists():
         try:
-            existing_settings = json.loads(
-                vscode_settings_path.read_text(encoding="utf-8")
-            )
-        except json.JSONDecodeError:
+            existing_settings = orjson.loads(vscode_settings_path.read_bytes())
+        except orjson.JSONDecodeError:
             if not quiet:
-                console.print(
+                emit(
                     "   ⚠️  [yellow]Warning: Invalid .vscode/settings.json, creating new file[/yellow]"
                 )
             existing_settings = {}
     else:
         existing_settings = {}
 
+    # Leave the file untouched when the mapping is already in place
+    current_globs = existing_settings.get("yaml.schemas", {}).get(schema_path)
+    if current_globs == _VSCODE_SCHEMA_GLOBS:
+        if not quiet:
+            emit("   ⚙️  [dim].vscode/settings.json already maps this schema[/dim]")
+        return
+
     # Add/update yaml.schemas configuration
     if "yaml.schemas" not in existing_settings:
         existing_settings["yaml.schemas"] = {}
 
-    existing_settings["yaml.schemas"][schema_path] = [
-        "**/knowledge-graph.yaml",
-        "tmp/**/knowledge-graph.yaml",
-    ]
+    existing_settings["yaml.schemas"][schema_path] = _VSCODE_SCHEMA_GLOBS
 
     # Write updated settings
-    vscode_settings_path.write_text(
-        json.dumps(existing_settings, indent=2, ensure_ascii=False) + "\n",
-        encoding="utf-8",
+    write_file_atomic(
+        vscode_settings_path,
+        orjson.dumps(
+            existing_settings, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        ),
     )
 
     if not quiet:
-        console.print(
-            "   ⚙️  [cyan]Updated .vscode/settings.json with schema mapping[/cyan]"
-        )
+        emit("   ⚙️  [cyan]Updated .vscode/settings.json with schema mapping[/cyan]")
+
+
+@lru_cache(maxsize=2)
+def _get_console(plain: bool = False) -> "Console":
+    """Create the console used for rich formatting on first use.
+
+    Args:
+        plain: Write uncoloured, unwrapped text, for output that is piped
+            (CI, pre-commit hooks) rather than shown on a terminal
+    """
+    from rich.console import Console  # noqa: PLC0415
+
+    if plain:
+        return Console(no_color=True, highlight=False, soft_wrap=True)
+    return Console()
+
+
+def _get_printer(quiet: bool = False) -> Callable[..., None]:
+    """Choose how progress messages are written.
+
+    Args:
+        quiet: Discard messages without creating a console
+
+    Returns:
+        ``print`` of a console suited to stdout, or a no-op when quiet
+    """
+    if quiet:
+        return _discard
+    return _get_console(plain=not sys.stdout.isatty()).print
+
+
+def _discard(*_objects: object, **_kwargs: object) -> None:
+    """Ignore progress messages in quiet mode."""
+
+
+@lru_cache(maxsize=8)
+def _get_exporter(schema_dir: str, signature: str) -> "JSONSchemaExporter":  # noqa: ARG001
+    """Return an exporter for a schema directory, reusing it while unchanged.
+
+    The exporter keeps its loaded schemas, so repeated exports in one process
+    (tests, development loops) skip YAML parsing. ``signature`` is only part
+    of the cache key: editing a schema file yields a new exporter.
+
+    Args:
+        schema_dir: Directory containing YAML schemas
+        signature: Current schema_signature() of the directory
+
+    Returns:
+        Exporter bound to the directory's current contents
+    """
+    from ..core.json_schema_generator import JSONSchemaExporter  # noqa: PLC0415
+
+    return JSONSchemaExporter(schema_dir)
+
+
+def _export_cache_key(signature: str, pretty: bool) -> str:
+    """Build the cache key identifying an export's inputs.
+
+    Combines the schema directory signature (file names, sizes and mtimes)
+    with the generator module's own mtime and the formatting options, so any
+    change that could alter the output forces a regeneration.
+
+    Args:
+        signature: schema_signature() of the schema directory
+        pretty: Whether the JSON is pretty-printed
+
+    Returns:
+        Hex digest for the export inputs
+    """
+    from ..core import json_schema_generator  # noqa: PLC0415
+
+    generator_stat = Path(json_schema_generator.__file__).stat()
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(
+        f"{signature}\0{generator_stat.st_mtime_ns}"
+        f"\0{generator_stat.st_size}\0{pretty}".encode()
+    )
+    return digest.hexdigest()
 
 
 def _format_file_size(size_bytes: int) -> str:
@@ -219,12 +342,12 @@ def _format_file_size(size_bytes: int) -> str:
     Returns:
         Formatted size string
     """
-    if size_bytes < 1024:
+    if size_bytes < _KB:
         return f"{size_bytes} bytes"
-    elif size_bytes < 1024 * 1024:
-        return f"{size_bytes / 1024:.1f} KB"
+    elif size_bytes < _MB:
+        return f"{size_bytes / _KB:.1f} KB"
     else:
-        return f"{size_bytes / (1024 * 1024):.1f} MB"
+        return f"{size_bytes / _MB:.1f} MB"
 
 
 __all__ = ["schema_command", "export_command"]
@@ -6,332 +6,369 @@ error reporting.
 """
 
 import asyncio
-from dataclasses import replace
-import json
+from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
 import sys
 import time
-import traceback
 from typing import Any
 
+import orjson
 from rich.console import Console
 from rich.table import Table
+from rich.text import Text
 import rich_click as click
 import yaml
 
 from ..core import FileSchemaLoader
-from ..validation import KnowledgeGraphValidator
-from ..validation.errors import ValidationError
+from ..validation import KnowledgeGraphValidator, YamlSyntaxValidator
+from ..validation.errors import ValidationError, ValidationResult
 
 # Create console for rich formatting - auto-detects if we're in interactive environment
 console = Console()
 
+# Prefer the libyaml-backed loader and dumper; fall back to pure Python when
+# unavailable
+_YamlLoader: type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper: type[yaml.SafeDumper] = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Errors listed by the compact format; validation stops once this many are found
+_COMPACT_MAX_ERRORS = 3
+
+# Byte sizes used when reporting the file size
+_KB = 1 << 10
+_MB = 1 << 20
+
+
+def _safe_load(content: str | bytes) -> Any:
+    """Parse YAML content with the fastest available safe loader.
+
+    Args:
+        content: YAML document text or UTF-8 bytes
+
+    Returns:
+        Parsed YAML data
+    """
+    return yaml.load(content, Loader=_YamlLoader)
+
 
 def _should_use_rich_formatting(force_colors: bool = False) -> bool:
     """Determine if we should use rich formatting based on environment."""
     return force_colors or console.is_terminal
 
 
+@lru_cache(maxsize=256)
 def _format_file_size(size_bytes: int) -> str:
     """Format file size in human-readable format."""
-    if size_bytes < 1024:
+    if size_bytes < _KB:
         return f"{size_bytes} bytes"
-    elif size_bytes < 1024 * 1024:
-        return f"{size_bytes / 1024:.1f} KB"
+    elif size_bytes < _MB:
+        return f"{size_bytes / _KB:.1f} KB"
     else:
-        return f"{size_bytes / (1024 * 1024):.1f} MB"
+        return f"{size_bytes / _MB:.1f} MB"
 
 
-def _count_dependencies(data: dict[str, Any]) -> int:
+def _count_dependencies(data: Any) -> int:
     """Count total dependencies in the YAML data."""
-    count = 0
-    entities = data.get("entity", {})
-
-    for _entity_type, entity_list in entities.items():
-        if isinstance(entity_list, list):
-            for entity_dict in entity_list:
-                if isinstance(entity_dict, dict):
-                    for _entity_name, entity_data in entity_dict.items():
-                        if isinstance(entity_data, dict):
-                            depends_on = entity_data.get("depends_on", [])
-                            if isinstance(depends_on, list):
-                                count += len(depends_on)
-
-    return count
-
-
-def _output_table_format(  # noqa: PLR0912, PLR0915
-    result: Any,
+    entities = data.get("entity") if isinstance(data, dict) else None
+    if not isinstance(entities, dict):
+        return 0
+
+    return sum(
+        len(depends_on)
+        for entity_list in entities.values()
+        if isinstance(entity_list, list)
+        for entity_dict in entity_list
+        if isinstance(entity_dict, dict)
+        for entity_data in entity_dict.values()
+        if isinstance(entity_data, dict)
+        and isinstance(depends_on := entity_data.get("depends_on"), list)
+    )
+
+
+def _output_table_rich(
+    result: ValidationResult,
     file_path: str,
+    *,
     verbose: bool,
     parse_time_ms: float,
     file_size: int,
     dependency_count: int,
     namespace: str | None,
-    force_colors: bool = False,
 ) -> None:
-    """Output validation result in table format."""
+    """Output validation result in table format with rich formatting."""
     if result.is_valid:
-        # Success output with rich formatting for interactive terminals
-        if _should_use_rich_formatting(force_colors):
-            console.print("✅ [bold green]Validation successful[/bold green]")
-            console.print()
-
-            # Create info table for better readability
-            info_table = Table(show_header=False, box=None, padding=(0, 1))
-            info_table.add_row("[bold]File:[/bold]", f"[cyan]{file_path}[/cyan]")
-            info_table.add_row(
-                "[bold]Namespace:[/bold]",
-                f"[magenta]{namespace or 'Unknown'}[/magenta]",
-            )
-
-            if verbose:
-                info_table.add_row(
-                    "[bold]File size:[/bold]",
-                    f"[dim]{_format_file_size(file_size)}[/dim]",
-                )
-                info_table.add_row(
-                    "[bold]Parse time:[/bold]", f"[dim]{parse_time_ms:.1f}ms[/dim]"
-                )
-                info_table.add_row(
-                    "[bold]Dependencies:[/bold]", f"[dim]{dependency_count}[/dim]"
-                )
-
-            console.print(info_table)
-        else:
-            # Plain text for non-interactive (CI)
-            click.echo("✅ Validation successful")
-            click.echo()
-            click.echo(f"File: {file_path}")
-            click.echo(f"Namespace: {namespace or 'Unknown'}")
-            if verbose:
-                click.echo(f"File size: {_format_file_size(file_size)}")
-                click.echo(f"Parsed in: {parse_time_ms:.1f}ms")
-                click.echo(f"Dependencies: {dependency_count}")
-    elif _should_use_rich_formatting(force_colors):
-        console.print("❌ [bold red]Validation failed[/bold red]")
+        console.print("✅ [bold green]Validation successful[/bold green]")
         console.print()
 
-        # File info
+        # Create info table for better readability
         info_table = Table(show_header=False, box=None, padding=(0, 1))
         info_table.add_row("[bold]File:[/bold]", f"[cyan]{file_path}[/cyan]")
         info_table.add_row(
-            "[bold red]Errors found:[/bold red]", f"[red]{result.error_count}[/red]"
+            "[bold]Namespace:[/bold]",
+            f"[magenta]{namespace or 'Unknown'}[/magenta]",
         )
+
+        if verbose:
+            info_table.add_row(
+                "[bold]File size:[/bold]",
+                f"[dim]{_format_file_size(file_size)}[/dim]",
+            )
+            info_table.add_row(
+                "[bold]Parse time:[/bold]", f"[dim]{parse_time_ms:.1f}ms[/dim]"
+            )
+            info_table.add_row(
+                "[bold]Dependencies:[/bold]", f"[dim]{dependency_count}[/dim]"
+            )
+
         console.print(info_table)
-        console.print()
+        return
+
+    console.print("❌ [bold red]Validation failed[/bold red]")
+    console.print()
+
+    # File info
+    info_table = Table(show_header=False, box=None, padding=(0, 1))
+    info_table.add_row("[bold]File:[/bold]", f"[cyan]{file_path}[/cyan]")
+    info_table.add_row(
+        "[bold red]Errors found:[/bold red]", f"[red]{result.error_count}[/red]"
+    )
+    console.print(info_table)
+    console.print()
+
+    # Error details with enhanced formatting, rendered as one block so
+    # Rich prints once rather than once per error. Styled Text segments
+    # skip the markup parser (and keep brackets in messages literal).
+    error_blocks = []
+    for i, error in enumerate(result.errors, 1):
+        error_content = Text.assemble(
+            (f"Error {i}:", "bold red"), " ", (error.type, "red")
+        )
 
-        # Error details with enhanced formatting
-        for i, error in enumerate(result.errors, 1):
-            # Create error panel for each error
-            error_content = []
+        if error.entity:
+            error_content.append(" in ")
+            error_content.append(error.entity, "bold yellow")
+            if error.field:
+                error_content.append(".")
+                error_content.append(error.field, "bold blue")
 
-            if error.entity and error.field:
-                error_content.append(
-                    f"[bold red]Error {i}:[/bold red] [red]{error.type}[/red] in [bold yellow]{error.entity}[/bold yellow].[bold blue]{error.field}[/bold blue]"
-                )
-            elif error.entity:
-                error_content.append(
-                    f"[bold red]Error {i}:[/bold red] [red]{error.type}[/red] in [bold yellow]{error.entity}[/bold yellow]"
-                )
-            else:
-                error_content.append(
-                    f"[bold red]Error {i}:[/bold red] [red]{error.type}[/red]"
-                )
+        error_content.append("\n")
+        error_content.append(error.message, "dim")
 
-            error_content.append(f"[dim]{error.message}[/dim]")
+        if error.help:
+            error_content.append("\n💡 ")
+            error_content.append(error.help, "italic green")
 
-            if error.help:
-                error_content.append(f"💡 [italic green]{error.help}[/italic green]")
+        if error.line is not None:
+            error_content.append("\n📍 ")
+            error_content.append(
+                f"Line {error.line}, Column {error.column or 1}", "dim"
+            )
 
-            if error.line is not None:
-                error_content.append(
-                    f"📍 [dim]Line {error.line}, Column {error.column or 1}[/dim]"
-                )
+        error_blocks.append(error_content)
 
-            console.print("\n".join(error_content))
-            if i < len(result.errors):
-                console.print()
+    if error_blocks:
+        console.print(Text("\n\n").join(error_blocks))
 
-        if verbose:
-            console.print()
-            console.print("[bold]Detailed error analysis:[/bold]")
-            console.print(f"• [red]Total errors: {result.error_count}[/red]")
-            console.print(f"• [yellow]Total warnings: {result.warning_count}[/yellow]")
-    else:
-        # Plain text for non-interactive (CI)
-        click.echo("❌ Validation failed")
+    if verbose:
+        console.print()
+        console.print("[bold]Detailed error analysis:[/bold]")
+        console.print(f"• [red]Total errors: {result.error_count}[/red]")
+        console.print(f"• [yellow]Total warnings: {result.warning_count}[/yellow]")
+
+
+def _output_table_plain(
+    result: ValidationResult,
+    file_path: str,
+    *,
+    verbose: bool,
+    parse_time_ms: float,
+    file_size: int,
+    dependency_count: int,
+    namespace: str | None,
+) -> None:
+    """Output validation result in table format as plain text (CI)."""
+    if result.is_valid:
+        click.echo("✅ Validation successful")
         click.echo()
         click.echo(f"File: {file_path}")
-        click.echo(f"Errors found: {result.error_count}")
-        click.echo()
+        click.echo(f"Namespace: {namespace or 'Unknown'}")
+        if verbose:
+            click.echo(f"File size: {_format_file_size(file_size)}")
+            click.echo(f"Parsed in: {parse_time_ms:.1f}ms")
+            click.echo(f"Dependencies: {dependency_count}")
+        return
+
+    click.echo("❌ Validation failed")
+    click.echo()
+    click.echo(f"File: {file_path}")
+    click.echo(f"Errors found: {result.error_count}")
+    click.echo()
+
+    lines = []
+    for error in result.errors:
+        if error.entity:
+            lines.append(
+                f"❌ {error.type} in '{error.entity}.{error.field}': {error.message}"
+            )
+        else:
+            lines.append(f"❌ {error.type}: {error.message}")
 
-        for error in result.errors:
-            if error.entity:
-                click.echo(
-                    f"❌ {error.type} in '{error.entity}.{error.field}': {error.message}"
-                )
-            else:
-                click.echo(f"❌ {error.type}: {error.message}")
+        if error.help:
+            lines.append(f"   💡 Help: {error.help}")
 
-            if error.help:
-                click.echo(f"   💡 Help: {error.help}")
+        if error.line is not None:
+            lines.append(f"   📍 Line {error.line}, Column {error.column or 1}")
 
-            if error.line is not None:
-                click.echo(f"   📍 Line {error.line}, Column {error.column or 1}")
+    if lines:
+        click.echo("\n".join(lines))
 
-        if verbose:
-            click.echo()
-            click.echo("Detailed error analysis:")
-            click.echo(f"- Total errors: {result.error_count}")
-            click.echo(f"- Total warnings: {result.warning_count}")
+    if verbose:
+        click.echo()
+        click.echo("Detailed error analysis:")
+        click.echo(f"- Total errors: {result.error_count}")
+        click.echo(f"- Total warnings: {result.warning_count}")
 
 
-def _output_compact_format(  # noqa: PLR0912
-    result: Any,
+def _output_compact_rich(
+    result: ValidationResult,
     file_path: str,
+    *,
     verbose: bool,
     parse_time_ms: float,
     file_size: int,
     dependency_count: int,
     namespace: str | None,
-    force_colors: bool = False,
 ) -> None:
-    """Output validation result in compact format."""
+    """Output validation result in compact format with rich formatting."""
     if result.is_valid:
-        if _should_use_rich_formatting(force_colors):
-            # Rich compact format for success
-            parts = [
-                "[bold green]✅ VALID[/bold green]",
-                f"[bold]file[/bold]=[cyan]{file_path}[/cyan]",
-                f"[bold]namespace[/bold]=[magenta]{namespace or 'unknown'}[/magenta]",
-            ]
-
-            if verbose:
-                parts.extend(
-                    [
-                        f"[bold]size[/bold]=[dim]{_format_file_size(file_size)}[/dim]",
-                        f"[bold]parsed[/bold]=[dim]{parse_time_ms:.1f}ms[/dim]",
-                        f"[bold]deps[/bold]=[dim]{dependency_count}[/dim]",
-                    ]
-                )
-
-            console.print(" ".join(parts))
-        else:
-            # Plain compact format for CI
-            status_parts = [
-                "✅ VALID",
-                f"file={file_path}",
-                f"namespace={namespace or 'unknown'}",
-            ]
-
-            if verbose:
-                status_parts.extend(
-                    [
-                        f"size={_format_file_size(file_size)}",
-                        f"parsed={parse_time_ms:.1f}ms",
-                        f"deps={dependency_count}",
-                    ]
-                )
-
-            click.echo(" ".join(status_parts))
-    elif _should_use_rich_formatting(force_colors):
-        # Rich compact format for errors
         parts = [
-            "[bold red]❌ INVALID[/bold red]",
+            "[bold green]✅ VALID[/bold green]",
             f"[bold]file[/bold]=[cyan]{file_path}[/cyan]",
-            f"[bold]errors[/bold]=[red]{result.error_count}[/red]",
+            f"[bold]namespace[/bold]=[magenta]{namespace or 'unknown'}[/magenta]",
         ]
 
-        if result.warning_count > 0:
-            parts.append(
-                f"[bold]warnings[/bold]=[yellow]{result.warning_count}[/yellow]"
+        if verbose:
+            parts.extend(
+                [
+                    f"[bold]size[/bold]=[dim]{_format_file_size(file_size)}[/dim]",
+                    f"[bold]parsed[/bold]=[dim]{parse_time_ms:.1f}ms[/dim]",
+                    f"[bold]deps[/bold]=[dim]{dependency_count}[/dim]",
+                ]
             )
 
         console.print(" ".join(parts))
+        return
 
-        # Show first few errors in compact format with rich formatting
-        for _i, error in enumerate(result.errors[:3], 1):
-            if error.entity and error.field:
-                console.print(
-                    f"  [red]❌[/red] [bold yellow]{error.entity}[/bold yellow].[bold blue]{error.field}[/bold blue]: [dim]{error.message}[/dim]"
-                )
-            elif error.entity:
-                console.print(
-                    f"  [red]❌[/red] [bold yellow]{error.entity}[/bold yellow]: [dim]{error.message}[/dim]"
-                )
-            else:
-                console.print(f"  [red]❌[/red] [dim]{error.message}[/dim]")
-    else:
-        # Plain compact format for CI
-        status_parts = [
-            "❌ INVALID",
-            f"file={file_path}",
-            f"errors={result.error_count}",
-        ]
+    parts = [
+        "[bold red]❌ INVALID[/bold red]",
+        f"[bold]file[/bold]=[cyan]{file_path}[/cyan]",
+        f"[bold]errors[/bold]=[red]{_format_error_count(result)}[/red]",
+    ]
 
-        if result.warning_count > 0:
-            status_parts.append(f"warnings={result.warning_count}")
+    if result.warning_count > 0:
+        parts.append(f"[bold]warnings[/bold]=[yellow]{result.warning_count}[/yellow]")
 
-        click.echo(" ".join(status_parts))
+    lines = [Text.from_markup(" ".join(parts))]
 
-        # Show first few errors in compact format
-        for error in result.errors[:3]:
-            if error.entity:
-                click.echo(f"  ❌ {error.entity}.{error.field}: {error.message}")
-            else:
-                click.echo(f"  ❌ {error.message}")
+    # Show first few errors in compact format with rich formatting
+    for error in result.errors[:_COMPACT_MAX_ERRORS]:
+        line = Text.assemble("  ", ("❌", "red"), " ")
+        if error.entity:
+            line.append(error.entity, "bold yellow")
+            if error.field:
+                line.append(".")
+                line.append(error.field, "bold blue")
+            line.append(": ")
+        line.append(error.message, "dim")
+        lines.append(line)
 
+    console.print(Text("\n").join(lines))
 
-def _output_json_format(
-    result: Any,
+
+def _output_compact_plain(
+    result: ValidationResult,
     file_path: str,
+    *,
     verbose: bool,
     parse_time_ms: float,
     file_size: int,
     dependency_count: int,
     namespace: str | None,
 ) -> None:
-    """Output validation result in JSON format."""
-    output: dict[str, Any] = {
-        "status": "valid" if result.is_valid else "invalid",
-        "file": file_path,
-        "namespace": namespace,
-    }
+    """Output validation result in compact format as plain text (CI)."""
+    if result.is_valid:
+        status_parts = [
+            "✅ VALID",
+            f"file={file_path}",
+            f"namespace={namespace or 'unknown'}",
+        ]
 
-    if not result.is_valid:
-        output["error_count"] = result.error_count
-        output["warning_count"] = result.warning_count
-        output["errors"] = []
+        if verbose:
+            status_parts.extend(
+                [
+                    f"size={_format_file_size(file_size)}",
+                    f"parsed={parse_time_ms:.1f}ms",
+                    f"deps={dependency_count}",
+                ]
+            )
 
-        for error in result.errors:
-            error_dict: dict[str, Any] = {
-                "type": error.type,
-                "message": error.message,
-            }
+        click.echo(" ".join(status_parts))
+        return
 
-            if error.field:
-                error_dict["field"] = error.field
-            if error.entity:
-                error_dict["entity"] = error.entity
-            if error.line is not None:
-                error_dict["line"] = error.line
-            if error.column is not None:
-                error_dict["column"] = error.column
-            if error.help:
-                error_dict["help"] = error.help
-
-            output["errors"].append(error_dict)
+    status_parts = [
+        "❌ INVALID",
+        f"file={file_path}",
+        f"errors={_format_error_count(result)}",
+    ]
 
-    if verbose:
-        output["file_size"] = file_size
-        output["parse_time_ms"] = round(parse_time_ms, 1)
-        output["dependency_count"] = dependency_count
+    if result.warning_count > 0:
+        status_parts.append(f"warnings={result.warning_count}")
+
+    click.echo(" ".join(status_parts))
+
+    # Show first few errors in compact format
+    for error in result.errors[:_COMPACT_MAX_ERRORS]:
+        if error.entity:
+            click.echo(f"  ❌ {error.entity}.{error.field}: {error.message}")
+        else:
+            click.echo(f"  ❌ {error.message}")
+
+
+# Text formatters keyed by (format, use_rich); the terminal check happens once
+# per invocation when one is picked rather than inside every formatter
+_TEXT_FORMATTERS: dict[tuple[str, bool], Callable[..., None]] = {
+    ("table", True): _output_table_rich,
+    ("table", False): _output_table_plain,
+    ("compact", True): _output_compact_rich,
+    ("compact", False): _output_compact_plain,
+}
+
+
+def _format_error_count(result: ValidationResult) -> str:
+    """Format the error count, marking counts cut short by an error limit."""
+    return f"{result.error_count}+" if result.truncated else str(result.error_count)
 
-    click.echo(json.dumps(output, indent=2))
 
+def _error_to_dict(error: ValidationError) -> dict[str, Any]:
+    """Convert a validation error to its JSON/YAML output representation."""
+    error_dict: dict[str, Any] = {"type": error.type, "message": error.message}
 
-def _output_yaml_format(
+    if error.field:
+        error_dict["field"] = error.field
+    if error.entity:
+        error_dict["entity"] = error.entity
+    if error.line is not None:
+        error_dict["line"] = error.line
+    if error.column is not None:
+        error_dict["column"] = error.column
+    if error.help:
+        error_dict["help"] = error.help
+
+    return error_dict
+
+
+def _result_to_dict(
     result: Any,
     file_path: str,
     verbose: bool,
@@ -339,8 +376,8 @@ def _output_yaml_format(
     file_size: int,
     dependency_count: int,
     namespace: str | None,
-) -> None:
-    """Output validation result in YAML format."""
+) -> dict[str, Any]:
+    """Build the machine-readable validation report shared by JSON and YAML."""
     output: dict[str, Any] = {
         "status": "valid" if result.is_valid else "invalid",
         "file": file_path,
@@ -350,36 +387,36 @@ def _output_yaml_format(
     if not result.is_valid:
         output["error_count"] = result.error_count
         output["warning_count"] = result.warning_count
-        output["errors"] = []
-
-        for error in result.errors:
-            error_dict: dict[str, Any] = {
-                "type": error.type,
-                "message": error.message,
-            }
-
-            if error.field:
-                error_dict["field"] = error.field
-            if error.entity:
-                error_dict["entity"] = error.entity
-            if error.line is not None:
-                error_dict["line"] = error.line
-            if error.column is not None:
-                error_dict["column"] = error.column
-            if error.help:
-                error_dict["help"] = error.help
-
-            output["errors"].append(error_dict)
+        output["errors"] = [_error_to_dict(error) for error in result.errors]
 
     if verbose:
         output["file_size"] = file_size
         output["parse_time_ms"] = round(parse_time_ms, 1)
         output["dependency_count"] = dependency_count
 
-    click.echo(yaml.dump(output, default_flow_style=False, sort_keys=False))
+    return output
+
+
+def _output_json_format(output: dict[str, Any]) -> None:
+    """Output a validation report in JSON format."""
+    # click.echo writes bytes straight to the binary stdout stream, so the
+    # serialized report is never decoded into a second, str copy
+    click.echo(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+
 
+def _output_yaml_format(output: dict[str, Any]) -> None:
+    """Output a validation report in YAML format."""
+    # Stream events to stdout instead of building the whole document first
+    yaml.dump(
+        output,
+        stream=sys.stdout,
+        Dumper=_YamlDumper,
+        default_flow_style=False,
+        sort_keys=False,
+    )
 
-def _validate_implementation(  # noqa: PLR0912, PLR0915
+
+async def _validate_implementation(  # noqa: PLR0912, PLR0915
     file: str,
     strict: bool,
     format: str,
@@ -411,8 +448,10 @@ def _validate_implementation(  # noqa: PLR0912, PLR0915
     file_path = Path(file)
 
     try:
-        # Check if file exists
-        if not file_path.exists():
+        # One stat call both checks that the file exists and records its size
+        try:
+            file_size = file_path.stat().st_size
+        except FileNotFoundError:
             if format == "json":
                 error_output = {
                     "status": "error",
@@ -420,20 +459,19 @@ def _validate_implementation(  # noqa: PLR0912, PLR0915
                     "message": f"File not found: {file}",
                     "file": str(file_path),
                 }
-                click.echo(json.dumps(error_output, indent=2))
+                _output_json_format(error_output)
             else:
                 click.echo(f"❌ File not found: {file}")
                 if verbose:
                     click.echo(f"Checked path: {file_path.absolute()}")
             sys.exit(2)
 
-        # Record file size and start time
-        file_size = file_path.stat().st_size
         start_time = time.time()
 
-        # Read file content
+        # Read raw bytes; libyaml decodes them itself, so no intermediate
+        # str copy of the whole file is built
         try:
-            content = file_path.read_text(encoding="utf-8")
+            content = file_path.read_bytes()
         except Exception as e:
             if format == "json":
                 error_output = {
@@ -442,7 +480,7 @@ def _validate_implementation(  # noqa: PLR0912, PLR0915
                     "message": f"Cannot read file: {e}",
                     "file": str(file_path),
                 }
-                click.echo(json.dumps(error_output, indent=2))
+                _output_json_format(error_output)
             else:
                 click.echo(f"❌ Cannot read file: {e}")
             sys.exit(2)
@@ -453,11 +491,9 @@ def _validate_implementation(  # noqa: PLR0912, PLR0915
             backend_dir = Path(__file__).parent.parent.parent
             schema_dir = backend_dir / "schemas"
 
-            if not schema_dir.exists():
-                raise FileNotFoundError(f"Schema directory not found: {schema_dir}")
-
+            # A missing directory is reported by the loader itself
             schema_loader = FileSchemaLoader(str(schema_dir))
-            schemas = asyncio.run(schema_loader.load_schemas())
+            schemas = await schema_loader.load_schemas_cached()
         except Exception as e:
             if format == "json":
                 error_output = {
@@ -466,7 +502,7 @@ def _validate_implementation(  # noqa: PLR0912, PLR0915
                     "message": f"Cannot load schemas: {e}",
                     "file": str(file_path),
                 }
-                click.echo(json.dumps(error_output, indent=2))
+                _output_json_format(error_output)
             else:
                 click.echo(f"❌ Cannot load schemas: {e}")
             sys.exit(4)
@@ -474,92 +510,81 @@ def _validate_implementation(  # noqa: PLR0912, PLR0915
         # Create validator
         validator = KnowledgeGraphValidator(schemas)
 
-        # Parse YAML for additional metrics
+        # Parse once; the same document feeds validation and the metrics
         try:
-            parsed_data = yaml.safe_load(content)
-        except yaml.YAMLError:
+            parsed_data = _safe_load(content)
+        except yaml.YAMLError as e:
             parsed_data = {}
-
-        # Run validation
-        try:
-            result = asyncio.run(validator.validate(content))
-        except Exception as e:
-            if format == "json":
-                error_output = {
-                    "status": "error",
-                    "error_type": "validation_error",
-                    "message": f"Validation failed: {e}",
-                    "file": str(file_path),
-                }
-                click.echo(json.dumps(error_output, indent=2))
-            else:
-                click.echo(f"❌ Validation failed: {e}")
-            sys.exit(4)
+            result = ValidationResult(
+                is_valid=False,
+                errors=[YamlSyntaxValidator.syntax_error(e)],
+                warnings=[],
+            )
+        else:
+            # Run validation
+            try:
+                # Compact output lists only the first few errors, so stop there
+                max_errors = (
+                    _COMPACT_MAX_ERRORS if format == "compact" and not verbose else None
+                )
+                result = await validator.validate_parsed(
+                    parsed_data, max_errors=max_errors
+                )
+            except Exception as e:
+                if format == "json":
+                    error_output = {
+                        "status": "error",
+                        "error_type": "validation_error",
+                        "message": f"Validation failed: {e}",
+                        "file": str(file_path),
+                    }
+                    _output_json_format(error_output)
+                else:
+                    click.echo(f"❌ Validation failed: {e}")
+                sys.exit(4)
 
         # Calculate parse time and metrics
         parse_time_ms = (time.time() - start_time) * 1000
-        dependency_count = _count_dependencies(parsed_data)
+        # Only --verbose reports the dependency count, so skip the walk otherwise
+        dependency_count = _count_dependencies(parsed_data) if verbose else 0
 
         # Extract namespace from parsed data
         namespace_actual = parsed_data.get("namespace") if parsed_data else None
 
-        # Apply strict mode (convert warnings to errors)
-        final_result = result
+        # Apply strict mode (convert warnings to errors). The result is ours
+        # alone, so it is updated in place rather than copied.
         if strict and result.warning_count > 0:
-            # Create a new result object with warnings converted to errors
-            all_errors = result.errors + [
-                ValidationError(
-                    type=warning.type,
-                    message=warning.message,
-                    field=warning.field,
-                    entity=warning.entity,
-                    help=warning.help,
-                )
-                for warning in result.warnings
-            ]
-            final_result = replace(
-                result,
-                is_valid=False,
-                errors=all_errors,
-                warnings=[],
+            result.extend_errors(
+                [
+                    ValidationError(
+                        type=warning.type,
+                        message=warning.message,
+                        field=warning.field,
+                        entity=warning.entity,
+                        help=warning.help,
+                    )
+                    for warning in result.warnings
+                ]
             )
+            result.warnings = []
 
         # Output results based on format
-        if format == "table":
-            _output_table_format(
-                final_result,
-                str(file_path),
-                verbose,
-                parse_time_ms,
-                file_size,
-                dependency_count,
-                namespace_actual,
-                force_colors,
-            )
-        elif format == "compact":
-            _output_compact_format(
-                final_result,
-                str(file_path),
-                verbose,
-                parse_time_ms,
-                file_size,
-                dependency_count,
-                namespace_actual,
-                force_colors,
-            )
-        elif format == "json":
-            _output_json_format(
-                final_result,
+        if format in {"table", "compact"}:
+            output_fn = _TEXT_FORMATTERS[
+                (format, _should_use_rich_formatting(force_colors))
+            ]
+            output_fn(
+                result,
                 str(file_path),
-                verbose,
-                parse_time_ms,
-                file_size,
-                dependency_count,
-                namespace_actual,
+                verbose=verbose,
+                parse_time_ms=parse_time_ms,
+                file_size=file_size,
+                dependency_count=dependency_count,
+                namespace=namespace_actual,
             )
-        elif format == "yaml":
-            _output_yaml_format(
-                final_result,
+        elif format in {"json", "yaml"}:
+            output = _result_to_dict(
+                result,
                 str(file_path),
                 verbose,
                 parse_time_ms,
@@ -567,9 +592,13 @@ def _validate_implementation(  # noqa: PLR0912, PLR0915
                 dependency_count,
                 namespace_actual,
             )
+            if format == "json":
+                _output_json_format(output)
+            else:
+                _output_yaml_format(output)
 
         # Exit with appropriate code
-        sys.exit(0 if final_result.is_valid else 1)
+        sys.exit(0 if result.is_valid else 1)
 
     except KeyboardInterrupt:
         if format == "json":
@@ -579,7 +608,7 @@ def _validate_implementation(  # noqa: PLR0912, PLR0915
                 "message": "Validation interrupted by user",
                 "file": str(file_path) if "file_path" in locals() else file,
             }
-            click.echo(json.dumps(error_output, indent=2))
+            _output_json_format(error_output)
         else:
             click.echo("\n❌ Validation interrupted")
         sys.exit(4)
@@ -592,10 +621,12 @@ def _validate_implementation(  # noqa: PLR0912, PLR0915
                 "message": f"Internal error: {e}",
                 "file": str(file_path) if "file_path" in locals() else file,
             }
-            click.echo(json.dumps(error_output, indent=2))
+            _output_json_format(error_output)
         else:
             click.echo(f"❌ Internal error: {e}")
             if verbose:
+                import traceback  # noqa: PLC0415
+
                 click.echo("\nFull traceback:")
                 click.echo(traceback.format_exc())
         sys.exit(4)
@@ -661,4 +692,5 @@ def validate_command(
     - `2`: File not found, not readable, or invalid command line arguments 📁⚠️
     - `4`: Internal error 💥
     """
-    _validate_implementation(file, strict, format, verbose, force_colors)
+    # One event loop covers schema loading and validation
+    asyncio.run(_validate_implementation(file, strict, format, verbose, force_colors))
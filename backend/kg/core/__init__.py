@@ -1,35 +1,78 @@
 """Core functionality for the knowledge graph."""
 
-from .dependency_types import (
-    DependencyType,
-    DependencyUriBuilder,
-    get_dependency_type,
-    is_external_dependency,
-    is_internal_dependency,
-    parse_dependency_uri,
-    parse_external_dependency,
-    parse_internal_dependency,
-)
-from .logging import (
-    StorageOperationLogger,
-    StructlogMiddleware,
-    bind_context,
-    clear_context,
-    configure_logging,
-    get_logger,
-)
-from .model_factory import DynamicModelFactory
-from .relationship_types import RelationshipTypes, StandardRelationshipType
-from .schema import (
-    EntitySchema,
-    FieldDefinition,
-    RelationshipDefinition,
-    SchemaInheritanceError,
-    SchemaLoadError,
-    SchemaLoadResult,
-    SchemaValidationError,
-)
-from .schema_loader import FileSchemaLoader, SchemaLoader
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .dependency_types import (
+        DependencyType,
+        DependencyUriBuilder,
+        get_dependency_type,
+        is_external_dependency,
+        is_internal_dependency,
+        parse_dependency_uri,
+        parse_external_dependency,
+        parse_internal_dependency,
+    )
+    from .logging import (
+        RequestContext,
+        StorageOperationLogger,
+        StructlogMiddleware,
+        bind_context,
+        clear_context,
+        configure_logging,
+        get_logger,
+        request_ctx,
+        shutdown_logging,
+    )
+    from .model_factory import DynamicModelFactory, get_model_factory
+    from .relationship_types import RelationshipTypes, StandardRelationshipType
+    from .schema import (
+        EntitySchema,
+        FieldDefinition,
+        RelationshipDefinition,
+        SchemaInheritanceError,
+        SchemaLoadError,
+        SchemaLoadResult,
+        SchemaValidationError,
+    )
+    from .schema_loader import FileSchemaLoader, SchemaLoader
+
+# Public names are imported from their submodule on first access (PEP 562), so
+# importing one core module (e.g. for `kg validate --help`) does not load
+# structlog, the model factory and every other component
+_LAZY_IMPORTS = {
+    "DependencyType": "dependency_types",
+    "DependencyUriBuilder": "dependency_types",
+    "get_dependency_type": "dependency_types",
+    "is_external_dependency": "dependency_types",
+    "is_internal_dependency": "dependency_types",
+    "parse_dependency_uri": "dependency_types",
+    "parse_external_dependency": "dependency_types",
+    "parse_internal_dependency": "dependency_types",
+    "RequestContext": "logging",
+    "StorageOperationLogger": "logging",
+    "StructlogMiddleware": "logging",
+    "bind_context": "logging",
+    "clear_context": "logging",
+    "configure_logging": "logging",
+    "get_logger": "logging",
+    "request_ctx": "logging",
+    "shutdown_logging": "logging",
+    "DynamicModelFactory": "model_factory",
+    "get_model_factory": "model_factory",
+    "RelationshipTypes": "relationship_types",
+    "StandardRelationshipType": "relationship_types",
+    "EntitySchema": "schema",
+    "FieldDefinition": "schema",
+    "RelationshipDefinition": "schema",
+    "SchemaInheritanceError": "schema",
+    "SchemaLoadError": "schema",
+    "SchemaLoadResult": "schema",
+    "SchemaValidationError": "schema",
+    "FileSchemaLoader": "schema_loader",
+    "SchemaLoader": "schema_loader",
+}
 
 # Export all components
 __all__ = [
@@ -43,6 +86,7 @@ __all__ = [
     "FileSchemaLoader",
     "RelationshipDefinition",
     "RelationshipTypes",
+    "RequestContext",
     "StandardRelationshipType",
     "SchemaInheritanceError",
     "SchemaLoadError",
@@ -57,9 +101,22 @@ __all__ = [
     "configure_logging",
     "get_dependency_type",
     "get_logger",
+    "get_model_factory",
     "is_external_dependency",
     "is_internal_dependency",
     "parse_dependency_uri",
     "parse_external_dependency",
     "parse_internal_dependency",
+    "request_ctx",
+    "shutdown_logging",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public component from its submodule on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
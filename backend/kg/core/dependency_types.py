@@ -23,14 +23,10 @@ class DependencyType(Enum):
     @property
     def uri_pattern(self) -> str:
         """Get the regex pattern for validating URIs of this type."""
-        if self == DependencyType.EXTERNAL:
-            # external://ecosystem/package/version
-            return r"^external://([^/]+)/(.+)/([^/]+)$"
-        elif self == DependencyType.INTERNAL:
-            # internal://namespace/entity-id (can have multiple path segments)
-            return r"^internal://(.+)$"
-        else:
-            raise ValueError(f"Unknown dependency type: {self}")
+        try:
+            return _COMPILED_PATTERNS[self].pattern
+        except KeyError:
+            raise ValueError(f"Unknown dependency type: {self}") from None
 
     def matches_uri(self, uri: str) -> bool:
         """Check if a URI matches this dependency type.
@@ -57,7 +53,7 @@ class DependencyType(Enum):
         if not self.matches_uri(uri):
             return None
 
-        match = re.match(self.uri_pattern, uri)
+        match = _COMPILED_PATTERNS[self].match(uri)
         if not match:
             return None
 
@@ -142,6 +138,15 @@ class DependencyType(Enum):
         return None
 
 
+# URI patterns per dependency type, compiled once at import
+_COMPILED_PATTERNS: dict[DependencyType, re.Pattern[str]] = {
+    # external://ecosystem/package/version
+    DependencyType.EXTERNAL: re.compile(r"^external://([^/]+)/(.+)/([^/]+)$"),
+    # internal://namespace/entity-id (can have multiple path segments)
+    DependencyType.INTERNAL: re.compile(r"^internal://(.+)$"),
+}
+
+
 class DependencyUriBuilder:
     """Builder for constructing dependency URIs in a type-safe way."""
 
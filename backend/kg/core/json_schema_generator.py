@@ -4,10 +4,13 @@ This module generates JSON Schema (Draft 2020-12) from YAML schema definitions,
 enabling VSCode autocomplete and validation for knowledge graph files.
 """
 
-import json
+import asyncio
+import os
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from .schema import EntitySchema, FieldDefinition, RelationshipDefinition
 from .schema_loader import FileSchemaLoader
 
@@ -341,7 +344,9 @@ class JSONSchemaExporter:
         self.loader = FileSchemaLoader(schema_dir)
         self.generator = JSONSchemaGenerator(self.loader)
 
-    async def export(self, output_path: str, pretty: bool = True) -> dict[str, Any]:
+    async def export(
+        self, output_path: str, pretty: bool = True
+    ) -> tuple[dict[str, Any], int]:
         """Export JSON Schema to file.
 
         Args:
@@ -349,30 +354,48 @@ class JSONSchemaExporter:
             pretty: Whether to pretty-print JSON (default: True)
 
         Returns:
-            Generated JSON Schema
+            Tuple of (generated JSON Schema, number of bytes written)
         """
-        # Load schemas if not already loaded
+        # Load schemas if not already loaded. The loader parses schema files
+        # concurrently on worker threads; the cached copy from an earlier
+        # load is reused when the directory is unchanged
         if not self.loader.schemas:
-            await self.loader.load_schemas()
+            await self.loader.load_schemas_cached()
 
         # Generate JSON Schema
         json_schema = await self.generator.generate()
 
-        # Write to file
-        output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-
+        # orjson emits UTF-8 bytes directly, so no text encoding pass is needed
         if pretty:
-            output_file.write_text(
-                json.dumps(json_schema, indent=2, ensure_ascii=False) + "\n",
-                encoding="utf-8",
+            data = orjson.dumps(
+                json_schema, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
             )
         else:
-            output_file.write_text(
-                json.dumps(json_schema, ensure_ascii=False), encoding="utf-8"
-            )
+            data = orjson.dumps(json_schema)
 
-        return json_schema
+        # Write off the event loop so concurrent work is not blocked on disk I/O
+        bytes_written = await asyncio.to_thread(
+            write_file_atomic, Path(output_path), data
+        )
+
+        return json_schema, bytes_written
+
+    def export_sync(
+        self, output_path: str, pretty: bool = True
+    ) -> tuple[dict[str, Any], int]:
+        """Export JSON Schema to file from synchronous code.
+
+        Runs ``export`` on a private event loop, for callers such as the CLI
+        that have no loop of their own.
+
+        Args:
+            output_path: Path to output JSON file
+            pretty: Whether to pretty-print JSON (default: True)
+
+        Returns:
+            Tuple of (generated JSON Schema, number of bytes written)
+        """
+        return asyncio.run(self.export(output_path, pretty=pretty))
 
     async def export_with_vscode_config(
         self, output_path: str = ".vscode/kg-schema.json"
@@ -385,34 +408,69 @@ class JSONSchemaExporter:
         Returns:
             Generated JSON Schema
         """
-        # Export schema
-        json_schema = await self.export(output_path, pretty=True)
-
-        # Update VSCode settings
-        vscode_settings_path = Path(".vscode/settings.json")
-        vscode_settings_path.parent.mkdir(parents=True, exist_ok=True)
-
-        if vscode_settings_path.exists():
-            # Read existing settings
-            existing_settings = json.loads(
-                vscode_settings_path.read_text(encoding="utf-8")
-            )
-        else:
-            existing_settings = {}
-
-        # Add/update yaml.schemas configuration
-        if "yaml.schemas" not in existing_settings:
-            existing_settings["yaml.schemas"] = {}
-
-        existing_settings["yaml.schemas"][output_path] = [
-            "**/knowledge-graph.yaml",
-            "tmp/**/knowledge-graph.yaml",
-        ]
-
-        # Write updated settings
-        vscode_settings_path.write_text(
-            json.dumps(existing_settings, indent=2, ensure_ascii=False) + "\n",
-            encoding="utf-8",
-        )
-
-        return json_schema
+        # Only point VSCode at the schema once it has been written, so a
+        # failed export never leaves settings referencing a missing file
+        schema, _ = await self.export(output_path, pretty=False)
+        await asyncio.to_thread(_merge_vscode_settings, output_path)
+
+        return schema
+
+
+def write_file_atomic(path: Path, data: bytes) -> int:
+    """Replace a file's content atomically, creating parent directories.
+
+    The data is written and fsynced to a temporary file next to ``path`` which
+    is then renamed over it, so an interrupted write can never leave a
+    truncated file behind.
+
+    Args:
+        path: Destination file
+        data: Content to write
+
+    Returns:
+        Number of bytes written
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp_path.open("wb") as tmp:
+            bytes_written = tmp.write(data)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        tmp_path.replace(path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return bytes_written
+
+
+def _merge_vscode_settings(schema_path: str) -> None:
+    """Map knowledge graph files to a schema in .vscode/settings.json.
+
+    Args:
+        schema_path: Path to the exported JSON schema
+    """
+    vscode_settings_path = Path(".vscode/settings.json")
+
+    if vscode_settings_path.exists():
+        # Read existing settings
+        existing_settings = orjson.loads(vscode_settings_path.read_bytes())
+    else:
+        existing_settings = {}
+
+    # Add/update yaml.schemas configuration
+    if "yaml.schemas" not in existing_settings:
+        existing_settings["yaml.schemas"] = {}
+
+    existing_settings["yaml.schemas"][schema_path] = [
+        "**/knowledge-graph.yaml",
+        "tmp/**/knowledge-graph.yaml",
+    ]
+
+    # Write updated settings
+    write_file_atomic(
+        vscode_settings_path,
+        orjson.dumps(
+            existing_settings, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        ),
+    )
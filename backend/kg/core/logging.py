@@ -4,9 +4,16 @@ This module configures structlog for consistent, machine-readable logging
 across all components with proper context management and performance optimization.
 """
 
+import atexit
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
 import sys
 from typing import Any
+import uuid
 
 import structlog
 from structlog.typing import EventDict
@@ -21,21 +28,41 @@ def add_app_context(
     return event_dict
 
 
-def add_correlation_id(
+# Background listener that performs the actual log writes off the caller's
+# thread, and the root logger handler feeding it
+_queue_listener: QueueListener | None = None
+_queue_handler: QueueHandler | None = None
+
+# Liveness/readiness endpoints whose request logs may be sampled
+_PROBE_PATHS = frozenset({"/health"})
+
+
+@dataclass(slots=True, frozen=True)
+class RequestContext:
+    """Request-scoped log fields, created once per request.
+
+    Immutable, so one instance can be shared by every task handling the
+    request.
+    """
+
+    correlation_id: str
+    method: str
+    path: str
+
+
+# Context of the request being handled, set by StructlogMiddleware
+request_ctx: ContextVar[RequestContext | None] = ContextVar("request_ctx", default=None)
+
+
+def merge_request_context(
     _logger: Any, _method_name: str, event_dict: EventDict
 ) -> EventDict:
-    """Add correlation ID for request tracing."""
-    # Extract correlation ID from structlog context variables
-    try:
-        import structlog
-
-        context_vars = structlog.contextvars.get_contextvars()
-        correlation_id = context_vars.get("correlation_id")
-        if correlation_id:
-            event_dict["correlation_id"] = correlation_id
-    except Exception:
-        # If context extraction fails, just continue without correlation ID
-        pass
+    """Add the current request's context (correlation ID, method, path)."""
+    ctx = request_ctx.get()
+    if ctx is not None:
+        event_dict.setdefault("correlation_id", ctx.correlation_id)
+        event_dict.setdefault("method", ctx.method)
+        event_dict.setdefault("path", ctx.path)
     return event_dict
 
 
@@ -49,12 +76,22 @@ def configure_logging(
         log_level: Logging level (DEBUG/INFO/WARNING/ERROR)
         json_logs: Whether to output JSON format logs
     """
-    # Configure stdlib logging to work with structlog
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=getattr(logging, log_level.upper()),
-    )
+    global _queue_listener, _queue_handler  # noqa: PLW0603
+
+    # Configure stdlib logging to work with structlog. Records are handed to a
+    # queue and written to stdout by a listener thread, so logging calls never
+    # block on terminal or pipe I/O. A previous configuration's handler and
+    # listener are replaced rather than left writing to a dead queue.
+    shutdown_logging()
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _queue_listener = QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    _queue_listener.start()
+
+    _queue_handler = QueueHandler(log_queue)
+    _queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    root_logger = logging.getLogger()
+    root_logger.addHandler(_queue_handler)
+    root_logger.setLevel(getattr(logging, log_level.upper()))
 
     # Disable noisy loggers in production
     if environment == "production":
@@ -79,7 +116,7 @@ def configure_logging(
         structlog.processors.StackInfoRenderer(),
         # Custom processors
         add_app_context,
-        add_correlation_id,
+        merge_request_context,
         # Format and render
         structlog.processors.format_exc_info,
         renderer,
@@ -95,9 +132,28 @@ def configure_logging(
     )
 
 
+def shutdown_logging() -> None:
+    """Flush queued log records and stop the background log writer."""
+    global _queue_listener, _queue_handler  # noqa: PLW0603
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+# The listener thread is a daemon; flush what it still holds if the process
+# exits without reaching the application's shutdown
+atexit.register(shutdown_logging)
+
+
+@lru_cache(maxsize=128)
 def get_logger(name: str) -> structlog.stdlib.BoundLogger:
     """Get a configured structured logger.
 
+    Cached per name, so repeated lookups share one lazy logger proxy.
+
     Args:
         name: Logger name (typically __name__)
 
@@ -122,43 +178,56 @@ def clear_context() -> None:
 
 
 class StructlogMiddleware:
-    """FastAPI middleware for request logging and context management."""
+    """FastAPI middleware for request logging and context management.
+
+    Requests to high-volume probe paths (such as health checks) can be
+    head-sampled: only ``probe_sample_rate`` of them emit the start/completion
+    log lines, decided from the random correlation ID. Failures are always
+    logged.
+    """
 
-    def __init__(self, app: Any, logger_name: str = "kg.api.requests"):
+    def __init__(
+        self,
+        app: Any,
+        logger_name: str = "kg.api.requests",
+        probe_paths: frozenset[str] = _PROBE_PATHS,
+        probe_sample_rate: float = 1.0,
+    ):
         self.app = app
         self.logger = get_logger(logger_name)
+        self.probe_paths = probe_paths
+        # Compared against the first 16 bits of the correlation ID
+        self._probe_sample_threshold = int(probe_sample_rate * 0x10000)
 
     async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
         """Process request with logging context."""
         if scope["type"] == "http":
-            # Generate correlation ID for request tracking
-            import uuid
-
-            correlation_id = str(uuid.uuid4())[:8]
+            # Short correlation ID for request tracking
+            correlation_id = uuid.uuid4().hex[:8]
+            path = scope["path"]
+            sampled = (
+                path not in self.probe_paths
+                or int(correlation_id[:4], 16) < self._probe_sample_threshold
+            )
 
-            # Bind request context
-            bind_context(
-                correlation_id=correlation_id,
-                method=scope["method"],
-                path=scope["path"],
+            # Build the request context once; log calls merge it in via the
+            # merge_request_context processor instead of rebinding per call
+            token = request_ctx.set(
+                RequestContext(
+                    correlation_id=correlation_id, method=scope["method"], path=path
+                )
             )
 
             # Log request start
-            self.logger.info(
-                "Request started",
-                method=scope["method"],
-                path=scope["path"],
-                correlation_id=correlation_id,
-            )
+            if sampled:
+                self.logger.info("Request started")
 
             try:
                 await self.app(scope, receive, send)
 
                 # Log successful completion
-                self.logger.info(
-                    "Request completed",
-                    correlation_id=correlation_id,
-                )
+                if sampled:
+                    self.logger.info("Request completed")
 
             except Exception as e:
                 # Log request failure
@@ -166,12 +235,11 @@ class StructlogMiddleware:
                     "Request failed",
                     error=str(e),
                     error_type=type(e).__name__,
-                    correlation_id=correlation_id,
                 )
                 raise
             finally:
                 # Clean up context
-                clear_context()
+                request_ctx.reset(token)
         else:
             await self.app(scope, receive, send)
 
@@ -6,6 +6,9 @@ mapping, validation rules, and generates complete YAML validation models.
 """
 
 from datetime import datetime
+from functools import cache
+import hashlib
+import sys
 from typing import Any
 
 from pydantic import (
@@ -81,11 +84,12 @@ class DynamicModelFactory:
             ValueError: If schema contains unsupported field types or validation rules
         """
         # Check cache first
-        cache_key = f"{schema.entity_type}_{schema.schema_version}"
+        cache_key = _schema_cache_key(schema)
         if cache_key in self._model_cache:
             return self._model_cache[cache_key]
 
-        # Collect all fields from the schema
+        # Collect all fields from the schema (names interned so the generated
+        # models share key objects with interned YAML input keys)
         field_definitions: dict[str, Any] = {}
         validators: dict[str, Any] = {}
 
@@ -99,7 +103,10 @@ class DynamicModelFactory:
                 validators[f"validate_{field_def.name}"] = self._create_enum_validator(
                     field_def.name, enum_values
                 )
-            field_definitions[field_def.name] = (field_type, Field(**field_constraints))
+            field_definitions[sys.intern(field_def.name)] = (
+                field_type,
+                Field(**field_constraints),
+            )
 
         # Process optional fields
         for field_def in schema.optional_fields:
@@ -112,7 +119,7 @@ class DynamicModelFactory:
                     field_def.name, enum_values
                 )
             # Make optional fields truly optional with default None
-            field_definitions[field_def.name] = (
+            field_definitions[sys.intern(field_def.name)] = (
                 field_type | None,
                 Field(default=None, **field_constraints),
             )
@@ -128,14 +135,14 @@ class DynamicModelFactory:
                     field_def.name, enum_values
                 )
             # Readonly fields are optional and typically set by the system
-            field_definitions[field_def.name] = (
+            field_definitions[sys.intern(field_def.name)] = (
                 field_type | None,
                 Field(default=None, **field_constraints),
             )
 
         # Process relationship fields (added as optional list[str] fields)
         for relationship in schema.relationships:
-            field_definitions[relationship.name] = (
+            field_definitions[sys.intern(relationship.name)] = (
                 list[str] | None,
                 Field(
                     default=None,
@@ -178,6 +185,17 @@ class DynamicModelFactory:
         Returns:
             Root model class that validates entire YAML files
         """
+        # Check cache first - the root model only depends on the entity models,
+        # which are themselves cached per schema content
+        cache_key = "_root:" + ",".join(
+            sorted(
+                f"{entity_type}={_schema_cache_key(schema)}"
+                for entity_type, schema in schemas.items()
+            )
+        )
+        if cache_key in self._model_cache:
+            return self._model_cache[cache_key]
+
         # First, create individual entity models
         entity_models = {}
         for entity_type, schema in schemas.items():
@@ -247,6 +265,8 @@ class DynamicModelFactory:
             __base__=RootBaseModel,
         )
 
+        # Cache and return
+        self._model_cache[cache_key] = KnowledgeGraphFile
         return KnowledgeGraphFile
 
     def create_models_from_schemas(
@@ -600,3 +620,33 @@ class DynamicModelFactory:
     def clear_cache(self) -> None:
         """Clear the model cache. Useful for testing or when schemas change."""
         self._model_cache.clear()
+
+
+def _schema_cache_key(schema: EntitySchema) -> str:
+    """Build the model cache key for an entity schema.
+
+    The key covers the full schema definition, not just its type and version,
+    so schema sets that differ in content never share generated models.
+
+    Args:
+        schema: The EntitySchema a model is generated from
+
+    Returns:
+        Cache key for models generated from this schema
+    """
+    digest = hashlib.blake2b(repr(schema).encode(), digest_size=16).hexdigest()
+    return f"{schema.entity_type}_{schema.schema_version}_{digest}"
+
+
+@cache
+def get_model_factory() -> DynamicModelFactory:
+    """Get the process-wide shared model factory.
+
+    Generated models are cached per schema content, so sharing
+    one factory lets every validator in the process reuse the same model
+    classes instead of regenerating its own copies.
+
+    Returns:
+        The shared DynamicModelFactory instance
+    """
+    return DynamicModelFactory()
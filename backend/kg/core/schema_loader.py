@@ -6,8 +6,15 @@ inheritance resolution and validation.
 """
 
 from abc import ABC, abstractmethod
-from datetime import UTC, datetime
+import asyncio
+import contextlib
+from datetime import UTC, date, datetime
+import hashlib
+import json
+import os
 from pathlib import Path
+import sys
+import tempfile
 from typing import Any
 import warnings
 
@@ -23,6 +30,195 @@ from .schema import (
     SchemaValidationError,
 )
 
+# Prefer the libyaml-backed loader; fall back to pure Python when unavailable
+_YamlLoader: type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# When set, schemas for the frozen directory come from the build-time snapshot
+# (see scripts/freeze_schemas.py) instead of being read from disk
+FROZEN_SCHEMAS_ENV = "KG_USE_FROZEN_SCHEMAS"
+
+# JSON snapshot written by scripts/freeze_schemas.py
+FROZEN_SCHEMAS_FILE = Path(__file__).with_name("_frozen_schemas.json")
+
+# Parsed schema data is cached here as JSON by load_schemas_cached(), keyed by
+# schema_signature(); honours XDG_CACHE_HOME like other CLI tools
+SCHEMA_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "rh-kg"
+)
+
+# When set, load_schemas_cached() neither reads nor writes the schema cache
+NO_SCHEMA_CACHE_ENV = "KG_NO_SCHEMA_CACHE"
+
+# Modules that shape the cached schema data and the schemas built from it;
+# edits to them must invalidate cached schemas
+_SCHEMA_CODE_FILES = (Path(__file__), Path(__file__).with_name("schema.py"))
+
+
+def _intern_keys(value: Any) -> Any:
+    """Recursively intern the string keys of parsed YAML mappings.
+
+    Schema field and entity names are looked up repeatedly during model
+    generation and validation; interning lets those lookups hit identical
+    string objects.
+
+    Args:
+        value: Parsed YAML value (mapping, sequence or scalar)
+
+    Returns:
+        The same structure with all mapping keys interned
+    """
+    if isinstance(value, dict):
+        return {
+            sys.intern(k) if isinstance(k, str) else k: _intern_keys(v)
+            for k, v in value.items()
+        }
+    if isinstance(value, list):
+        return [_intern_keys(item) for item in value]
+    return value
+
+
+def _read_schema_file(path: Path) -> dict[str, Any]:
+    """Read and parse a schema YAML file.
+
+    libyaml parses the raw bytes directly; mapping keys are interned.
+
+    Args:
+        path: Schema file to read
+
+    Returns:
+        Parsed schema data
+    """
+    schema_data: dict[str, Any] = _intern_keys(
+        yaml.load(path.read_bytes(), Loader=_YamlLoader)
+    )
+    return schema_data
+
+
+def _encode_json_value(value: Any) -> Any:
+    """Tag the YAML scalars that JSON has no type for.
+
+    Args:
+        value: Value json.dumps() could not serialise
+
+    Returns:
+        Single-key mapping that _decode_json_object() turns back into value
+
+    Raises:
+        TypeError: If the value has no JSON representation
+    """
+    # YAML timestamps (e.g. ``2024-01-01``) parse to date/datetime objects
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+    if isinstance(value, date):
+        return {"$date": value.isoformat()}
+    raise TypeError(f"Cannot serialise schema value of type {type(value).__name__}")
+
+
+def _decode_json_object(obj: dict[str, Any]) -> Any:
+    """Restore tagged values and intern keys while decoding schema JSON.
+
+    Args:
+        obj: Decoded JSON object
+
+    Returns:
+        The tagged date/datetime, or obj with its keys interned
+    """
+    if len(obj) == 1:
+        if "$datetime" in obj:
+            return datetime.fromisoformat(obj["$datetime"])
+        if "$date" in obj:
+            return date.fromisoformat(obj["$date"])
+    return {sys.intern(k): v for k, v in obj.items()}
+
+
+def dump_schema_data(
+    schema_dir: Path,
+    base_schemas: dict[str, dict[str, Any]],
+    entity_schemas: dict[str, dict[str, Any]],
+) -> bytes:
+    """Serialise raw schema data for the schema cache and frozen snapshot.
+
+    Args:
+        schema_dir: Directory the data was read from
+        base_schemas: Base schema data keyed by name
+        entity_schemas: Entity schema data keyed by entity type
+
+    Returns:
+        UTF-8 encoded JSON document
+
+    Raises:
+        TypeError: If the data holds a value with no JSON representation
+    """
+    # Key order is kept: field order in the schema is significant
+    document = {
+        "schema_dir": str(schema_dir.resolve()),
+        "base_schemas": base_schemas,
+        "entity_schemas": entity_schemas,
+    }
+    return json.dumps(document, default=_encode_json_value).encode("utf-8")
+
+
+def _read_schema_data_file(path: Path) -> dict[str, Any]:
+    """Read a document written by dump_schema_data().
+
+    Args:
+        path: JSON file to read
+
+    Returns:
+        Document with ``schema_dir``, ``base_schemas`` and ``entity_schemas``
+    """
+    document: dict[str, Any] = json.loads(
+        path.read_bytes(), object_hook=_decode_json_object
+    )
+    return document
+
+
+def schema_signature(schema_dir: Path) -> str:
+    """Fingerprint a schema directory for cache invalidation.
+
+    Hashes the relative path, size and modification time of every schema
+    file, plus the schema code itself, so adding, removing or editing a
+    schema produces a new signature without reading any file contents.
+
+    Args:
+        schema_dir: Schema directory to fingerprint
+
+    Returns:
+        Hex digest identifying the current directory state
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{sys.version_info[:2]}".encode())
+    stats = [(path.name, path.stat()) for path in _SCHEMA_CODE_FILES]
+    stats += sorted(_scan_yaml_files(schema_dir), key=lambda item: item[0])
+    for name, stat in stats:
+        digest.update(f"{name}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def _scan_yaml_files(root: Path) -> list[tuple[str, os.stat_result]]:
+    """Stat every YAML file below a directory.
+
+    Walks the tree with ``os.scandir`` so directory checks come from the
+    dirent type rather than a separate ``stat`` per entry, as ``rglob`` does.
+
+    Args:
+        root: Directory to walk
+
+    Returns:
+        (path relative to ``root``, stat result) for each ``.yaml`` file
+    """
+    found: list[tuple[str, os.stat_result]] = []
+    pending = [("", os.fspath(root))]
+    while pending:
+        prefix, directory = pending.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append((f"{prefix}{entry.name}/", entry.path))
+                elif entry.name.endswith(".yaml"):
+                    found.append((f"{prefix}{entry.name}", entry.stat()))
+    return found
+
 
 class SchemaLoader(ABC):
     """Interface for loading and managing schemas."""
@@ -83,45 +279,68 @@ class FileSchemaLoader(SchemaLoader):
             SchemaValidationError: If schema validation fails
         """
         schema_path = Path(schema_dir) if schema_dir else self.schema_dir
+        schema_data = (
+            self._load_frozen_schema_data(schema_path)
+            if os.environ.get(FROZEN_SCHEMAS_ENV)
+            else None
+        )
+        if schema_data is None:
+            schema_data = await self._read_schema_data(schema_path)
 
-        if not schema_path.exists():
-            raise SchemaLoadError(f"Schema directory does not exist: {schema_path}")
+        return await self._build_checked_schemas(schema_path, *schema_data)
 
-        try:
-            # Load base schemas first
-            base_schemas = await self._load_base_schemas(schema_path)
-
-            # Load entity schemas
-            entity_schemas = await self._load_entity_schemas(schema_path, base_schemas)
-
-            # Warn if no entity schemas were loaded
-            if not entity_schemas:
-                warnings.warn(
-                    f"No entity schemas found in directory: {schema_path}. "
-                    "The knowledge graph will be empty until schema files are added.",
-                    UserWarning,
-                    stacklevel=2,
-                )
+    async def load_schemas_cached(
+        self, cache_dir: Path | None = None
+    ) -> dict[str, EntitySchema]:
+        """Load schemas, reusing cached schema data while the directory is unchanged.
 
-            # Validate consistency
-            errors = await self.validate_schema_consistency(entity_schemas)
-            if errors:
-                raise SchemaValidationError(
-                    f"Schema validation failed: {errors}", errors
-                )
+        The cache stores the parsed YAML as JSON and the schemas are rebuilt
+        from it, so no code is ever loaded from the cache. The file is keyed
+        by schema_signature(), so any change to the schema files is picked up
+        on the next call. Cache files that cannot be read or built from are
+        ignored and rewritten; failing to write the cache is not an error. Setting ``KG_NO_SCHEMA_CACHE`` bypasses the cache entirely.
 
-            self.schemas = entity_schemas
-            self.last_loaded = datetime.now(UTC)
+        Args:
+            cache_dir: Cache directory override (defaults to SCHEMA_CACHE_DIR)
 
-            return self.schemas
+        Returns:
+            Dictionary mapping entity types to their schemas
 
-        except (
-            yaml.YAMLError,
-            FileNotFoundError,
-            KeyError,
-            SchemaInheritanceError,
-        ) as e:
-            raise SchemaLoadError(f"Failed to load schemas: {e}") from e
+        Raises:
+            SchemaLoadError: If schema loading fails
+            SchemaValidationError: If schema validation fails
+        """
+        if (
+            os.environ.get(FROZEN_SCHEMAS_ENV)
+            or os.environ.get(NO_SCHEMA_CACHE_ENV)
+            or not self.schema_dir.exists()
+        ):
+            return await self.load_schemas()
+
+        cache_dir = cache_dir or SCHEMA_CACHE_DIR
+        cache_file = cache_dir / f"schemas-{schema_signature(self.schema_dir)}.json"
+
+        # Missing, corrupt or stale cache files are rebuilt from the YAML
+        with contextlib.suppress(Exception):
+            cached = _read_schema_data_file(cache_file)
+            return await self._build_checked_schemas(
+                self.schema_dir, cached["base_schemas"], cached["entity_schemas"]
+            )
+
+        schema_data = await self._read_schema_data(self.schema_dir)
+        schemas = await self._build_checked_schemas(self.schema_dir, *schema_data)
+
+        # Write atomically so concurrent invocations never read a partial file
+        with contextlib.suppress(OSError, TypeError):
+            document = dump_schema_data(self.schema_dir, *schema_data)
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                dir=cache_dir, suffix=".tmp", delete=False
+            ) as tmp:
+                tmp.write(document)
+            Path(tmp.name).replace(cache_file)
+
+        return schemas
 
     async def reload_schemas(self) -> dict[str, EntitySchema]:
         """Reload schemas from disk.
@@ -211,35 +430,80 @@ class FileSchemaLoader(SchemaLoader):
         if not base_dir.exists():
             return base_schemas
 
-        # Scan _base/ for subdirectories (each is a base schema type)
-        for base_schema_dir in base_dir.iterdir():
-            if not base_schema_dir.is_dir():
-                continue
+        # Scan _base/ for subdirectories (each is a base schema type) and load
+        # the latest version of each concurrently
+        entries = self._scan_subdirectories(base_dir)
+        results = await asyncio.gather(
+            *(self._load_latest_schema_version(Path(entry.path)) for entry in entries),
+            return_exceptions=True,
+        )
 
-            base_name = base_schema_dir.name
+        for entry, result in zip(entries, results, strict=True):
+            if isinstance(result, BaseException):
+                raise SchemaLoadError(
+                    f"Failed to load base schema '{entry.name}': {result}"
+                ) from result
+            base_schemas[entry.name] = result
+
+        return base_schemas
+
+    async def _load_entity_schema_data(
+        self, schema_path: Path
+    ) -> dict[str, dict[str, Any]]:
+        """Load the raw data of the latest version of each entity schema.
+
+        Args:
+            schema_path: Path to schema directory
+
+        Returns:
+            Dictionary mapping entity types to their unresolved schema data
+        """
+        entity_data: dict[str, dict[str, Any]] = {}
+
+        # Scan for subdirectories (each is an entity type), skipping _base
+        # (processed separately), and load their latest versions concurrently
+        entries = [
+            entry
+            for entry in self._scan_subdirectories(schema_path)
+            if not entry.name.startswith("_")
+        ]
+        results = await asyncio.gather(
+            *(self._load_latest_schema_version(Path(entry.path)) for entry in entries),
+            return_exceptions=True,
+        )
+
+        for entry, result in zip(entries, results, strict=True):
+            entity_type = entry.name
 
             try:
-                # Load latest version of this base schema
-                schema_data = await self._load_latest_schema_version(base_schema_dir)
-                base_schemas[base_name] = schema_data
+                if isinstance(result, BaseException):
+                    raise result
+
+                # Validate entity_type matches directory name
+                if result.get("entity_type") != entity_type:
+                    raise SchemaLoadError(
+                        f"Entity type mismatch in {entity_type}: "
+                        f"directory name is '{entity_type}' but schema defines '{result.get('entity_type')}'"
+                    )
+
+                entity_data[entity_type] = result
 
             except Exception as e:
                 raise SchemaLoadError(
-                    f"Failed to load base schema '{base_name}': {e}"
+                    f"Failed to load entity schema '{entity_type}': {e}"
                 ) from e
 
-        return base_schemas
+        return entity_data
 
-    async def _load_entity_schemas(
-        self, schema_path: Path, base_schemas: dict[str, dict[str, Any]]
+    async def _build_entity_schemas(
+        self,
+        entity_data: dict[str, dict[str, Any]],
+        base_schemas: dict[str, dict[str, Any]],
     ) -> dict[str, EntitySchema]:
-        """Load entity schema files from subdirectories and resolve inheritance.
-
-        Each subdirectory represents an entity type and contains versioned schema files.
-        Loads the latest version of each entity type.
+        """Resolve inheritance and convert raw entity data to EntitySchema objects.
 
         Args:
-            schema_path: Path to schema directory
+            entity_data: Unresolved schema data keyed by entity type
             base_schemas: Previously loaded base schemas
 
         Returns:
@@ -247,28 +511,8 @@ class FileSchemaLoader(SchemaLoader):
         """
         schemas = {}
 
-        # Scan for subdirectories (each is an entity type)
-        for entity_dir in schema_path.iterdir():
-            if not entity_dir.is_dir():
-                continue
-
-            # Skip _base directory (already processed)
-            if entity_dir.name.startswith("_"):
-                continue
-
-            entity_type = entity_dir.name
-
+        for entity_type, schema_data in entity_data.items():
             try:
-                # Load latest version of this entity schema
-                schema_data = await self._load_latest_schema_version(entity_dir)
-
-                # Validate entity_type matches directory name
-                if schema_data.get("entity_type") != entity_type:
-                    raise SchemaLoadError(
-                        f"Entity type mismatch in {entity_dir.name}: "
-                        f"directory name is '{entity_type}' but schema defines '{schema_data.get('entity_type')}'"
-                    )
-
                 # Resolve inheritance
                 resolved_schema = await self._resolve_inheritance(
                     schema_data, base_schemas
@@ -285,6 +529,127 @@ class FileSchemaLoader(SchemaLoader):
 
         return schemas
 
+    async def load_schema_data(
+        self, schema_dir: str | None = None
+    ) -> tuple[dict[str, dict[str, Any]], dict[str, dict[str, Any]]]:
+        """Load the raw, unresolved schema data from disk.
+
+        Used by ``scripts/freeze_schemas.py`` to snapshot the parsed YAML into
+        a JSON file at build time.
+
+        Args:
+            schema_dir: Optional override for schema directory
+
+        Returns:
+            Tuple of (base schema data, entity schema data), each keyed by name
+
+        Raises:
+            SchemaLoadError: If schema loading fails
+        """
+        schema_path = Path(schema_dir) if schema_dir else self.schema_dir
+        return await self._read_schema_data(schema_path)
+
+    async def _read_schema_data(
+        self, schema_path: Path
+    ) -> tuple[dict[str, dict[str, Any]], dict[str, dict[str, Any]]]:
+        """Read base and entity schema files concurrently.
+
+        Args:
+            schema_path: Schema directory to read
+
+        Returns:
+            Tuple of (base schema data, entity schema data), each keyed by name
+
+        Raises:
+            SchemaLoadError: If a schema file cannot be read or parsed
+        """
+        if not schema_path.exists():
+            raise SchemaLoadError(f"Schema directory does not exist: {schema_path}")
+
+        try:
+            return await asyncio.gather(
+                self._load_base_schemas(schema_path),
+                self._load_entity_schema_data(schema_path),
+            )
+        except (yaml.YAMLError, FileNotFoundError, KeyError) as e:
+            raise SchemaLoadError(f"Failed to load schemas: {e}") from e
+
+    async def _build_checked_schemas(
+        self,
+        schema_path: Path,
+        base_schemas: dict[str, dict[str, Any]],
+        entity_data: dict[str, dict[str, Any]],
+    ) -> dict[str, EntitySchema]:
+        """Resolve raw schema data and check the result for consistency.
+
+        Args:
+            schema_path: Directory the data came from, for messages
+            base_schemas: Base schema data keyed by name
+            entity_data: Entity schema data keyed by entity type
+
+        Returns:
+            Dictionary mapping entity types to their schemas
+
+        Raises:
+            SchemaLoadError: If inheritance cannot be resolved
+            SchemaValidationError: If schema validation fails
+        """
+        try:
+            entity_schemas = await self._build_entity_schemas(entity_data, base_schemas)
+        except (KeyError, SchemaInheritanceError) as e:
+            raise SchemaLoadError(f"Failed to load schemas: {e}") from e
+
+        # Warn if no entity schemas were loaded
+        if not entity_schemas:
+            warnings.warn(
+                f"No entity schemas found in directory: {schema_path}. "
+                "The knowledge graph will be empty until schema files are added.",
+                UserWarning,
+                stacklevel=3,
+            )
+
+        # Validate consistency
+        errors = await self.validate_schema_consistency(entity_schemas)
+        if errors:
+            raise SchemaValidationError(f"Schema validation failed: {errors}", errors)
+
+        self.schemas = entity_schemas
+        self.last_loaded = datetime.now(UTC)
+
+        return self.schemas
+
+    @staticmethod
+    def _load_frozen_schema_data(
+        schema_path: Path,
+    ) -> tuple[dict[str, dict[str, Any]], dict[str, dict[str, Any]]] | None:
+        """Read the build-time snapshot of ``schema_path``, if there is one.
+
+        The snapshot records the directory it was frozen from; any other
+        directory is read from disk as usual.
+
+        Args:
+            schema_path: Schema directory being loaded
+
+        Returns:
+            Tuple of (base schema data, entity schema data), or None if the
+            snapshot was taken from a different directory
+
+        Raises:
+            SchemaLoadError: If the snapshot has not been generated
+        """
+        try:
+            frozen = _read_schema_data_file(FROZEN_SCHEMAS_FILE)
+        except (OSError, ValueError) as e:
+            raise SchemaLoadError(
+                f"{FROZEN_SCHEMAS_ENV} is set but {FROZEN_SCHEMAS_FILE.name} is "
+                "missing or unreadable; run scripts/freeze_schemas.py first"
+            ) from e
+
+        if frozen["schema_dir"] != str(schema_path.resolve()):
+            return None
+
+        return frozen["base_schemas"], frozen["entity_schemas"]
+
     async def _resolve_inheritance(
         self, schema_data: dict[str, Any], base_schemas: dict[str, dict[str, Any]]
     ) -> dict[str, Any]:
@@ -347,24 +712,26 @@ class FileSchemaLoader(SchemaLoader):
         version_files: list[tuple[tuple[int, int, int], Path]] = []
 
         # Find all .yaml files and parse their versions
-        for schema_file in schema_dir.glob("*.yaml"):
-            filename_version = self._parse_version_from_filename(schema_file.name)
-            if filename_version:
-                version_files.append((filename_version, schema_file))
+        with os.scandir(schema_dir) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                filename_version = self._parse_version_from_filename(entry.name)
+                if filename_version:
+                    version_files.append((filename_version, Path(entry.path)))
 
         if not version_files:
             raise SchemaLoadError(
                 f"No valid versioned schema files found in {schema_dir.name}/"
             )
 
-        # Sort by version (descending) and get latest
-        version_files.sort(reverse=True, key=lambda x: x[0])
-        latest_version, latest_file = version_files[0]
+        # Pick the latest version
+        latest_version, latest_file = max(version_files, key=lambda x: x[0])
 
         # Load and validate the latest version
         try:
-            with latest_file.open(encoding="utf-8") as f:
-                schema_data: dict[str, Any] = yaml.safe_load(f)
+            # Read and parse in a worker thread so the event loop stays free
+            schema_data = await asyncio.to_thread(_read_schema_file, latest_file)
 
             # Validate filename version matches schema_version in YAML
             self._validate_version_match(
@@ -380,6 +747,22 @@ class FileSchemaLoader(SchemaLoader):
                 f"Failed to load schema from {latest_file}: {e}"
             ) from e
 
+    @staticmethod
+    def _scan_subdirectories(path: Path) -> list[os.DirEntry[str]]:
+        """List the subdirectories of a schema directory.
+
+        Uses ``os.scandir`` so directory checks come from the cached dirent type
+        instead of a separate ``stat`` call per entry.
+
+        Args:
+            path: Directory to scan
+
+        Returns:
+            Directory entries for each subdirectory
+        """
+        with os.scandir(path) as entries:
+            return [entry for entry in entries if entry.is_dir()]
+
     def _parse_version_from_filename(
         self, filename: str
     ) -> tuple[int, int, int] | None:
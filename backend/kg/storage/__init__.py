@@ -13,6 +13,7 @@ from .factory import create_storage, test_storage_connection, validate_storage_c
 from .interface import StorageInterface
 from .mock import MockStorage
 from .models import (
+    BulkApplyResult,
     DryRunResult,
     EntityData,
     EntityOperation,
@@ -36,6 +37,7 @@ __all__ = [
     "test_storage_connection",
     "validate_storage_config",
     # Models
+    "BulkApplyResult",
     "DryRunResult",
     "EntityData",
     "EntityOperation",
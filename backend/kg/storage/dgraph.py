@@ -21,6 +21,7 @@ from .exceptions import (
 )
 from .interface import StorageInterface
 from .models import (
+    BulkApplyResult,
     DryRunResult,
     EntityCounts,
     EntityData,
@@ -56,7 +57,7 @@ class DgraphStorage(StorageInterface):
         """
         self.config = config
         self._client: pydgraph.DgraphClient | None = None
-        self._stub: Any = None
+        self._stubs: list[Any] = []
         self._schemas: dict[str, EntitySchema] = {}
         self._schema_version: str | None = None
         self._connected: bool = False
@@ -70,17 +71,28 @@ class DgraphStorage(StorageInterface):
                     "Initiating connection",
                     endpoint=self.config.endpoint,
                     use_tls=self.config.use_tls,
+                    pool_size=self.config.pool_size,
                 )
 
-                # Create gRPC stub
+                # Create gRPC stubs
                 if self.config.use_tls:
                     # TODO: Implement TLS support with client certificates
                     raise NotImplementedError("TLS support not yet implemented")
                 else:
-                    self._stub = pydgraph.DgraphClientStub(self.config.endpoint)
+                    # One stub per gRPC channel; the client spreads requests
+                    # across them so concurrent calls don't share one channel.
+                    # A local subchannel pool keeps gRPC from collapsing the
+                    # channels onto a single shared connection.
+                    self._stubs = [
+                        pydgraph.DgraphClientStub(
+                            self.config.endpoint,
+                            options=[("grpc.use_local_subchannel_pool", 1)],
+                        )
+                        for _ in range(self.config.pool_size)
+                    ]
 
                 # Create client
-                self._client = pydgraph.DgraphClient(self._stub)
+                self._client = pydgraph.DgraphClient(*self._stubs)
 
                 # Test connection with a simple query
                 start_time = time.time()
@@ -110,8 +122,9 @@ class DgraphStorage(StorageInterface):
     async def disconnect(self) -> None:
         """Close connection to Dgraph."""
         try:
-            if self._stub:
-                self._stub.close()
+            if self._stubs:
+                for stub in self._stubs:
+                    stub.close()
                 logger.info(
                     "Disconnected from Dgraph",
                     endpoint=self.config.endpoint,
@@ -123,7 +136,7 @@ class DgraphStorage(StorageInterface):
             )
         finally:
             self._client = None
-            self._stub = None
+            self._stubs = []
             self._connected = False
             self._connection_time = None
 
@@ -195,7 +208,7 @@ class DgraphStorage(StorageInterface):
 
                 # Load schemas from YAML files
                 schema_loader = FileSchemaLoader(schema_dir)
-                self._schemas = await schema_loader.load_schemas()
+                self._schemas = await schema_loader.load_schemas_cached()
 
                 op_logger.log_progress(
                     "Initializing Dgraph schema", schema_count=len(self._schemas)
@@ -230,7 +243,7 @@ class DgraphStorage(StorageInterface):
         # TODO: Store schema_dir in instance variable during load_schemas
         raise NotImplementedError("Schema reload not yet implemented")
 
-    async def store_entity(  # noqa: PLR0912, PLR0915
+    async def store_entity(
         self,
         entity_type: str,
         entity_id: str,
@@ -245,14 +258,9 @@ class DgraphStorage(StorageInterface):
             # Check if entity already exists
             existing_entity = await self.get_entity(entity_type, entity_id)
 
-            # Prepare mutation data
-            mutation_data = {
-                "dgraph.type": entity_type,
-                "id": entity_id,  # Use 'id' field as per schema definition
-                "entity_type": entity_type,
-                **entity_data,
-                "updated_at": datetime.now().isoformat(),
-            }
+            mutation_data, yaml_relationships = self._prepare_mutation(
+                entity_type, entity_id, entity_data, metadata
+            )
 
             if existing_entity:
                 # Update existing entity - find the UID
@@ -289,26 +297,6 @@ class DgraphStorage(StorageInterface):
                 mutation_data["created_at"] = datetime.now().isoformat()
                 logger.debug(f"Creating new entity {entity_type}/{entity_id}")
 
-            # Add metadata fields with prefixes to avoid conflicts
-            for key, value in metadata.items():
-                mutation_data[f"sys_{key}"] = value
-
-            # Extract relationship fields that need special processing
-            yaml_relationships = {}
-            schema = self._schemas.get(entity_type)
-            if schema:
-                for relationship in schema.relationships:
-                    rel_name = relationship.name
-                    if rel_name in entity_data:
-                        yaml_relationships[rel_name] = entity_data[rel_name]
-                        # Remove from entity data - we'll handle it separately
-                        mutation_data.pop(rel_name, None)
-
-                if yaml_relationships:
-                    logger.debug(
-                        f"Processing {len(yaml_relationships)} relationship types for {entity_id}: {list(yaml_relationships.keys())}"
-                    )
-
             # Create/update mutation
             txn = self._client.txn()
             try:
@@ -320,34 +308,42 @@ class DgraphStorage(StorageInterface):
                 action = "Updated" if existing_entity else "Created"
                 logger.info(f"{action} entity {entity_type}/{entity_id}")
 
-                # Process relationships after entity creation/update
-                if yaml_relationships:
-                    from .dependency_processor import DependencyProcessor
-
-                    dependency_processor = DependencyProcessor(self, self._schemas)
-
-                    success = await dependency_processor.process_entity_relationships(
-                        entity_type, entity_id, yaml_relationships
-                    )
-
-                    if success:
-                        logger.info(
-                            f"Successfully processed relationships for {entity_id}"
-                        )
-                    else:
-                        logger.warning(
-                            f"Some relationships failed to process for {entity_id}"
-                        )
-
-                return entity_id
-
             finally:
                 txn.discard()
 
+            # Process relationships after entity creation/update
+            if yaml_relationships:
+                await self._process_relationships(
+                    entity_type, entity_id, yaml_relationships
+                )
+
+            return entity_id
+
         except Exception as e:
             logger.error(f"Failed to store entity {entity_type}/{entity_id}: {e}")
             raise StorageOperationError(f"Entity storage failed: {e}") from e
 
+    async def bulk_apply(
+        self, entities: list[dict[str, Any]], batch_size: int = 1000
+    ) -> BulkApplyResult:
+        """Upsert entities in batches, committing one transaction per batch.
+
+        Existing UIDs for a whole batch are resolved with a single query and
+        every entity in the batch is written with a single mutation, instead
+        of two queries and a commit per entity. Relationships are processed
+        after each batch commits, as store_entity does.
+        """
+        if not self._connected or not self._client:
+            raise StorageConnectionError("Not connected to Dgraph")
+
+        operations: list[EntityOperation] = []
+        for start in range(0, len(entities), batch_size):
+            operations.extend(
+                await self._apply_batch(entities[start : start + batch_size])
+            )
+
+        return BulkApplyResult(operations=operations)
+
     async def get_entity(self, entity_type: str, entity_id: str) -> EntityData | None:
         """Retrieve entity from Dgraph."""
         if not self._connected or not self._client:
@@ -505,6 +501,17 @@ class DgraphStorage(StorageInterface):
             logger.error(f"Failed to list entities of type {entity_type}: {e}")
             raise StorageQueryError(f"Entity listing failed: {e}") from e
 
+    async def existing_ids(self, keys: list[tuple[str, str]]) -> set[tuple[str, str]]:
+        """Report which of the given entities exist, using a single query."""
+        if not self._connected or not self._client:
+            raise StorageConnectionError("Not connected to Dgraph")
+
+        if not keys:
+            return set()
+
+        existing = await self._find_existing_entities(keys, fields="")
+        return existing.keys() & set(keys)
+
     async def entity_exists(self, entity_id: str) -> bool:
         """Check if entity exists (for reference validation)."""
         if not self._connected or not self._client:
@@ -956,36 +963,27 @@ class DgraphStorage(StorageInterface):
                                     )
                                 )
 
+            result = DryRunResult(
+                would_create=would_create,
+                would_update=would_update,
+                would_delete=would_delete,
+                validation_issues=validation_issues,
+            )
+
             # Calculate summary
-            summary = {
+            result.summary = {
                 "total_operations": len(would_create)
                 + len(would_update)
                 + len(would_delete),
                 "create_count": len(would_create),
                 "update_count": len(would_update),
                 "delete_count": len(would_delete),
-                "validation_error_count": len(
-                    [issue for issue in validation_issues if issue.severity == "error"]
-                ),
-                "validation_warning_count": len(
-                    [
-                        issue
-                        for issue in validation_issues
-                        if issue.severity == "warning"
-                    ]
-                ),
-                "has_errors": any(
-                    issue.severity == "error" for issue in validation_issues
-                ),
+                "validation_error_count": result.error_count,
+                "validation_warning_count": result.warning_count,
+                "has_errors": result.has_errors,
             }
 
-            return DryRunResult(
-                would_create=would_create,
-                would_update=would_update,
-                would_delete=would_delete,
-                validation_issues=validation_issues,
-                summary=summary,
-            )
+            return result
 
         except Exception as e:
             logger.error(f"Dry-run simulation failed: {e}")
@@ -1040,6 +1038,192 @@ class DgraphStorage(StorageInterface):
                 backend_specific={"query": query},
             )
 
+    def _prepare_mutation(
+        self,
+        entity_type: str,
+        entity_id: str,
+        entity_data: dict[str, Any],
+        metadata: dict[str, Any],
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Build the mutation payload for an entity, without uid or created_at.
+
+        Returns:
+            Tuple of (mutation_data, yaml_relationships). Relationship fields
+            are split out because they are stored as edges, not predicates.
+        """
+        mutation_data = {
+            "dgraph.type": entity_type,
+            "id": entity_id,  # Use 'id' field as per schema definition
+            "entity_type": entity_type,
+            **entity_data,
+            "updated_at": datetime.now().isoformat(),
+        }
+
+        # Add metadata fields with prefixes to avoid conflicts
+        for key, value in metadata.items():
+            mutation_data[f"sys_{key}"] = value
+
+        # Extract relationship fields that need special processing
+        yaml_relationships = {}
+        schema = self._schemas.get(entity_type)
+        if schema:
+            for relationship in schema.relationships:
+                rel_name = relationship.name
+                if rel_name in entity_data:
+                    yaml_relationships[rel_name] = entity_data[rel_name]
+                    # Remove from entity data - we'll handle it separately
+                    mutation_data.pop(rel_name, None)
+
+            if yaml_relationships:
+                logger.debug(
+                    f"Processing {len(yaml_relationships)} relationship types for {entity_id}: {list(yaml_relationships.keys())}"
+                )
+
+        return mutation_data, yaml_relationships
+
+    async def _process_relationships(
+        self, entity_type: str, entity_id: str, yaml_relationships: dict[str, Any]
+    ) -> None:
+        """Create relationship edges for a stored entity."""
+        from .dependency_processor import DependencyProcessor
+
+        dependency_processor = DependencyProcessor(self, self._schemas)
+
+        success = await dependency_processor.process_entity_relationships(
+            entity_type, entity_id, yaml_relationships
+        )
+
+        if success:
+            logger.info(f"Successfully processed relationships for {entity_id}")
+        else:
+            logger.warning(f"Some relationships failed to process for {entity_id}")
+
+    async def _find_existing_entities(
+        self, keys: list[tuple[str, str]], fields: str = "uid created_at"
+    ) -> dict[tuple[str, str], dict[str, Any]]:
+        """Look up already-stored entities with a single query.
+
+        Args:
+            keys: (entity_type, entity_id) pairs to look up
+            fields: Extra predicates to return for each match
+
+        Returns:
+            Mapping of (entity_type, entity_id) to the requested fields.
+            When duplicates exist the first match wins, as in store_entity.
+        """
+        entity_ids = sorted({entity_id for _, entity_id in keys})
+        query = f"""
+        {{
+            entity(func: eq(id, {json.dumps(entity_ids)})) {{
+                id
+                entity_type
+                {fields}
+            }}
+        }}
+        """
+
+        result = await self._execute_query(query)
+        if not result.success:
+            raise StorageQueryError(
+                f"Existing entity lookup failed: {result.error_message}"
+            )
+
+        existing: dict[tuple[str, str], dict[str, Any]] = {}
+        for entity_info in result.data.get("entity", []):
+            key = (entity_info.get("entity_type", ""), entity_info.get("id", ""))
+            existing.setdefault(key, entity_info)
+        return existing
+
+    async def _apply_batch(self, batch: list[dict[str, Any]]) -> list[EntityOperation]:
+        """Upsert one batch of entities in a single transaction."""
+        if not self._client:
+            raise StorageConnectionError("Not connected to Dgraph")
+
+        try:
+            existing = await self._find_existing_entities(
+                [(entity["entity_type"], entity["entity_id"]) for entity in batch]
+            )
+
+            mutations: list[dict[str, Any]] = []
+            # Blank node label of each entity's first occurrence, else None
+            blank_labels: list[str | None] = []
+            pending_relationships: list[tuple[str, str, dict[str, Any]]] = []
+            for entity in batch:
+                entity_type = entity["entity_type"]
+                entity_id = entity["entity_id"]
+                mutation_data, yaml_relationships = self._prepare_mutation(
+                    entity_type,
+                    entity_id,
+                    entity["metadata"],
+                    entity["system_metadata"],
+                )
+
+                key = (entity_type, entity_id)
+                entity_info = existing.get(key)
+                if entity_info is None:
+                    # New entity - a blank node lets repeats in the batch merge
+                    label = f"entity{len(mutations)}"
+                    blank_labels.append(label)
+                    mutation_data["uid"] = f"_:{label}"
+                    mutation_data["created_at"] = datetime.now().isoformat()
+                    existing[key] = {
+                        "uid": mutation_data["uid"],
+                        "created_at": mutation_data["created_at"],
+                    }
+                else:
+                    blank_labels.append(None)
+                    mutation_data["uid"] = entity_info["uid"]
+                    # Preserve original created_at timestamp
+                    if entity_info.get("created_at"):
+                        mutation_data["created_at"] = entity_info["created_at"]
+
+                mutations.append(mutation_data)
+                if yaml_relationships:
+                    pending_relationships.append(
+                        (entity_type, entity_id, yaml_relationships)
+                    )
+
+            txn = self._client.txn()
+            try:
+                json_data = json.dumps(mutations).encode("utf-8")
+                response = txn.mutate(pydgraph.Mutation(set_json=json_data))
+                txn.commit()
+            finally:
+                txn.discard()
+
+            # Dgraph reports a uid for every blank node it allocated, i.e. for
+            # each entity the mutation created; every other row was an update
+            operations = [
+                EntityOperation(
+                    entity_type=entity["entity_type"],
+                    entity_id=entity["entity_id"],
+                    operation_type=(
+                        "create"
+                        if label is not None and label in response.uids
+                        else "update"
+                    ),
+                )
+                for entity, label in zip(batch, blank_labels, strict=True)
+            ]
+            created = sum(op.operation_type == "create" for op in operations)
+
+            logger.info(
+                "Applied entity batch",
+                entities_created=created,
+                entities_updated=len(batch) - created,
+            )
+
+            for entity_type, entity_id, yaml_relationships in pending_relationships:
+                await self._process_relationships(
+                    entity_type, entity_id, yaml_relationships
+                )
+
+            return operations
+
+        except Exception as e:
+            logger.error(f"Failed to apply entity batch: {e}")
+            raise StorageOperationError(f"Bulk entity storage failed: {e}") from e
+
     async def _initialize_dgraph_schema(self) -> None:  # noqa: PLR0912
         """Initialize Dgraph schema from loaded entity schemas."""
         if not self._client:
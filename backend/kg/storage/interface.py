@@ -5,18 +5,24 @@ Pydantic models for all return types, ensuring type safety and clear contracts.
 """
 
 from abc import ABC, abstractmethod
+import asyncio
 from typing import Any
 
 from ..core import EntitySchema
 from .models import (
+    BulkApplyResult,
     DryRunResult,
     EntityData,
+    EntityOperation,
     HealthCheckResult,
     QueryResult,
     RelationshipData,
     SystemMetrics,
 )
 
+# Upper bound on concurrent get_entity probes issued by existing_ids
+_PROBE_CONCURRENCY = 64
+
 
 class StorageInterface(ABC):
     """Abstract interface for knowledge graph storage operations.
@@ -113,6 +119,91 @@ class StorageInterface(ABC):
         """
         pass
 
+    async def bulk_apply(
+        self,
+        entities: list[dict[str, Any]],
+        batch_size: int = 1000,
+    ) -> BulkApplyResult:
+        """Store or update many entities, recording whether each was created.
+
+        The default implementation works through ``batch_size`` entities at
+        a time: it looks up which of them already exist with existing_ids(),
+        then stores them one at a time. Backends that can upsert several
+        entities per round trip should override it and commit ``batch_size``
+        entities per transaction.
+
+        Args:
+            entities: Entities as extracted from YAML, each with
+                ``entity_type``, ``entity_id``, ``metadata`` and
+                ``system_metadata`` keys
+            batch_size: Maximum number of entities committed together
+
+        Returns:
+            BulkApplyResult with the create or update outcome of each entity
+
+        Raises:
+            StorageOperationError: If storage operation fails
+        """
+        # Entities stored by this call; repeats in the input are updates
+        stored: set[tuple[str, str]] = set()
+        operations: list[EntityOperation] = []
+        for start in range(0, len(entities), batch_size):
+            batch = entities[start : start + batch_size]
+            existing = await self.existing_ids(
+                [(entity["entity_type"], entity["entity_id"]) for entity in batch]
+            )
+
+            for entity in batch:
+                entity_type = entity["entity_type"]
+                entity_id = entity["entity_id"]
+
+                await self.store_entity(
+                    entity_type,
+                    entity_id,
+                    entity["metadata"],
+                    entity["system_metadata"],
+                )
+
+                key = (entity_type, entity_id)
+                operations.append(
+                    EntityOperation(
+                        entity_type=entity_type,
+                        entity_id=entity_id,
+                        operation_type=(
+                            "update" if key in existing or key in stored else "create"
+                        ),
+                    )
+                )
+                stored.add(key)
+
+        return BulkApplyResult(operations=operations)
+
+    async def existing_ids(self, keys: list[tuple[str, str]]) -> set[tuple[str, str]]:
+        """Report which of the given entities are already stored.
+
+        The default implementation issues concurrent get_entity calls.
+        Backends should override it with a single query that returns only
+        the matching keys rather than full entity payloads.
+
+        Args:
+            keys: (entity_type, entity_id) pairs to look up
+
+        Returns:
+            The subset of ``keys`` that exist in storage
+
+        Raises:
+            StorageQueryError: If query execution fails
+        """
+        semaphore = asyncio.Semaphore(_PROBE_CONCURRENCY)
+
+        async def probe(key: tuple[str, str]) -> EntityData | None:
+            async with semaphore:
+                return await self.get_entity(*key)
+
+        unique_keys = list(dict.fromkeys(keys))
+        found = await asyncio.gather(*map(probe, unique_keys))
+        return {key for key, entity in zip(unique_keys, found, strict=True) if entity}
+
     @abstractmethod
     async def get_entity(self, entity_type: str, entity_id: str) -> EntityData | None:
         """Retrieve entity by type and ID.
@@ -143,6 +143,14 @@ class MockStorage(StorageInterface):
             system_metadata=entity_data.get("system_metadata", {}),
         )
 
+    async def existing_ids(self, keys: list[tuple[str, str]]) -> set[tuple[str, str]]:
+        """Report which of the given entities are stored in memory."""
+        return {
+            (entity_type, entity_id)
+            for entity_type, entity_id in keys
+            if entity_id in self.entities.get(entity_type, {})
+        }
+
     async def delete_entity(self, entity_type: str, entity_id: str) -> bool:
         """Delete entity from memory."""
         if entity_type in self.entities and entity_id in self.entities[entity_type]:
@@ -6,6 +6,7 @@ all storage operations, ensuring type safety and clear contracts.
 
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -97,7 +98,7 @@ class SystemMetrics(BaseModel):
 
 
 class EntityOperation(BaseModel):
-    """Represents an entity operation for dry-run results."""
+    """Represents an entity operation for dry-run and apply results."""
 
     entity_type: str
     entity_id: str
@@ -136,20 +137,57 @@ class DryRunResult(BaseModel):
         default_factory=dict, description="Summary of changes"
     )
 
+    @cached_property
+    def issues_by_severity(self) -> dict[str, list[ValidationIssue]]:
+        """Validation issues grouped by severity, partitioned in one pass."""
+        grouped: dict[str, list[ValidationIssue]] = {}
+        for issue in self.validation_issues:
+            grouped.setdefault(issue.severity, []).append(issue)
+        return grouped
+
+    @property
+    def errors(self) -> list[ValidationIssue]:
+        """Validation issues with error severity."""
+        return self.issues_by_severity.get("error", [])
+
+    @property
+    def warnings(self) -> list[ValidationIssue]:
+        """Validation issues with warning severity."""
+        return self.issues_by_severity.get("warning", [])
+
     @property
     def has_errors(self) -> bool:
         """Check if there are any validation errors."""
-        return any(issue.severity == "error" for issue in self.validation_issues)
+        return bool(self.errors)
 
     @property
     def error_count(self) -> int:
         """Count of validation errors."""
-        return sum(1 for issue in self.validation_issues if issue.severity == "error")
+        return len(self.errors)
 
     @property
     def warning_count(self) -> int:
         """Count of validation warnings."""
-        return sum(1 for issue in self.validation_issues if issue.severity == "warning")
+        return len(self.warnings)
+
+
+class BulkApplyResult(BaseModel):
+    """Result of a bulk apply operation."""
+
+    operations: list[EntityOperation] = Field(
+        default_factory=list,
+        description="Create or update outcome of each entity, in input order",
+    )
+
+    @property
+    def created_count(self) -> int:
+        """Number of entities that were created."""
+        return sum(op.operation_type == "create" for op in self.operations)
+
+    @property
+    def updated_count(self) -> int:
+        """Number of entities that were updated."""
+        return sum(op.operation_type == "update" for op in self.operations)
 
 
 class QueryResult(BaseModel):
@@ -186,6 +224,7 @@ class StorageConfig(BaseModel):
     timeout_seconds: int = Field(30, ge=1, le=300)
     max_retries: int = Field(3, ge=0, le=10)
     retry_delay_seconds: float = Field(1.0, ge=0.1, le=10.0)
+    pool_size: int = Field(1, ge=1, le=32, description="gRPC channels to open")
 
     # Authentication
     username: str | None = None
@@ -17,6 +17,16 @@ from .layers import (
     YamlSyntaxValidator,
 )
 
+# Structure errors that stop the pipeline before field format validation
+_CRITICAL_STRUCTURE_ERROR_TYPES = frozenset(
+    {"missing_required_field", "unsupported_schema_version"}
+)
+
+
+def _error_limit_reached(errors: list[ValidationError], max_errors: int | None) -> bool:
+    """Check whether enough errors were collected to stop validating."""
+    return max_errors is not None and len(errors) >= max_errors
+
 
 class KnowledgeGraphValidator:
     """Main validator that orchestrates all validation layers.
@@ -50,106 +60,75 @@ class KnowledgeGraphValidator:
         self.business_validator = BusinessLogicValidator(entity_schemas)
         self.reference_validator = ReferenceValidator(storage)
 
-    async def validate(self, content: str) -> ValidationResult:
+    async def validate(
+        self, content: str, max_errors: int | None = None
+    ) -> ValidationResult:
         """
         Perform complete validation of YAML content.
 
         Implements the multi-layer validation pipeline with early exit
         for critical failures as specified in the validation specification.
+        Layers 1-4 run synchronously; only the optional reference validation
+        layer awaits the storage backend.
 
         Args:
             content: The YAML content to validate
+            max_errors: Stop after this many errors have been collected,
+                skipping the remaining layers (default: collect all errors)
 
         Returns:
             ValidationResult with all errors, warnings, and validated model
         """
-        errors: list[ValidationError] = []
-        warnings: list[ValidationWarning] = []
-
         # Layer 1: YAML Syntax Validation
         # Critical failure - must exit immediately if YAML is invalid
         is_valid_yaml, data, yaml_errors = self.yaml_validator.validate(content)
-        if not is_valid_yaml:
+        if not is_valid_yaml or data is None:
             return ValidationResult(
-                is_valid=False, errors=yaml_errors, warnings=warnings, model=None
+                is_valid=False, errors=yaml_errors, warnings=[], model=None
             )
 
-        # Layer 2: Schema Structure Validation
-        # Critical failure for missing required fields or unsupported versions
-        if data is not None:
-            structure_errors = self.structure_validator.validate(data)
-        else:
-            structure_errors = []
-        errors.extend(structure_errors)
-
-        # Check for critical structure errors that should stop validation
-        critical_structure_errors = [
-            error
-            for error in structure_errors
-            if error.type in ["missing_required_field", "unsupported_schema_version"]
-        ]
-
-        if critical_structure_errors:
-            return ValidationResult(
-                is_valid=False, errors=errors, warnings=warnings, model=None
-            )
+        return await self.validate_parsed(data, max_errors=max_errors)
 
-        # Layer 3: Field Format Validation
-        # Continue validation to collect all format errors
-        if data is not None:
-            model, format_errors = self.format_validator.validate(data)
-        else:
-            model, format_errors = None, []
-        errors.extend(format_errors)
+    async def validate_parsed(
+        self, data: Any, max_errors: int | None = None
+    ) -> ValidationResult:
+        """
+        Perform complete validation of an already-parsed YAML document.
 
-        # If format validation failed, we cannot proceed to business logic
-        if not model:
-            return ValidationResult(
-                is_valid=False, errors=errors, warnings=warnings, model=None
-            )
+        Equivalent to validate() for callers that have parsed the file
+        themselves, so the document is not parsed a second time. Only the
+        empty-document check of Layer 1 applies; syntax errors must be
+        handled by the caller's own parse.
 
-        # Layer 4: Business Logic Validation
-        # Collect all business logic errors - don't exit early
-        business_errors = self.business_validator.validate(model)
+        Args:
+            data: The parsed YAML document
+            max_errors: Stop after this many errors have been collected,
+                skipping the remaining layers (default: collect all errors)
 
-        # Convert business logic errors that should be warnings in permissive mode
-        for error in business_errors:
-            if error.type == "multiple_owner_domains":
-                # This is more of a warning than an error
-                warnings.append(
-                    ValidationWarning(
-                        type=error.type,
-                        message=error.message,
-                        field=error.field,
-                        entity=error.entity,
-                        help=error.help,
-                    )
-                )
-            else:
-                errors.append(error)
+        Returns:
+            ValidationResult with all errors, warnings, and validated model
+        """
+        # Empty-document check and Layers 2-4, shared with validate_dict
+        model, errors, warnings, stopped_early = self._validate_layers(data, max_errors)
 
         # Layer 5: Reference Validation (if storage available)
         # Optional validation - only run if storage interface is provided
-        if self.storage:
-            reference_errors = await self.reference_validator.validate(model)
-            errors.extend(reference_errors)
-
-        # Determine final validation result
-        is_valid = len(errors) == 0
+        if model is not None and self.storage:
+            if _error_limit_reached(errors, max_errors):
+                stopped_early = True
+            else:
+                reference_errors = await self.reference_validator.validate(model)
+                errors.extend(reference_errors)
 
-        return ValidationResult(
-            is_valid=is_valid,
-            errors=errors,
-            warnings=warnings,
-            model=model if is_valid else None,
-        )
+        return self._build_result(model, errors, warnings, max_errors, stopped_early)
 
     def validate_sync(self, content: str) -> ValidationResult:
         """
         Synchronous version of validate that skips reference validation.
 
         This method performs validation without the optional reference
-        validation layer, making it suitable for synchronous usage.
+        validation layer, making it suitable for synchronous usage. It never
+        touches the event loop.
 
         Args:
             content: The YAML content to validate
@@ -157,52 +136,92 @@ class KnowledgeGraphValidator:
         Returns:
             ValidationResult with all errors, warnings, and validated model
         """
-        errors: list[ValidationError] = []
-        warnings: list[ValidationWarning] = []
-
         # Layer 1: YAML Syntax Validation
         is_valid_yaml, data, yaml_errors = self.yaml_validator.validate(content)
-        if not is_valid_yaml:
+        if not is_valid_yaml or data is None:
             return ValidationResult(
-                is_valid=False, errors=yaml_errors, warnings=warnings, model=None
+                is_valid=False, errors=yaml_errors, warnings=[], model=None
             )
 
+        return self.validate_dict(data)
+
+    def validate_dict(self, data: Any) -> ValidationResult:
+        """
+        Validate already-parsed YAML data, skipping syntax validation.
+
+        Synchronous counterpart of validate_parsed(): callers that have
+        parsed the document themselves do not pay for a second parse, and
+        empty documents are rejected the same way. Like validate_sync, the
+        optional reference validation layer is skipped.
+
+        Args:
+            data: The parsed YAML document
+
+        Returns:
+            ValidationResult with all errors, warnings, and validated model
+        """
+        # Skip Layer 5 (Reference Validation) in synchronous mode
+        return self._build_result(*self._validate_layers(data)[:3])
+
+    def _validate_layers(
+        self, data: Any, max_errors: int | None = None
+    ) -> tuple[Any | None, list[ValidationError], list[ValidationWarning], bool]:
+        """Run the synchronous validation layers on parsed data.
+
+        Applies the empty-document check of Layer 1, then Layers 2-4. This
+        is the single implementation behind validate_parsed() and
+        validate_dict().
+
+        Args:
+            data: The parsed YAML document
+            max_errors: Skip the remaining layers once this many errors
+                have been collected
+
+        Returns:
+            Tuple of (model, errors, warnings, stopped_early). The model is
+            None when validation stopped before business logic validation;
+            stopped_early is True when a layer was skipped for max_errors.
+        """
+        errors: list[ValidationError] = []
+        warnings: list[ValidationWarning] = []
+
+        # Layer 1 (document check): syntax was handled by the caller's parse
+        document_errors = self.yaml_validator.validate_document(data)
+        if document_errors:
+            return None, document_errors, warnings, False
+
         # Layer 2: Schema Structure Validation
-        if data is not None:
-            structure_errors = self.structure_validator.validate(data)
-        else:
-            structure_errors = []
+        # Critical failure for missing required fields or unsupported versions
+        structure_errors = self.structure_validator.validate(data)
         errors.extend(structure_errors)
 
-        # Check for critical structure errors
-        critical_structure_errors = [
-            error
-            for error in structure_errors
-            if error.type in ["missing_required_field", "unsupported_schema_version"]
-        ]
-
-        if critical_structure_errors:
-            return ValidationResult(
-                is_valid=False, errors=errors, warnings=warnings, model=None
-            )
+        # Check for critical structure errors that should stop validation
+        if any(
+            error.type in _CRITICAL_STRUCTURE_ERROR_TYPES for error in structure_errors
+        ):
+            return None, errors, warnings, False
+        if _error_limit_reached(errors, max_errors):
+            return None, errors, warnings, True
 
         # Layer 3: Field Format Validation
-        if data is not None:
-            model, format_errors = self.format_validator.validate(data)
-        else:
-            model, format_errors = None, []
+        # Continue validation to collect all format errors
+        model, format_errors = self.format_validator.validate(data)
         errors.extend(format_errors)
 
+        # If format validation failed, we cannot proceed to business logic
         if not model:
-            return ValidationResult(
-                is_valid=False, errors=errors, warnings=warnings, model=None
-            )
+            return None, errors, warnings, False
+        if _error_limit_reached(errors, max_errors):
+            return None, errors, warnings, True
 
         # Layer 4: Business Logic Validation
+        # Collect all business logic errors - don't exit early
         business_errors = self.business_validator.validate(model)
 
+        # Convert business logic errors that should be warnings in permissive mode
         for error in business_errors:
             if error.type == "multiple_owner_domains":
+                # This is more of a warning than an error
                 warnings.append(
                     ValidationWarning(
                         type=error.type,
@@ -215,16 +234,41 @@ class KnowledgeGraphValidator:
             else:
                 errors.append(error)
 
-        # Skip Layer 5 (Reference Validation) in synchronous mode
+        return model, errors, warnings, False
 
-        # Determine final validation result
+    @staticmethod
+    def _build_result(
+        model: Any | None,
+        errors: list[ValidationError],
+        warnings: list[ValidationWarning],
+        max_errors: int | None = None,
+        stopped_early: bool = False,
+    ) -> ValidationResult:
+        """Build the final validation result from collected layer output.
+
+        Args:
+            model: Validated model, or None if validation stopped early
+            errors: All validation errors collected
+            warnings: All validation warnings collected
+            max_errors: Error limit validation ran with, if any
+            stopped_early: Whether a layer was skipped because of max_errors
+
+        Returns:
+            ValidationResult that only carries the model when valid
+        """
         is_valid = len(errors) == 0
+        # Truncated only if errors may be missing: a layer was skipped or
+        # errors beyond the limit are dropped
+        truncated = stopped_early or (
+            max_errors is not None and len(errors) > max_errors
+        )
 
         return ValidationResult(
             is_valid=is_valid,
-            errors=errors,
+            errors=errors[:max_errors] if truncated else errors,
             warnings=warnings,
             model=model if is_valid else None,
+            truncated=truncated,
         )
 
     def get_validator_info(self) -> dict[str, Any]:
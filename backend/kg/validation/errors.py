@@ -75,13 +75,16 @@ class ValidationResult:
     """Complete validation result.
 
     Contains the overall validation status, all errors and warnings found,
-    and the validated model if validation succeeded.
+    and the validated model if validation succeeded. ``truncated`` is set
+    when validation stopped at an error limit, in which case ``errors`` holds
+    only the first errors found.
     """
 
     is_valid: bool
     errors: list[ValidationError]
     warnings: list[ValidationWarning]
     model: Any | None = None
+    truncated: bool = False
 
     @property
     def error_count(self) -> int:
@@ -13,9 +13,15 @@ import yaml
 
 from kg.validation.validators import DependencyReferenceValidator
 
-from ..core import DynamicModelFactory, EntitySchema
+from ..core import EntitySchema, get_model_factory
 from .errors import ValidationError
 
+# Prefer the libyaml-backed loader; fall back to pure Python when unavailable
+_YamlLoader: type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Kebab-case namespace pattern, compiled once for the per-entity hot paths
+_NAMESPACE_RE = re.compile(r"^[a-z][a-z0-9_-]*[a-z0-9]$|^[a-z]$")
+
 
 class StorageInterface(Protocol):
     """Storage interface for reference validation."""
@@ -41,37 +47,63 @@ class YamlSyntaxValidator:
             Tuple of (is_valid, parsed_data, errors)
         """
         try:
-            data = yaml.safe_load(content)
-            if data is None:
-                return (
-                    False,
-                    None,
-                    [
-                        ValidationError(
-                            type="empty_yaml_content",
-                            message="YAML content is empty or contains only whitespace",
-                            help="Ensure the file contains valid YAML content",
-                        )
-                    ],
-                )
+            data = yaml.load(content, Loader=_YamlLoader)
+            errors = self.validate_document(data)
+            if errors:
+                return False, None, errors
             return True, data, []
         except yaml.YAMLError as e:
-            line = None
-            column = None
-
-            # Extract line and column information if available
-            if hasattr(e, "problem_mark") and e.problem_mark:
-                line = e.problem_mark.line + 1  # YAML uses 0-based indexing
-                column = e.problem_mark.column + 1
-
-            error = ValidationError(
-                type="yaml_syntax_error",
-                message=f"Invalid YAML syntax: {e}",
-                line=line,
-                column=column,
-                help="Ensure the file contains valid YAML syntax",
-            )
-            return False, None, [error]
+            return False, None, [self.syntax_error(e)]
+
+    @staticmethod
+    def syntax_error(exc: yaml.YAMLError) -> ValidationError:
+        """
+        Describe a YAML parse failure as a validation error.
+
+        Args:
+            exc: The error raised by the YAML parser
+
+        Returns:
+            A yaml_syntax_error with the problem's line and column, if known
+        """
+        line = None
+        column = None
+
+        # Extract line and column information if available
+        if hasattr(exc, "problem_mark") and exc.problem_mark:
+            line = exc.problem_mark.line + 1  # YAML uses 0-based indexing
+            column = exc.problem_mark.column + 1
+
+        return ValidationError(
+            type="yaml_syntax_error",
+            message=f"Invalid YAML syntax: {exc}",
+            line=line,
+            column=column,
+            help="Ensure the file contains valid YAML syntax",
+        )
+
+    def validate_document(self, data: Any) -> list[ValidationError]:
+        """
+        Validate an already-parsed YAML document.
+
+        Applies the Layer 1 checks that do not depend on the raw text, so
+        callers that parsed the file themselves get the same errors.
+
+        Args:
+            data: The parsed YAML document
+
+        Returns:
+            List of validation errors (empty if the document is usable)
+        """
+        if data is None:
+            return [
+                ValidationError(
+                    type="empty_yaml_content",
+                    message="YAML content is empty or contains only whitespace",
+                    help="Ensure the file contains valid YAML content",
+                )
+            ]
+        return []
 
 
 class SchemaStructureValidator:
@@ -114,7 +146,7 @@ class SchemaStructureValidator:
                         help='Example: namespace: "my-project"',
                     )
                 )
-            elif not re.match(r"^[a-z][a-z0-9_-]*[a-z0-9]$|^[a-z]$", namespace):
+            elif not _NAMESPACE_RE.match(namespace):
                 errors.append(
                     ValidationError(
                         type="invalid_namespace_format",
@@ -143,10 +175,28 @@ class SchemaStructureValidator:
 class FieldFormatValidator:
     """Validates field formats using dynamic schemas (Layer 3)."""
 
+    ERROR_TYPE_MAPPING: ClassVar[dict[str, str]] = {
+        "missing": "missing_required_field",
+        "value_error.email": "invalid_email_format",
+        "value_error.url": "invalid_url_format",
+        "value_error.list.min_items": "empty_required_array",
+        "list_type": "invalid_field_type",
+        "url_type": "invalid_field_type",
+        "type_error.str": "invalid_field_type",
+        "type_error.integer": "invalid_field_type",
+        "type_error.bool": "invalid_field_type",
+        "type_error.list": "invalid_field_type",
+        "value_error": "invalid_field_value",
+        "string_too_short": "field_too_short",
+        "string_too_long": "field_too_long",
+        "string_pattern_mismatch": "pattern_mismatch",
+        "too_short": "empty_required_array",
+    }
+
     def __init__(self, entity_schemas: dict[str, EntitySchema]):
         """Initialize with entity schemas."""
         self.entity_schemas = entity_schemas
-        self.model_factory = DynamicModelFactory()
+        self.model_factory = get_model_factory()
 
     def validate(
         self, data: dict[str, Any]
@@ -262,24 +312,7 @@ class FieldFormatValidator:
 
     def _map_error_type(self, pydantic_type: str) -> str:
         """Map Pydantic error types to our validation types."""
-        mapping = {
-            "missing": "missing_required_field",
-            "value_error.email": "invalid_email_format",
-            "value_error.url": "invalid_url_format",
-            "value_error.list.min_items": "empty_required_array",
-            "list_type": "invalid_field_type",
-            "url_type": "invalid_field_type",
-            "type_error.str": "invalid_field_type",
-            "type_error.integer": "invalid_field_type",
-            "type_error.bool": "invalid_field_type",
-            "type_error.list": "invalid_field_type",
-            "value_error": "invalid_field_value",
-            "string_too_short": "field_too_short",
-            "string_too_long": "field_too_long",
-            "string_pattern_mismatch": "pattern_mismatch",
-            "too_short": "empty_required_array",
-        }
-        return mapping.get(pydantic_type, "invalid_field_type")
+        return self.ERROR_TYPE_MAPPING.get(pydantic_type, "invalid_field_type")
 
     def _extract_context(
         self, location: tuple[Any, ...]
@@ -547,7 +580,7 @@ class BusinessLogicValidator:
         namespace, entity_name = ref_parts
 
         # Validate namespace format
-        if not re.match(r"^[a-z][a-z0-9_-]*[a-z0-9]$|^[a-z]$", namespace):
+        if not _NAMESPACE_RE.match(namespace):
             return ValidationError(
                 type="invalid_internal_namespace",
                 field="depends_on",
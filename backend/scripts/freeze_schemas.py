@@ -0,0 +1,52 @@
+"""Freeze the schema directory into a JSON snapshot.
+
+Loads the schemas with the regular ``FileSchemaLoader`` (including the
+consistency checks) and writes the parsed, unresolved schema data to
+``kg/core/_frozen_schemas.json``. The production image runs this at build
+time and sets ``KG_USE_FROZEN_SCHEMAS=1``, so workers loading the frozen
+directory read one JSON file instead of scanning and parsing YAML on every
+startup.
+
+Usage:
+    python scripts/freeze_schemas.py [SCHEMA_DIR] [OUTPUT]
+"""
+
+import asyncio
+import os
+from pathlib import Path
+import sys
+
+from kg.core.schema_loader import (
+    FROZEN_SCHEMAS_ENV,
+    FROZEN_SCHEMAS_FILE,
+    FileSchemaLoader,
+    dump_schema_data,
+)
+
+_BACKEND_DIR = Path(__file__).resolve().parent.parent
+_DEFAULT_SCHEMA_DIR = _BACKEND_DIR / "schemas"
+
+
+async def freeze(schema_dir: Path, output: Path) -> None:
+    """Validate the schemas in ``schema_dir`` and write them to ``output``.
+
+    Args:
+        schema_dir: Directory containing the schema YAML files
+        output: Path of the JSON file to generate
+    """
+    loader = FileSchemaLoader(str(schema_dir))
+
+    # Full load first so inconsistent schemas never get frozen
+    await loader.load_schemas()
+    base_schemas, entity_schemas = await loader.load_schema_data()
+
+    output.write_bytes(dump_schema_data(schema_dir, base_schemas, entity_schemas))
+    print(f"Froze {len(entity_schemas)} entity schemas into {output}")
+
+
+if __name__ == "__main__":
+    # Always freeze from disk, never from a previous snapshot
+    os.environ.pop(FROZEN_SCHEMAS_ENV, None)
+    schema_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_SCHEMA_DIR
+    output = Path(sys.argv[2]) if len(sys.argv) > 2 else FROZEN_SCHEMAS_FILE
+    asyncio.run(freeze(schema_dir, output))
@@ -628,3 +628,30 @@ class TestEndpointDataTypes:
         assert (
             len(data["environment"]["started_at"]) == 19
         )  # YYYY-MM-DDTHH:MM:SS format
+
+
+class TestHealthServiceDependency:
+    """Test the health service dependency provider."""
+
+    @pytest.mark.asyncio
+    async def test_health_service_reused_for_same_storage(self, mock_storage):
+        """Test that one service instance is shared while storage is unchanged."""
+        from kg.api.health.dependencies import get_health_service
+
+        service1 = await get_health_service(mock_storage)
+        service2 = await get_health_service(mock_storage)
+
+        assert service1 is service2
+        assert service1.storage is mock_storage
+
+    @pytest.mark.asyncio
+    async def test_health_service_rebuilt_when_storage_changes(self, mock_storage):
+        """Test that swapping the storage backend yields a fresh service."""
+        from kg.api.health.dependencies import get_health_service
+
+        service1 = await get_health_service(mock_storage)
+        other_storage = Mock(spec=StorageInterface)
+        service2 = await get_health_service(other_storage)
+
+        assert service1 is not service2
+        assert service2.storage is other_storage
@@ -13,7 +13,7 @@ from unittest.mock import AsyncMock, Mock, patch
 import pytest
 
 from kg.cli.apply import apply_command
-from kg.storage import StorageInterface
+from kg.storage import MockStorage, StorageInterface
 from kg.storage.models import EntityData, StorageConfig
 
 
@@ -53,6 +53,16 @@ def mock_storage_for_upsert():
 
     storage.get_entity = AsyncMock(side_effect=mock_get_entity)
     storage.store_entity = AsyncMock(side_effect=mock_store_entity)
+
+    # Bulk apply goes through the per-entity default implementations
+    async def mock_existing_ids(keys):
+        return await StorageInterface.existing_ids(storage, keys)
+
+    async def mock_bulk_apply(entities, batch_size=1000):
+        return await StorageInterface.bulk_apply(storage, entities, batch_size)
+
+    storage.existing_ids = AsyncMock(side_effect=mock_existing_ids)
+    storage.bulk_apply = AsyncMock(side_effect=mock_bulk_apply)
     storage.connect = AsyncMock()
     storage.load_schemas = AsyncMock(return_value={})
     storage.entity_exists = AsyncMock(return_value=True)
@@ -81,10 +91,10 @@ entity:
 def mock_apply_environment_upsert(mock_storage_for_upsert):
     """Set up mock environment for upsert testing."""
     with (
-        patch("kg.cli.apply.create_storage") as mock_create_storage,
-        patch("kg.cli.apply.FileSchemaLoader") as mock_schema_loader,
+        patch("kg.storage.create_storage") as mock_create_storage,
+        patch("kg.core.FileSchemaLoader") as mock_schema_loader,
         patch("kg.api.config.config") as mock_config,
-        patch("kg.cli.apply.KnowledgeGraphValidator") as mock_validator,
+        patch("kg.validation.KnowledgeGraphValidator") as mock_validator,
     ):
         # Setup config mock
         mock_config.storage = StorageConfig(
@@ -102,7 +112,7 @@ def mock_apply_environment_upsert(mock_storage_for_upsert):
         # Setup schema loader mocks
         mock_schema_loader_instance = Mock()
         mock_schema_loader.return_value = mock_schema_loader_instance
-        mock_schema_loader_instance.load_schemas = AsyncMock(return_value={})
+        mock_schema_loader_instance.load_schemas_cached = AsyncMock(return_value={})
 
         # Setup validator mock
         mock_validator_instance = Mock()
@@ -113,7 +123,7 @@ def mock_apply_environment_upsert(mock_storage_for_upsert):
         mock_validation_result.warnings = []
         mock_validation_result.error_count = 0
         mock_validation_result.warning_count = 0
-        mock_validator_instance.validate = AsyncMock(
+        mock_validator_instance.validate_parsed = AsyncMock(
             return_value=mock_validation_result
         )
 
@@ -241,6 +251,93 @@ entity:
             Path(temp_path2).unlink()
 
 
+class TestBulkApply:
+    """Test the default per-entity bulk_apply implementation."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_apply_counts_creates_and_updates(self):
+        """Test that existing and repeated entities are counted as updates."""
+        storage = MockStorage()
+        await storage.store_entity("repository", "ns/existing", {}, {})
+
+        entities = [
+            {
+                "entity_type": "repository",
+                "entity_id": entity_id,
+                "metadata": {"owners": ["test@example.com"]},
+                "system_metadata": {"namespace": "ns"},
+            }
+            for entity_id in ("ns/existing", "ns/new", "ns/new")
+        ]
+
+        assert await storage.existing_ids(
+            [("repository", "ns/existing"), ("repository", "ns/new")]
+        ) == {("repository", "ns/existing")}
+        result = await storage.bulk_apply(entities)
+        assert [op.operation_type for op in result.operations] == [
+            "update",
+            "create",
+            "update",
+        ]
+        assert (result.created_count, result.updated_count) == (1, 2)
+        assert set(storage.entities["repository"]) == {"ns/existing", "ns/new"}
+
+    @pytest.mark.asyncio
+    async def test_bulk_apply_looks_up_existing_ids_per_batch(self):
+        """Test that lookups are chunked by batch_size and repeats span batches."""
+        storage = MockStorage()
+        await storage.store_entity("repository", "ns/existing", {}, {})
+        lookups: list[list[tuple[str, str]]] = []
+        existing_ids = storage.existing_ids
+
+        async def record_existing_ids(keys):
+            lookups.append(keys)
+            return await existing_ids(keys)
+
+        storage.existing_ids = record_existing_ids
+
+        entities = [
+            {
+                "entity_type": "repository",
+                "entity_id": entity_id,
+                "metadata": {},
+                "system_metadata": {},
+            }
+            for entity_id in ("ns/a", "ns/existing", "ns/b", "ns/a", "ns/c")
+        ]
+
+        # ns/a is created in the first batch and repeated in the second
+        result = await storage.bulk_apply(entities, batch_size=2)
+        assert [op.operation_type for op in result.operations] == [
+            "create",
+            "update",
+            "create",
+            "update",
+            "create",
+        ]
+        assert [len(keys) for keys in lookups] == [2, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_default_existing_ids_probes_each_key_once(self):
+        """Test the get_entity based existing_ids fallback with repeated keys."""
+        storage = MockStorage()
+        await storage.store_entity("repository", "ns/existing", {}, {})
+        get_entity = AsyncMock(wraps=storage.get_entity)
+        storage.get_entity = get_entity
+
+        keys = [
+            ("repository", "ns/existing"),
+            ("repository", "ns/missing"),
+            ("repository", "ns/existing"),
+        ]
+
+        # MockStorage overrides existing_ids; exercise the interface default
+        assert await StorageInterface.existing_ids(storage, keys) == {
+            ("repository", "ns/existing")
+        }
+        assert get_entity.await_count == 2
+
+
 class TestDependencyProcessing:
     """Test that dependencies are properly processed into separate entities and relationships."""
 
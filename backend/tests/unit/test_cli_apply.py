@@ -13,7 +13,7 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from kg.cli.apply import apply_command
+from kg.cli.apply import _extract_entities_from_yaml, apply_command
 from kg.storage import (
     DryRunResult,
     HealthCheckResult,
@@ -33,8 +33,8 @@ from kg.storage.models import (
 def mock_apply_environment(mock_storage):
     """Set up complete mock environment for apply command testing."""
     with (
-        patch("kg.cli.apply.create_storage") as mock_create_storage,
-        patch("kg.cli.apply.FileSchemaLoader") as mock_schema_loader,
+        patch("kg.storage.create_storage") as mock_create_storage,
+        patch("kg.core.FileSchemaLoader") as mock_schema_loader,
         patch("kg.api.config.config") as mock_config,
     ):
         # Setup config mock
@@ -89,7 +89,7 @@ def mock_apply_environment(mock_storage):
 
         mock_schema_loader_instance = Mock()
         mock_schema_loader.return_value = mock_schema_loader_instance
-        mock_schema_loader_instance.load_schemas = AsyncMock(
+        mock_schema_loader_instance.load_schemas_cached = AsyncMock(
             return_value={"repository": mock_repository_schema}
         )
 
@@ -137,6 +137,16 @@ def mock_storage():
     # Default storage operations
     storage.store_entity = AsyncMock(return_value="test-id")
 
+    # Bulk apply goes through the per-entity default implementations
+    async def mock_existing_ids(keys):
+        return await StorageInterface.existing_ids(storage, keys)
+
+    async def mock_bulk_apply(entities, batch_size=1000):
+        return await StorageInterface.bulk_apply(storage, entities, batch_size)
+
+    storage.existing_ids = AsyncMock(side_effect=mock_existing_ids)
+    storage.bulk_apply = AsyncMock(side_effect=mock_bulk_apply)
+
     return storage
 
 
@@ -251,6 +261,41 @@ class TestApplyCommandBasics:
         assert call_args[6] is True  # verbose
 
 
+class TestEntityExtraction:
+    """Test conversion of parsed YAML into storage entities."""
+
+    def test_relationships_are_flattened_into_metadata(self):
+        """Test that relationship data is merged into entity metadata."""
+        entities = _extract_entities_from_yaml(
+            {
+                "namespace": "test-namespace",
+                "entity": {
+                    "repository": [
+                        {
+                            "test-repo": {
+                                "owners": ["test@example.com"],
+                                "relationships": {"depends_on": ["external://a/b/1"]},
+                            }
+                        },
+                        {"plain-repo": {"owners": ["test@example.com"]}},
+                    ]
+                },
+            }
+        )
+
+        assert [entity["entity_id"] for entity in entities] == [
+            "test-namespace/test-repo",
+            "test-namespace/plain-repo",
+        ]
+        assert entities[0]["metadata"] == {
+            "owners": ["test@example.com"],
+            "depends_on": ["external://a/b/1"],
+        }
+        assert entities[0]["relationships"] == {"depends_on": ["external://a/b/1"]}
+        assert entities[1]["metadata"] == {"owners": ["test@example.com"]}
+        assert entities[1]["relationships"] == {}
+
+
 class TestApplyValidation:
     """Test apply command validation functionality."""
 
@@ -316,6 +361,18 @@ class TestApplyValidation:
 class TestApplyDryRun:
     """Test apply command dry-run functionality."""
 
+    def test_dry_run_result_partitions_issues(self):
+        """Test that dry-run issues are split by severity."""
+        error = ValidationIssue(severity="error", message="broken")
+        warning = ValidationIssue(severity="warning", message="suspicious")
+        result = DryRunResult(validation_issues=[warning, error, warning])
+
+        assert result.errors == [error]
+        assert result.warnings == [warning, warning]
+        assert result.has_errors is True
+        assert (result.error_count, result.warning_count) == (1, 2)
+        assert DryRunResult().has_errors is False
+
     def test_dry_run_basic(self, mock_apply_environment, sample_valid_yaml):
         """Test basic dry-run functionality."""
         from click.testing import CliRunner
@@ -433,6 +490,14 @@ class TestApplyOutputFormats:
             assert output_data["status"] == "applied"
             assert "file" in output_data
             assert "summary" in output_data
+            # The mocked storage reports every entity as already stored
+            assert output_data["operations"] == [
+                {
+                    "entity_type": "repository",
+                    "entity_id": "test-namespace/test-repo",
+                    "operation": "updated",
+                }
+            ]
 
         finally:
             Path(temp_path).unlink()
@@ -487,8 +552,34 @@ class TestApplyOutputFormats:
 class TestApplyStorageIntegration:
     """Test apply command storage backend integration."""
 
-    @patch("kg.cli.apply.create_storage")
-    @patch("kg.cli.apply.FileSchemaLoader")
+    @pytest.mark.parametrize("dry_run", [False, True])
+    def test_apply_disconnects_storage(
+        self, mock_apply_environment, sample_valid_yaml, dry_run
+    ):
+        """Test that the storage connection is released when apply exits."""
+        from click.testing import CliRunner
+
+        mock_storage = mock_apply_environment["mock_storage"]
+        mock_storage.dry_run_apply = AsyncMock(return_value=DryRunResult())
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+            f.write(sample_valid_yaml)
+            temp_path = f.name
+
+        try:
+            runner = CliRunner()
+            args = [temp_path, "--dry-run"] if dry_run else [temp_path]
+            result = runner.invoke(apply_command, args)
+
+            assert result.exit_code == 0
+            mock_storage.connect.assert_awaited_once()
+            mock_storage.disconnect.assert_awaited_once()
+
+        finally:
+            Path(temp_path).unlink()
+
+    @patch("kg.storage.create_storage")
+    @patch("kg.core.FileSchemaLoader")
     def test_apply_storage_connection_failure(
         self, mock_schema_loader, mock_create_storage, sample_valid_yaml
     ):
@@ -499,7 +590,7 @@ class TestApplyStorageIntegration:
         mock_create_storage.side_effect = Exception("Connection failed")
         mock_schema_loader_instance = Mock()
         mock_schema_loader.return_value = mock_schema_loader_instance
-        mock_schema_loader_instance.load_schemas = AsyncMock(
+        mock_schema_loader_instance.load_schemas_cached = AsyncMock(
             return_value={"repository": Mock()}
         )
 
@@ -649,7 +740,7 @@ class TestApplyExitCodes:
         finally:
             Path(temp_path).unlink()
 
-    @patch("kg.cli.apply.create_storage")
+    @patch("kg.storage.create_storage")
     def test_exit_code_storage_failed(self, mock_create_storage, sample_valid_yaml):
         """Test exit code 3 for storage failure."""
         from click.testing import CliRunner
@@ -671,6 +762,31 @@ class TestApplyExitCodes:
         finally:
             Path(temp_path).unlink()
 
+    def test_exit_code_storage_misconfigured(self, monkeypatch, sample_valid_yaml):
+        """Test exit code 3 when the storage settings fail to load."""
+        import sys
+
+        from click.testing import CliRunner
+
+        # Force kg.api.config to be loaded again with the bad endpoint
+        monkeypatch.setenv("STORAGE_ENDPOINT", "missing-port")
+        monkeypatch.delitem(sys.modules, "kg.api.config", raising=False)
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+            f.write(sample_valid_yaml)
+            temp_path = f.name
+
+        try:
+            runner = CliRunner()
+            result = runner.invoke(apply_command, [temp_path])
+
+            assert result.exit_code == 3
+            assert "Storage connection failed" in result.output
+            assert "host:port" in result.output
+
+        finally:
+            Path(temp_path).unlink()
+
     def test_exit_code_success(self, mock_apply_environment, sample_valid_yaml):
         """Test exit code 0 for success."""
         from click.testing import CliRunner
@@ -280,6 +280,15 @@ entity:
         # Should show line information
         assert "line" in result.output.lower()
 
+    def test_empty_file_reports_validation_error(self, runner, temp_dir):
+        """Test an empty file is a validation failure, not an internal error."""
+        test_file = temp_dir / "empty.yaml"
+        test_file.write_text("")
+
+        result = runner.invoke(validate_command, [str(test_file)])
+        assert result.exit_code == 1
+        assert "empty_yaml_content" in result.output
+
     def test_validation_errors_show_helpful_context(self, runner, temp_dir):
         """Test validation errors include helpful context and suggestions."""
         invalid_yaml = """
@@ -0,0 +1,110 @@
+"""Unit tests for the API CORS middleware."""
+
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+import pytest
+
+from kg.api.cors import CORSOriginMiddleware
+
+ALLOWED_ORIGIN = "http://localhost:3000"
+
+
+def _make_client(allow_origins: set[str]) -> TestClient:
+    """Create a test client for a minimal app behind the CORS middleware."""
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping() -> dict[str, str]:
+        return {"status": "ok"}
+
+    @app.get("/varied")
+    async def varied() -> Response:
+        return Response(b"ok", headers={"Vary": "Accept-Encoding"})
+
+    app.add_middleware(CORSOriginMiddleware, allow_origins=allow_origins)
+    return TestClient(app)
+
+
+@pytest.fixture
+def client():
+    """Create a test client that allows ALLOWED_ORIGIN only."""
+    return _make_client({ALLOWED_ORIGIN})
+
+
+class TestCORSOriginMiddleware:
+    """Test CORS handling for allowed, disallowed and same-origin requests."""
+
+    def test_same_origin_request_untouched(self, client):
+        """Test that requests without an Origin header get no CORS headers."""
+        response = client.get("/ping")
+
+        assert response.status_code == 200
+        assert "access-control-allow-origin" not in response.headers
+
+    def test_allowed_origin_gets_cors_headers(self, client):
+        """Test that allowed origins are echoed back with credentials."""
+        response = client.get("/ping", headers={"Origin": ALLOWED_ORIGIN})
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "ok"}
+        assert response.headers["access-control-allow-origin"] == ALLOWED_ORIGIN
+        assert response.headers["access-control-allow-credentials"] == "true"
+        assert response.headers["vary"] == "Origin"
+
+    def test_disallowed_origin_gets_no_cors_headers(self, client):
+        """Test that other origins are served without CORS headers."""
+        response = client.get("/ping", headers={"Origin": "http://evil.example"})
+
+        assert response.status_code == 200
+        assert "access-control-allow-origin" not in response.headers
+
+    def test_preflight_allowed_origin(self, client):
+        """Test that preflight requests are answered without reaching the app."""
+        response = client.options(
+            "/ping",
+            headers={
+                "Origin": ALLOWED_ORIGIN,
+                "Access-Control-Request-Method": "POST",
+                "Access-Control-Request-Headers": "X-Custom",
+            },
+        )
+
+        assert response.status_code == 204
+        assert response.headers["access-control-allow-origin"] == ALLOWED_ORIGIN
+        assert "POST" in response.headers["access-control-allow-methods"]
+        assert response.headers["access-control-allow-headers"] == "X-Custom"
+
+    def test_preflight_disallowed_origin(self, client):
+        """Test that preflight requests from other origins are rejected."""
+        response = client.options(
+            "/ping",
+            headers={
+                "Origin": "http://evil.example",
+                "Access-Control-Request-Method": "POST",
+            },
+        )
+
+        assert response.status_code == 400
+        assert "access-control-allow-origin" not in response.headers
+
+    def test_existing_vary_header_is_extended(self, client):
+        """Test that Origin is merged into the app's Vary header."""
+        response = client.get("/varied", headers={"Origin": ALLOWED_ORIGIN})
+
+        assert response.headers.get_list("vary") == ["Accept-Encoding, Origin"]
+
+    def test_wildcard_allows_any_origin(self):
+        """Test that "*" allows every origin and echoes it back."""
+        client = _make_client({"*"})
+        origin = "http://anywhere.example"
+
+        response = client.get("/ping", headers={"Origin": origin})
+        assert response.headers["access-control-allow-origin"] == origin
+        assert response.headers["vary"] == "Origin"
+
+        response = client.options(
+            "/ping",
+            headers={"Origin": origin, "Access-Control-Request-Method": "GET"},
+        )
+        assert response.status_code == 204
+        assert response.headers["access-control-allow-origin"] == origin
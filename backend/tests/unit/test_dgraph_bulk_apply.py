@@ -0,0 +1,155 @@
+"""Unit tests for DgraphStorage.bulk_apply against a mocked pydgraph client.
+
+These cover the batching, create/update detection and payload construction
+without a running Dgraph instance.
+"""
+
+import json
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from kg.storage import DgraphStorage, StorageConfig, StorageOperationError
+
+
+def _entity(entity_id: str) -> dict[str, Any]:
+    """Build an entity as extracted from YAML."""
+    return {
+        "entity_type": "repository",
+        "entity_id": entity_id,
+        "metadata": {"owners": ["test@example.com"]},
+        "system_metadata": {"namespace": "ns"},
+    }
+
+
+class FakeDgraph:
+    """Mocked pydgraph client recording queries and mutations."""
+
+    def __init__(self, existing: list[dict[str, Any]], uids: list[dict[str, str]]):
+        """Create the fake client.
+
+        Args:
+            existing: Entities returned by every existing-entity lookup
+            uids: Allocated blank node uids returned by successive mutations
+        """
+        self.read_txn = MagicMock()
+        self.read_txn.query.return_value = MagicMock(
+            json=json.dumps({"entity": existing})
+        )
+        self.write_txn = MagicMock()
+        self.write_txn.mutate.side_effect = [MagicMock(uids=u) for u in uids]
+        self.client = MagicMock()
+        self.client.txn.side_effect = lambda read_only=False: (
+            self.read_txn if read_only else self.write_txn
+        )
+
+    def mutations(self) -> list[list[dict[str, Any]]]:
+        """Return the decoded set_json payload of each mutation."""
+        return [
+            json.loads(call.args[0].set_json)
+            for call in self.write_txn.mutate.call_args_list
+        ]
+
+
+def _storage(fake: FakeDgraph) -> DgraphStorage:
+    """Create a DgraphStorage that talks to the fake client."""
+    storage = DgraphStorage(
+        StorageConfig(backend_type="dgraph", endpoint="localhost:9080")
+    )
+    storage._client = fake.client
+    storage._connected = True
+    return storage
+
+
+@pytest.mark.asyncio
+class TestDgraphBulkApply:
+    """Test the batched Dgraph upsert path."""
+
+    async def test_created_counted_from_allocated_uids(self):
+        """Test that only entities whose blank node was allocated are creates."""
+        fake = FakeDgraph(
+            existing=[
+                {
+                    "uid": "0x1",
+                    "id": "ns/existing",
+                    "entity_type": "repository",
+                    "created_at": "2024-01-01T00:00:00",
+                }
+            ],
+            uids=[{"entity1": "0x2"}],
+        )
+
+        result = await _storage(fake).bulk_apply(
+            [_entity("ns/existing"), _entity("ns/new")]
+        )
+
+        assert [(op.entity_id, op.operation_type) for op in result.operations] == [
+            ("ns/existing", "update"),
+            ("ns/new", "create"),
+        ]
+        assert (result.created_count, result.updated_count) == (1, 1)
+        fake.write_txn.commit.assert_called_once()
+        fake.write_txn.discard.assert_called_once()
+
+    async def test_update_keeps_uid_and_created_at(self):
+        """Test that updates reuse the stored uid and original created_at."""
+        fake = FakeDgraph(
+            existing=[
+                {
+                    "uid": "0x1",
+                    "id": "ns/existing",
+                    "entity_type": "repository",
+                    "created_at": "2024-01-01T00:00:00",
+                }
+            ],
+            uids=[{}],
+        )
+
+        await _storage(fake).bulk_apply([_entity("ns/existing")])
+
+        (mutation,) = fake.mutations()
+        assert mutation[0]["uid"] == "0x1"
+        assert mutation[0]["created_at"] == "2024-01-01T00:00:00"
+        assert mutation[0]["owners"] == ["test@example.com"]
+        assert mutation[0]["sys_namespace"] == "ns"
+
+    async def test_repeated_keys_in_batch_are_merged(self):
+        """Test that repeats of a new entity share one blank node."""
+        fake = FakeDgraph(existing=[], uids=[{"entity0": "0x5"}])
+
+        result = await _storage(fake).bulk_apply([_entity("ns/new"), _entity("ns/new")])
+
+        (mutation,) = fake.mutations()
+        assert [row["uid"] for row in mutation] == ["_:entity0", "_:entity0"]
+        assert mutation[0]["created_at"] == mutation[1]["created_at"]
+        assert [op.operation_type for op in result.operations] == [
+            "create",
+            "update",
+        ]
+
+    async def test_commits_one_transaction_per_batch(self):
+        """Test that entities are looked up and committed batch_size at a time."""
+        fake = FakeDgraph(
+            existing=[], uids=[{"entity0": "0x1", "entity1": "0x2"}, {"entity0": "0x3"}]
+        )
+
+        result = await _storage(fake).bulk_apply(
+            [_entity("ns/a"), _entity("ns/b"), _entity("ns/c")], batch_size=2
+        )
+
+        assert [len(mutation) for mutation in fake.mutations()] == [2, 1]
+        assert fake.read_txn.query.call_count == 2
+        assert fake.write_txn.commit.call_count == 2
+        assert result.created_count == 3
+
+    async def test_failed_mutation_is_discarded(self):
+        """Test that a failing mutation raises and discards the transaction."""
+        fake = FakeDgraph(existing=[], uids=[])
+        fake.write_txn.mutate.side_effect = RuntimeError("mutation rejected")
+
+        with pytest.raises(StorageOperationError, match="mutation rejected"):
+            await _storage(fake).bulk_apply([_entity("ns/new")])
+
+        fake.write_txn.commit.assert_not_called()
+        fake.write_txn.discard.assert_called_once()
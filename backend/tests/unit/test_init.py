@@ -31,3 +31,90 @@ class TestPackageStructure:
     def test_api_module_import(self) -> None:
         """Test that API module can be imported."""
         from kg import api  # noqa: F401
+
+    def test_package_import_is_lazy(self) -> None:
+        """Test that importing the package does not eagerly load subpackages."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, kg; "
+            "print(sorted(m for m in sys.modules if m.startswith('kg.')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_subpackage_attribute_access(self) -> None:
+        """Test that subpackages resolve lazily as package attributes."""
+        import kg
+
+        assert kg.core.DynamicModelFactory is not None
+
+    def test_cli_commands_import_lazily(self) -> None:
+        """Test that the CLI imports a subcommand module only when dispatched."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "from click.testing import CliRunner\n"
+            "from kg.cli import main\n"
+            "CliRunner().invoke(main, ['schema', '--help'])\n"
+            "print(sorted(m for m in sys.modules if m.startswith('kg.cli.')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "['kg.cli.schema']"
+
+    def test_apply_help_skips_heavy_imports(self) -> None:
+        """Test that `kg apply --help` loads neither storage nor FastAPI."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "from click.testing import CliRunner\n"
+            "from kg.cli import main\n"
+            "CliRunner().invoke(main, ['apply', '--help'])\n"
+            "print(sorted(m for m in sys.modules if m.startswith("
+            "('kg.storage', 'kg.validation', 'kg.api', 'fastapi', 'yaml'))))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_schema_help_skips_heavy_imports(self) -> None:
+        """Test that `kg schema export --help` loads neither the core nor YAML."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "from click.testing import CliRunner\n"
+            "from kg.cli import main\n"
+            "CliRunner().invoke(main, ['schema', 'export', '--help'])\n"
+            "print(sorted(m for m in sys.modules if m.startswith("
+            "('kg.core', 'yaml', 'pydantic'))))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_core_import_is_lazy(self) -> None:
+        """Test that importing kg.core defers its component modules."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, kg.core; "
+            "print(sorted(m for m in sys.modules if m.startswith('kg.core.')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
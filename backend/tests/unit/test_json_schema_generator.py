@@ -12,7 +12,12 @@ import pytest_asyncio
 import yaml
 
 from kg.core.json_schema_generator import JSONSchemaExporter, JSONSchemaGenerator
-from kg.core.schema import EntitySchema, FieldDefinition, RelationshipDefinition
+from kg.core.schema import (
+    EntitySchema,
+    FieldDefinition,
+    RelationshipDefinition,
+    SchemaLoadError,
+)
 from kg.core.schema_loader import FileSchemaLoader
 
 
@@ -561,10 +566,11 @@ class TestJSONSchemaExporter:
 
             # Export schema
             exporter = JSONSchemaExporter(str(schema_dir))
-            await exporter.export(str(output_file), pretty=True)
+            _, bytes_written = await exporter.export(str(output_file), pretty=True)
 
             # Verify file exists and is valid JSON
             assert output_file.exists()
+            assert bytes_written == output_file.stat().st_size
 
             import json
 
@@ -641,6 +647,144 @@ class TestJSONSchemaExporter:
             lines = content.strip().split("\n")
             assert len(lines) == 1
 
+    def test_cli_export_skips_unchanged_schemas(self, monkeypatch):
+        """Test that re-exporting unchanged schemas reuses the existing file."""
+        from kg.cli import schema as schema_cli
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            schema_dir = Path(tmpdir) / "schemas"
+            base_internal_dir = schema_dir / "_base" / "base_internal"
+            base_internal_dir.mkdir(parents=True)
+            (base_internal_dir / "1.0.0.yaml").write_text(
+                yaml.dump(
+                    {
+                        "schema_type": "base_internal",
+                        "schema_version": "1.0.0",
+                        "governance": "strict",
+                        "readonly_metadata": {},
+                        "validation_rules": {},
+                        "deletion_policy": {"type": "reference_counted"},
+                        "allow_custom_fields": False,
+                    }
+                ),
+                encoding="utf-8",
+            )
+            output_file = Path(tmpdir) / "schema.json"
+
+            calls = []
+            original_export = JSONSchemaExporter.export
+
+            async def counting_export(self, output_path, pretty=True):
+                calls.append(output_path)
+                return await original_export(self, output_path, pretty=pretty)
+
+            monkeypatch.setattr(JSONSchemaExporter, "export", counting_export)
+
+            for _ in range(2):
+                schema_cli._export_schema(
+                    str(output_file), str(schema_dir), True, False, True
+                )
+            assert len(calls) == 1
+
+            # Changing the formatting options invalidates the cached export
+            schema_cli._export_schema(
+                str(output_file), str(schema_dir), False, False, True
+            )
+            assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_vscode_config_not_written_when_export_fails(
+        self, tmp_path, monkeypatch
+    ):
+        """Test that VSCode settings are only updated after a successful export."""
+        import asyncio
+        from unittest.mock import Mock
+
+        from kg.core import json_schema_generator
+
+        monkeypatch.chdir(tmp_path)
+        merge_settings = Mock()
+        monkeypatch.setattr(
+            json_schema_generator, "_merge_vscode_settings", merge_settings
+        )
+        exporter = JSONSchemaExporter(str(tmp_path / "missing-schemas"))
+
+        with pytest.raises(SchemaLoadError):
+            await exporter.export_with_vscode_config()
+
+        # Give any settings update started alongside the export time to run
+        await asyncio.sleep(0.1)
+        merge_settings.assert_not_called()
+
+    def test_vscode_settings_not_rewritten_when_unchanged(self, tmp_path, monkeypatch):
+        """Test that an existing identical schema mapping is left on disk."""
+        import os
+
+        from kg.cli import schema as schema_cli
+
+        monkeypatch.chdir(tmp_path)
+        settings_path = tmp_path / ".vscode" / "settings.json"
+
+        schema_cli._update_vscode_settings(".vscode/kg-schema.json", True)
+        os.utime(settings_path, ns=(0, 0))
+
+        schema_cli._update_vscode_settings(".vscode/kg-schema.json", True)
+        assert settings_path.stat().st_mtime_ns == 0
+
+        # A different schema path still updates the file
+        schema_cli._update_vscode_settings("docs/kg-schema.json", True)
+        assert settings_path.stat().st_mtime_ns != 0
+
+    def test_cli_plain_output_renders_markup(self, capsys):
+        """Test that non-terminal output drops markup styles but keeps data."""
+        from kg.cli import schema as schema_cli
+
+        printer = schema_cli._get_printer()  # stdout is captured, not a TTY
+        printer("✅ [green]Generated[/green] [bold cyan]schema[/bold cyan]")
+        printer("📁 Output: out/[draft]/schema.json", markup=False)
+        printer()
+
+        assert capsys.readouterr().out == (
+            "✅ Generated schema\n📁 Output: out/[draft]/schema.json\n\n"
+        )
+
+    def test_cli_quiet_output_skips_console(self, capsys, monkeypatch):
+        """Test that quiet mode never builds a Rich console."""
+        from kg.cli import schema as schema_cli
+
+        def fail_console(*args, **kwargs):
+            raise AssertionError("console created in quiet mode")
+
+        monkeypatch.setattr(schema_cli, "_get_console", fail_console)
+        schema_cli._get_printer(quiet=True)("[green]hidden[/green]")
+
+        assert capsys.readouterr().out == ""
+
+    def test_write_file_atomic_leaves_no_temp_files(self, tmp_path):
+        """Test that atomic writes replace the target and clean up."""
+        from kg.core.json_schema_generator import write_file_atomic
+
+        target = tmp_path / "nested" / "schema.json"
+        target.parent.mkdir()
+        target.write_bytes(b"old content")
+
+        assert write_file_atomic(target, b"{}") == 2
+        assert target.read_bytes() == b"{}"
+        assert [p.name for p in target.parent.iterdir()] == ["schema.json"]
+
+    def test_cli_warns_without_libyaml(self, tmp_path, monkeypatch, capsys):
+        """Test that regenerating without libyaml prints a speed warning."""
+        from kg.cli import schema as schema_cli
+
+        monkeypatch.setattr(yaml, "__with_libyaml__", False)
+        schema_dir = Path(__file__).parents[2] / "schemas"
+
+        schema_cli._export_schema(
+            str(tmp_path / "schema.json"), str(schema_dir), True, False, False
+        )
+
+        assert "built without libyaml" in capsys.readouterr().out
+
 
 class TestJSONSchemaValidation:
     """Test that generated JSON Schema validates YAML files correctly."""
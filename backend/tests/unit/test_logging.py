@@ -0,0 +1,62 @@
+"""Tests for structured logging configuration."""
+
+import logging
+from logging.handlers import QueueHandler
+
+import pytest
+
+from kg.core import configure_logging, shutdown_logging
+
+
+def _queue_handlers() -> list[logging.Handler]:
+    """Return the queue handlers installed on the root logger."""
+    return [h for h in logging.getLogger().handlers if isinstance(h, QueueHandler)]
+
+
+class TestConfigureLogging:
+    """Test the queue-based stdlib logging setup."""
+
+    @pytest.fixture(autouse=True)
+    def restore_logging(self):
+        """Remove the queue handler and restore the root level after each test."""
+        level = logging.getLogger().level
+        yield
+        shutdown_logging()
+        logging.getLogger().setLevel(level)
+
+    def test_reconfiguring_keeps_logging_working(self, capsys):
+        """Test that a second configure_logging() call still writes records."""
+        configure_logging()
+        configure_logging()
+
+        assert len(_queue_handlers()) == 1
+
+        logging.getLogger("kg.test").warning("still logging")
+        shutdown_logging()
+
+        assert "still logging" in capsys.readouterr().out
+
+    def test_shutdown_detaches_queue_handler(self):
+        """Test that shutdown_logging() removes the root queue handler."""
+        configure_logging()
+        shutdown_logging()
+
+        assert _queue_handlers() == []
+
+    @pytest.mark.asyncio
+    async def test_failed_startup_flushes_logs(self, capsys, monkeypatch):
+        """Test that a failing lifespan startup still writes its error log."""
+        from fastapi import FastAPI
+
+        from kg.api import main
+
+        def fail_create_storage(_config):
+            raise RuntimeError("storage unavailable")
+
+        monkeypatch.setattr(main, "create_storage", fail_create_storage)
+
+        with pytest.raises(RuntimeError, match="storage unavailable"):
+            await main.Lifespan(FastAPI()).__aenter__()
+
+        assert _queue_handlers() == []
+        assert "Failed to initialize storage" in capsys.readouterr().out
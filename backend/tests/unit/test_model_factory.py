@@ -1,5 +1,6 @@
 """Tests for the DynamicModelFactory."""
 
+from dataclasses import replace
 from datetime import datetime
 from typing import get_args, get_origin
 
@@ -11,6 +12,7 @@ from kg.core import (
     EntitySchema,
     FieldDefinition,
     RelationshipDefinition,
+    get_model_factory,
 )
 
 
@@ -418,6 +420,37 @@ class TestDynamicModelFactory:
         assert model1 is not model3
         assert model1.__name__ == model3.__name__
 
+    def test_root_model_caching(self, factory, basic_schema):
+        """Test that the root model is cached per set of schema definitions."""
+        schemas = {basic_schema.entity_type: basic_schema}
+
+        root1 = factory.create_root_model(schemas)
+        root2 = factory.create_root_model(dict(schemas))
+
+        # Same entity types and versions should reuse the cached root model
+        assert root1 is root2
+
+        # A different set of schemas gets its own root model
+        assert factory.create_root_model({}) is not root1
+
+        # Same type and version with different fields is a different schema set
+        extended_schema = replace(
+            basic_schema,
+            optional_fields=[
+                *basic_schema.optional_fields,
+                FieldDefinition(name="extra", type="string", required=False),
+            ],
+        )
+        extended_root = factory.create_root_model(
+            {extended_schema.entity_type: extended_schema}
+        )
+        assert extended_root is not root1
+        assert factory.create_root_model(schemas) is root1
+
+        # Clearing the cache forces regeneration
+        factory.clear_cache()
+        assert factory.create_root_model(schemas) is not root1
+
     def test_create_models_from_schemas(self, factory):
         """Test creating all models from a collection of schemas."""
         schemas = {
@@ -523,3 +556,36 @@ class TestDynamicModelFactory:
         with pytest.raises(ValueError) as exc_info:
             factory.create_entity_model(schema)
         assert "Unsupported field type: unsupported_type" in str(exc_info.value)
+
+    def test_shared_model_factory(self):
+        """Test that the shared factory is a single process-wide instance."""
+        shared = get_model_factory()
+
+        assert isinstance(shared, DynamicModelFactory)
+        assert get_model_factory() is shared
+
+    def test_shared_factory_separates_schema_sets(self, basic_schema):
+        """Test that schemas sharing type and version but not fields get own models."""
+        extended_schema = replace(
+            basic_schema,
+            required_fields=[
+                *basic_schema.required_fields,
+                FieldDefinition(
+                    name="extra",
+                    type="string",
+                    required=True,
+                    description="Field only the modified schema set requires",
+                ),
+            ],
+        )
+        data = {"name": "test", "count": 1}
+
+        # Validators built from different schema sets share the factory
+        shared = get_model_factory()
+        extended_model = shared.create_entity_model(extended_schema)
+        original_model = shared.create_entity_model(basic_schema)
+
+        assert original_model is not extended_model
+        assert original_model.model_validate(data).name == "test"
+        with pytest.raises(ValidationError, match="Field required"):
+            extended_model.model_validate(data)
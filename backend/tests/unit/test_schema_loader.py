@@ -4,21 +4,30 @@ Tests cover loading individual schema files, inheritance resolution,
 validation, error handling, and hot-reload capabilities.
 """
 
-from datetime import datetime
+from datetime import date, datetime
+import json
 from pathlib import Path
 import tempfile
 
 import pytest
+import pytest_asyncio
 import yaml
 
+from kg.core import schema_loader
 from kg.core.schema import (
     EntitySchema,
     FieldDefinition,
     RelationshipDefinition,
     SchemaLoadError,
     SchemaLoadResult,
+    SchemaValidationError,
+)
+from kg.core.schema_loader import (
+    FROZEN_SCHEMAS_ENV,
+    NO_SCHEMA_CACHE_ENV,
+    FileSchemaLoader,
+    dump_schema_data,
 )
-from kg.core.schema_loader import FileSchemaLoader
 
 
 class TestFieldDefinition:
@@ -238,6 +247,156 @@ class TestFileSchemaLoader:
         with pytest.raises(SchemaLoadError, match="Schema directory does not exist"):
             await loader.load_schemas()
 
+    @pytest_asyncio.fixture
+    async def frozen_schema_dir(self, temp_schema_dir, tmp_path, monkeypatch):
+        """Snapshot temp_schema_dir as scripts/freeze_schemas.py does."""
+        base_schemas, entity_schemas = await FileSchemaLoader(
+            str(temp_schema_dir)
+        ).load_schema_data()
+        frozen_file = tmp_path / "_frozen_schemas.json"
+        frozen_file.write_bytes(
+            dump_schema_data(temp_schema_dir, base_schemas, entity_schemas)
+        )
+        monkeypatch.setattr(schema_loader, "FROZEN_SCHEMAS_FILE", frozen_file)
+        monkeypatch.setenv(FROZEN_SCHEMAS_ENV, "1")
+        return temp_schema_dir
+
+    @pytest.mark.asyncio
+    async def test_load_frozen_schemas(self, frozen_schema_dir, monkeypatch):
+        """Test that frozen schema data replaces reading the directory."""
+        monkeypatch.delenv(FROZEN_SCHEMAS_ENV)
+        expected = await FileSchemaLoader(str(frozen_schema_dir)).load_schemas()
+        monkeypatch.setenv(FROZEN_SCHEMAS_ENV, "1")
+
+        loader = FileSchemaLoader(str(frozen_schema_dir))
+
+        async def fail_load(*args, **kwargs):
+            raise AssertionError("schema YAML was read despite the snapshot")
+
+        monkeypatch.setattr(loader, "_load_entity_schema_data", fail_load)
+        schemas = await loader.load_schemas()
+
+        assert schemas == expected
+        assert loader.last_loaded is not None
+
+    @pytest.mark.asyncio
+    async def test_frozen_schemas_ignored_for_other_directory(
+        self, frozen_schema_dir, tmp_path
+    ):
+        """Test that an explicit directory other than the frozen one is read."""
+        other_dir = tmp_path / "other"
+        other_dir.mkdir()
+
+        loader = FileSchemaLoader(str(frozen_schema_dir))
+        with pytest.warns(UserWarning, match="No entity schemas found"):
+            schemas = await loader.load_schemas(str(other_dir))
+
+        assert schemas == {}
+
+    @pytest.mark.asyncio
+    async def test_frozen_schemas_are_consistency_checked(
+        self, frozen_schema_dir, monkeypatch
+    ):
+        """Test that frozen schemas still go through validate_schema_consistency."""
+        loader = FileSchemaLoader(str(frozen_schema_dir))
+
+        async def report_error(schemas):
+            return ["inconsistent"]
+
+        monkeypatch.setattr(loader, "validate_schema_consistency", report_error)
+
+        with pytest.raises(SchemaValidationError):
+            await loader.load_schemas()
+
+    @pytest.mark.asyncio
+    async def test_load_schemas_cached(self, temp_schema_dir, tmp_path, monkeypatch):
+        """Test that cached schemas are reused until the directory changes."""
+        cache_dir = tmp_path / "cache"
+        expected = await FileSchemaLoader(str(temp_schema_dir)).load_schemas()
+
+        schemas = await FileSchemaLoader(str(temp_schema_dir)).load_schemas_cached(
+            cache_dir
+        )
+        assert schemas == expected
+        assert len(list(cache_dir.glob("schemas-*.json"))) == 1
+
+        # A cache hit must not parse any YAML
+        async def fail_load(*args, **kwargs):
+            raise AssertionError("schemas should come from the cache")
+
+        with monkeypatch.context() as patched:
+            patched.setattr(FileSchemaLoader, "load_schemas", fail_load)
+            loader = FileSchemaLoader(str(temp_schema_dir))
+            assert await loader.load_schemas_cached(cache_dir) == expected
+            assert loader.last_loaded is not None
+
+        # Adding a schema changes the signature and forces a reload
+        new_entity_dir = temp_schema_dir / "new_entity"
+        new_entity_dir.mkdir()
+        with (new_entity_dir / "1.0.0.yaml").open("w") as f:
+            yaml.dump(
+                {
+                    "entity_type": "new_entity",
+                    "schema_version": "1.0.0",
+                    "extends": "base_internal",
+                    "dgraph_type": "NewEntity",
+                },
+                f,
+            )
+
+        schemas = await FileSchemaLoader(str(temp_schema_dir)).load_schemas_cached(
+            cache_dir
+        )
+        assert "new_entity" in schemas
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "contents",
+        [b"", b"\x80\x05not json", b"[]", b'{"base_schemas": {}}'],
+    )
+    async def test_load_schemas_cached_rebuilds_bad_cache(
+        self, temp_schema_dir, tmp_path, contents
+    ):
+        """Test that unreadable or malformed cache files are replaced."""
+        cache_dir = tmp_path / "cache"
+        expected = await FileSchemaLoader(str(temp_schema_dir)).load_schemas()
+        await FileSchemaLoader(str(temp_schema_dir)).load_schemas_cached(cache_dir)
+        (cache_file,) = cache_dir.glob("schemas-*.json")
+        cache_file.write_bytes(contents)
+
+        schemas = await FileSchemaLoader(str(temp_schema_dir)).load_schemas_cached(
+            cache_dir
+        )
+
+        assert schemas == expected
+        assert json.loads(cache_file.read_bytes())["entity_schemas"]
+
+    def test_schema_data_round_trips_dates(self, tmp_path):
+        """Test that YAML dates survive the JSON cache format."""
+        base_schemas = {"base": {"released": date(2024, 1, 2)}}
+        entity_schemas = {"repository": {"reviewed_at": datetime(2024, 1, 2, 3, 4, 5)}}
+        path = tmp_path / "schemas.json"
+        path.write_bytes(dump_schema_data(tmp_path, base_schemas, entity_schemas))
+
+        document = schema_loader._read_schema_data_file(path)
+
+        assert document["base_schemas"] == base_schemas
+        assert document["entity_schemas"] == entity_schemas
+
+    @pytest.mark.asyncio
+    async def test_load_schemas_cached_can_be_disabled(
+        self, temp_schema_dir, tmp_path, monkeypatch
+    ):
+        """Test that KG_NO_SCHEMA_CACHE skips the schema cache."""
+        cache_dir = tmp_path / "cache"
+        monkeypatch.setenv(NO_SCHEMA_CACHE_ENV, "1")
+
+        schemas = await FileSchemaLoader(str(temp_schema_dir)).load_schemas_cached(
+            cache_dir
+        )
+        assert schemas
+        assert not cache_dir.exists()
+
     @pytest.mark.asyncio
     async def test_inheritance_resolution(self, temp_schema_dir):
         """Test schema inheritance from base schemas."""
@@ -8,6 +8,7 @@ import pytest
 
 from kg.api.config import config
 from kg.storage import create_storage
+from kg.storage.models import HealthStatus
 
 
 @pytest.mark.asyncio
@@ -94,9 +95,9 @@ class TestStorageUpsertBehavior:
             entities = query_result.data.get("entities", [])
 
             # This is the key assertion that will FAIL initially
-            assert (
-                len(entities) == 1
-            ), f"Expected 1 entity, found {len(entities)} duplicates: {entities}"
+            assert len(entities) == 1, (
+                f"Expected 1 entity, found {len(entities)} duplicates: {entities}"
+            )
 
         finally:
             await storage.disconnect()
@@ -206,6 +207,55 @@ class TestStorageUpsertBehavior:
         finally:
             await storage.disconnect()
 
+    @pytest.mark.integration
+    async def test_bulk_apply_counts_creates_and_updates(self):
+        """Test that bulk_apply upserts in batches without creating duplicates."""
+        storage = create_storage(config.storage)
+        assert storage is not None
+
+        await storage.connect()
+
+        try:
+            health = await storage.health_check()
+            if health.status != HealthStatus.HEALTHY:
+                pytest.skip("Dgraph is not available")
+
+            import time
+
+            timestamp = str(int(time.time() * 1000))
+            entities = [
+                {
+                    "entity_type": "repository",
+                    "entity_id": f"test-bulk/repo-{i}-{timestamp}",
+                    "metadata": {
+                        "owners": ["test@example.com"],
+                        "git_repo_url": f"https://github.com/test/repo-{i}",
+                    },
+                    "system_metadata": {"namespace": "test-bulk"},
+                }
+                for i in range(3)
+            ]
+
+            # Batches smaller than the input exercise the chunking
+            result = await storage.bulk_apply(entities, batch_size=2)
+            assert (result.created_count, result.updated_count) == (3, 0)
+            result = await storage.bulk_apply(entities, batch_size=2)
+            assert (result.created_count, result.updated_count) == (0, 3)
+
+            query = f"""
+            {{
+                entities(func: eq(id, "{entities[0]["entity_id"]}")) {{
+                    uid
+                }}
+            }}
+            """
+            query_result = await storage.execute_query(query)
+            assert query_result.success
+            assert len(query_result.data.get("entities", [])) == 1
+
+        finally:
+            await storage.disconnect()
+
 
 @pytest.mark.asyncio
 class TestCurrentBugDocumentation:
@@ -427,6 +427,96 @@ class TestKnowledgeGraphValidator:
         assert result.is_valid is True
         assert len(result.errors) == 0
 
+    def test_validate_dict_skips_yaml_parsing(self, sample_schemas):
+        """Test validation of pre-parsed data entering at Layer 2."""
+        validator = KnowledgeGraphValidator(sample_schemas)
+
+        data = {
+            "namespace": "test",
+            "entity": {
+                "repository": [
+                    {
+                        "test-repo": {
+                            "owners": ["test@example.com"],
+                            "git_repo_url": "https://github.com/test/repo",
+                        }
+                    }
+                ]
+            },
+        }
+
+        result = validator.validate_dict(data)
+
+        assert result.is_valid is True
+        assert result.model is not None
+
+        # Structure errors are still reported without a YAML round-trip
+        result = validator.validate_dict({"entity": {"repository": []}})
+        assert result.is_valid is False
+        assert any(e.type == "missing_required_field" for e in result.errors)
+
+        # Empty documents are rejected like they are by validate_parsed()
+        result = validator.validate_dict(None)
+        assert result.is_valid is False
+        assert result.errors[0].type == "empty_yaml_content"
+
+    @pytest.mark.asyncio
+    async def test_validate_parsed_runs_reference_validation(self, sample_schemas):
+        """Test async validation of pre-parsed data including Layer 5."""
+        storage = Mock()
+        storage.entity_exists = AsyncMock(return_value=True)
+        validator = KnowledgeGraphValidator(sample_schemas, storage=storage)
+
+        data = {
+            "namespace": "test",
+            "entity": {
+                "repository": [
+                    {
+                        "test-repo": {
+                            "owners": ["test@example.com"],
+                            "git_repo_url": "https://github.com/test/repo",
+                        }
+                    }
+                ]
+            },
+        }
+
+        result = await validator.validate_parsed(data)
+
+        assert result.is_valid is True
+        assert result.model is not None
+
+        # Empty documents are rejected like they are by Layer 1
+        result = await validator.validate_parsed(None)
+        assert result.is_valid is False
+        assert result.errors[0].type == "empty_yaml_content"
+
+    @pytest.mark.asyncio
+    async def test_validate_parsed_stops_at_max_errors(self, sample_schemas):
+        """Test that validation stops once max_errors errors are collected."""
+        validator = KnowledgeGraphValidator(sample_schemas)
+
+        data = {
+            "namespace": "Invalid_Namespace",
+            "entity": {"unknown_entity": [{"test": {}}]},
+        }
+
+        result = await validator.validate_parsed(data)
+        assert result.error_count > 1
+        assert result.truncated is False
+
+        error_count = result.error_count
+
+        result = await validator.validate_parsed(data, max_errors=1)
+        assert result.is_valid is False
+        assert result.error_count == 1
+        assert result.truncated is True
+
+        # Hitting the limit exactly after every layer ran loses no errors
+        result = await validator.validate_parsed(data, max_errors=error_count)
+        assert result.error_count == error_count
+        assert result.truncated is False
+
     @pytest.mark.asyncio
     async def test_validator_info(self, sample_schemas):
         """Test validator information method."""